@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for pygrim.
+
+    python bench.py             # run all benchmarks
+    python bench.py memory      # run only the named benchmarks
+
+Each benchmark runs in a separate process.
+"""
+
+import sys
+import time
+
+def corpus_memory(intern=False):
+    """
+    Loads the full formula corpus (by executing the formula modules) and
+    reports the number of Expr objects, their size and the memory
+    allocated while loading.
+    """
+    import gc
+    import tracemalloc
+    import pygrim.formulas
+    from pygrim.expr import Expr, enable_interning
+    pygrim.formulas.use_snapshot = False
+    if intern:
+        enable_interning()
+    gc.collect()
+    before = sum(1 for obj in gc.get_objects() if type(obj) is Expr)
+    tracemalloc.start()
+    t0 = time.time()
+    pygrim.formulas.load_all()
+    t1 = time.time()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    nodes = [obj for obj in gc.get_objects() if type(obj) is Expr]
+    size = 0
+    for obj in nodes:
+        size += sys.getsizeof(obj)
+        if hasattr(obj, "__dict__"):
+            size += sys.getsizeof(obj.__dict__)
+    print("load time (traced):    %.3f s" % (t1 - t0))
+    print("Expr objects:          %i" % (len(nodes) - before))
+    print("bytes per Expr:        %.1f" % (size / float(len(nodes))))
+    print("Expr memory:           %.2f MB" % (size * (len(nodes) - before) / float(len(nodes)) / 1e6))
+    print("allocated (current):   %.2f MB" % (current / 1e6))
+    print("allocated (peak):      %.2f MB" % (peak / 1e6))
+
+def bench_memory():
+    corpus_memory()
+
+def bench_memory_interned():
+    corpus_memory(intern=True)
+
+def corpus_nodes():
+    """
+    Returns a list of all distinct nonatomic subexpressions of the
+    formulas in the corpus.
+    """
+    import pygrim.formulas
+    from pygrim.expr import all_entries
+    pygrim.formulas.load_all()
+    nodes = set()
+    def visit(expr):
+        if not expr.is_atom() and expr not in nodes:
+            nodes.add(expr)
+            for arg in expr.args():
+                visit(arg)
+    for entry in all_entries:
+        visit(entry)
+    return list(nodes)
+
+def bench_dispatch():
+    """
+    Time per node for finding the handler that Brain.simple calls,
+    comparing the table lookup with the hasattr/getattr lookup by name
+    that it replaces.
+    """
+    from pygrim.brain import Brain
+    from pygrim.expr import SYMBOL
+    nodes = corpus_nodes()
+    brain = Brain()
+    def by_name():
+        for expr in nodes:
+            head = expr.head()
+            if head is not None and head.is_symbol():
+                f = "simple_" + head._symbol
+                if hasattr(brain, f):
+                    getattr(brain, f)
+    def by_table():
+        dispatch = brain.simple_dispatch
+        for expr in nodes:
+            head = expr.head()
+            if head is not None and head._kind == SYMBOL:
+                dispatch.get(head._data)
+    for name, func in [("getattr", by_name), ("table", by_table)]:
+        t = min(timeit(func) for i in range(5))
+        print("%-8s %.1f ns per node (%i nodes)" % (name, t * 1e9 / len(nodes), len(nodes)))
+
+def corpus_constants():
+    """
+    Returns a list of the distinct nonatomic subexpressions of the
+    formulas of the entries without free variables.
+    """
+    import pygrim.formulas
+    from pygrim.expr import all_entries, Formula, Variables
+    pygrim.formulas.load_all()
+    exprs = {}
+    for entry in all_entries:
+        formula = entry.get_arg_with_head(Formula)
+        if formula is not None and entry.get_arg_with_head(Variables) is None:
+            for expr in formula.subexpressions():
+                if not expr.is_atom():
+                    exprs[expr] = None
+    return list(exprs)
+
+def bench_neval():
+    """
+    Number of nodes evaluated and time for evaluating the constant
+    expressions in the corpus to 50 digits, raising the precision of
+    the whole expression or only of the inaccurate subexpressions.
+    """
+    from pygrim.numeric import neval
+    exprs = corpus_constants()
+    results = {}
+    for adaptive in [False, True]:
+        stats = {"operations": 0}
+        values = results[adaptive] = []
+        t0 = time.perf_counter()
+        for expr in exprs:
+            try:
+                values.append(neval(expr, 50, as_arb=True, cache=None, adaptive=adaptive, stats=stats))
+            except (ValueError, NotImplementedError, ZeroDivisionError, AssertionError):
+                values.append(None)
+        t = time.perf_counter() - t0
+        print("%-12s %8i operations %8.3f s   (%i of %i expressions evaluated)" % (
+            ["whole", "adaptive"][adaptive], stats["operations"], t,
+            len([v for v in values if v is not None]), len(exprs)))
+    for v, w in zip(results[False], results[True]):
+        assert (v is None) == (w is None) and (v is None or v.overlaps(w))
+
+def bench_plan():
+    """
+    Time per evaluation of the two sides of the equations in the corpus
+    at several values of the variables, substituting the values and
+    calling neval, or evaluating a NumericPlan compiled once per formula
+    (for all formulas, and for those compiled without falling back to
+    ArbNumericalEvaluation for some subexpression).
+    """
+    import pygrim.formulas
+    from pygrim.expr import all_entries, Formula, Variables, Equal, Div, Add, Mul, ConstI
+    from pygrim.numeric import neval, numeric_plan
+    pygrim.formulas.load_all()
+    exprs = []
+    for entry in all_entries:
+        formula = entry.get_arg_with_head(Formula)
+        variables = entry.get_arg_with_head(Variables)
+        if formula is not None and variables is not None:
+            formula = formula.args()[0]
+            if formula.head() == Equal:
+                for side in formula.args():
+                    exprs.append((side, variables.args()))
+    points = [Div(1, 3), Div(7, 4), 2, 3, Add(Div(1, 2), Mul(Div(1, 3), ConstI))]
+    def substituted(exprs):
+        values = []
+        for expr, variables in exprs:
+            for point in points:
+                try:
+                    values.append(neval(expr.replace(dict((var, point) for var in variables), semantic=True),
+                        as_arb=True, cache=None, adaptive=False))
+                except Exception:
+                    values.append(None)
+        return values
+    def compiled(exprs):
+        values = []
+        for expr, variables in exprs:
+            plan = numeric_plan(expr, variables)
+            for point in points:
+                try:
+                    values.append(plan.neval([point] * len(variables), as_arb=True))
+                except Exception:
+                    values.append(None)
+        return values
+    full = [(expr, variables) for (expr, variables) in exprs
+        if None not in [func for (r, func, args) in numeric_plan(expr, variables).instructions]]
+    for title, subset in [("all formulas", exprs), ("fully compiled formulas", full)]:
+        print("%s (%i):" % (title, len(subset)))
+        results = []
+        for name, func in [("replace", substituted), ("plan", compiled)]:
+            t0 = time.perf_counter()
+            values = func(subset)
+            t = time.perf_counter() - t0
+            results.append(values)
+            print("    %-8s %8.1f us per evaluation   (%i of %i evaluated)" % (name, t * 1e6 / len(values),
+                len([v for v in values if v is not None]), len(values)))
+        for v, w in zip(*results):
+            assert v is None or w is None or v.overlaps(w)
+
+def bench_batch():
+    """
+    Time per point for evaluating an expression at many points to 10
+    digits, substituting the values and calling neval, with neval_batch
+    using Arb at every point, and with neval_batch using NumPy where the
+    double-precision result is trusted.
+    """
+    from pygrim.expr import Mul, Exp, Neg, Pow, Sin, Sub, Log, x
+    from pygrim.numeric import neval, neval_batch, as_complex, numpy_functions
+    if numpy_functions() is None:
+        print("NumPy is not available")
+    neval_batch(x, [x], [(1.0,)])
+    exprs = [Mul(Exp(Neg(Pow(x, 2))), Sin(Mul(3, x))), Sub(Exp(x), 1), Log(x)]
+    points = [(-2.0 + 4.0 * k / 999,) for k in range(1000)]
+    for expr in exprs:
+        print("%s:" % expr)
+        results = []
+        for name in ["replace", "arb", "numpy"]:
+            stats = {}
+            t0 = time.perf_counter()
+            if name == "replace":
+                values = []
+                for (v,) in points:
+                    try:
+                        values.append(as_complex(neval(expr.replace({x: v}), 10, as_arb=True, cache=None)))
+                    except (ValueError, NotImplementedError, ZeroDivisionError):
+                        values.append(None)
+            else:
+                values = neval_batch(expr, [x], points, 10, as_arb=(name == "arb"), stats=stats)
+                if name == "arb":
+                    values = [None if v is None else as_complex(v) for v in values]
+            t = time.perf_counter() - t0
+            results.append(values)
+            print("    %-8s %8.1f us per point   (%i numpy, %i arb)" % (name, t * 1e6 / len(points),
+                stats.get("numpy", 0), stats.get("arb", len(points))))
+        for v in results[1:]:
+            for a, b in zip(results[0], v):
+                assert (a is None) == (b is None) and (a is None or abs(a - b) <= 1e-9 * abs(a))
+
+def bench_constants():
+    """
+    Time for obtaining the value of each constant in the ConstantPool at
+    a precision below the highest one used so far, computing it or taking
+    it from the pool; and for evaluating a sum whose terms contain
+    constants (evaluated on the symbol stack, bypassing the enclosure
+    cache), with and without the pool.
+    """
+    from flint import ctx
+    from pygrim.expr import Sum, Div, Pow, Mul, Add, Pi, Sqrt, Log, Factorial, For, k
+    from pygrim.numeric import constant_functions, ConstantPool, neval
+    import pygrim.numeric
+    pool = ConstantPool()
+    for prec in [1000, 64, 333]:
+        ctx.prec = prec
+        for expr, func in constant_functions.items():
+            pool.get(expr)
+        print("prec %i:" % prec)
+        for expr, func in constant_functions.items():
+            t1 = min(timeit(lambda: [func() for i in range(1000)]) for j in range(3))
+            t2 = min(timeit(lambda: [pool.get(expr) for i in range(1000)]) for j in range(3))
+            print("    %-16s computed %8.2f us   pool %6.2f us" % (expr, t1 * 1e3, t2 * 1e3))
+    ctx.prec = 53
+    print(pool.stats())
+    expr = Sum(Div(Mul(Pow(Pi, k), Add(Sqrt(2), Log(2))), Factorial(k)), For(k, 0, 300))
+    class NoPool(object):
+        def get(self, expr):
+            func = constant_functions.get(expr)
+            return func() if func is not None else None
+    for name, constants in [("computed", NoPool()), ("pool", pygrim.numeric.constant_pool)]:
+        pygrim.numeric.ArbNumericalEvaluation.constants = constants
+        orig = pygrim.numeric.constant_pool
+        pygrim.numeric.constant_pool = constants
+        try:
+            for digits in [15, 300]:
+                t = min(timeit(lambda: neval(expr, digits, cache=None)) for j in range(3))
+                print("sum to %3i digits, %-8s %8.2f ms" % (digits, name, t * 1e3))
+        finally:
+            pygrim.numeric.constant_pool = orig
+            del pygrim.numeric.ArbNumericalEvaluation.constants
+
+def timeit(func):
+    t0 = time.perf_counter()
+    func()
+    return time.perf_counter() - t0
+
+benchmarks = [
+    ("memory", bench_memory),
+    ("memory_interned", bench_memory_interned),
+    ("dispatch", bench_dispatch),
+    ("neval", bench_neval),
+    ("plan", bench_plan),
+    ("batch", bench_batch),
+    ("constants", bench_constants),
+]
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--run":
+        dict(benchmarks)[sys.argv[2]]()
+        sys.exit(0)
+    import subprocess
+    names = sys.argv[1:]
+    for name, func in benchmarks:
+        if not names or name in names:
+            print("----------------------------------------------------------")
+            print(name)
+            print("----------------------------------------------------------")
+            sys.stdout.flush()
+            subprocess.check_call([sys.executable, __file__, "--run", name])
@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import sys
+
+# --jobs N: number of KaTeX worker processes and page writer processes
+jobs = 1
+if "--jobs" in sys.argv:
+    _i = sys.argv.index("--jobs")
+    jobs = int(sys.argv[_i+1])
+    del sys.argv[_i:_i+2]
+
 if len(sys.argv) > 1 and sys.argv[1] == "ids":
     import random
     prev, prev2 = "x", "y"
@@ -21,10 +29,23 @@ if len(sys.argv) > 1 and sys.argv[1] == "img":
     source_scripts.xray.plots("build/html/img")
     sys.exit(0)
 
+if len(sys.argv) > 1 and sys.argv[1] == "index":
+    import pygrim.formulas
+    pygrim.formulas.write_index()
+    print("Success!")
+    sys.exit(0)
+
+if len(sys.argv) > 1 and sys.argv[1] == "snapshot":
+    import pygrim.formulas
+    pygrim.formulas.write_snapshot()
+    print("Success!")
+    sys.exit(0)
+
 ordner_ = None
 if len(sys.argv) > 1 and sys.argv[1] == "ordner":
     import pygrim
     import pygrim.formulas
+    pygrim.formulas.load_all()
     import pickle
     import os
     print("Building Ordner...")
@@ -38,10 +59,15 @@ if len(sys.argv) > 1 and sys.argv[1] == "ordner":
     print("Success!")
     sys.exit(0)
 
+ordner_digest = None
 try:
     import pickle
+    import hashlib
     with open("build/ordner.pickle", "rb") as fp:
-        ordner_ = pickle.load(fp, encoding="utf-8")
+        data = fp.read()
+    ordner_digest = hashlib.sha1(data).hexdigest()
+    ordner_ = pickle.loads(data, encoding="utf-8")
+    del data
 except FileNotFoundError:
     print("Ordner database not found -- skipping ordner output")
 
@@ -51,6 +77,11 @@ except FileNotFoundError:
 from pygrim import *
 from pygrim.formulas import *
 
+load_all()
+
+if not index_is_current():
+    print("WARNING: pygrim/formulas/formula_index.py is out of date -- run 'python fungrim.py index'")
+
 topics_referencing_entry = {}
 entries_referencing_symbol = {}
 all_used_symbols = set()
@@ -102,27 +133,252 @@ copyfile("favicon.png", "build/html/favicon.png")
 copyfile("fungrim.svg", "build/html/fungrim.svg")
 
 
-import pickle
-katex_cache = {}
-
 import subprocess
+import json
+import atexit
+import hashlib
+
+def katex_subprocess(string, display=True):
+    # slow path: start a new node process for a single formula
+    return subprocess.check_output(["node", "katex.js",
+                                    {True:"display",False:"inline"}[display], string],
+                                   universal_newlines=True)
+
+class KatexWorker(object):
+    """
+    A node process running katex_server.js, which loads KaTeX once and
+    renders batches of (latex, display) pairs sent as JSON lines.
+    """
 
-try:
-    with open("build/katex_cache.pickle", "rb") as fp:
-        katex_cache = pickle.load(fp)
-except UnicodeDecodeError as e:
-    with open("build/katex_cache.pickle", "rb") as fp:
-        katex_cache = pickle.load(fp, encoding="utf-8")
-except (IOError, ValueError):
-    print("Unable to read katex_cache")
+    def __init__(self):
+        self.proc = subprocess.Popen(["node", "katex_server.js"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, universal_newlines=True, encoding="utf-8")
+        header = self.proc.stdout.readline()
+        if not header:
+            self.proc.wait()
+            raise OSError("katex_server.js exited during startup")
+        self.version = json.loads(header)["version"]
+
+    def send(self, items):
+        self.proc.stdin.write(json.dumps(items) + "\n")
+        self.proc.stdin.flush()
+
+    def receive(self):
+        line = self.proc.stdout.readline()
+        if not line:
+            raise OSError("katex_server.js exited unexpectedly")
+        # same trailing newline as the output of katex.js
+        return [html + "\n" for html in json.loads(line)]
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except (IOError, OSError):
+            pass
+        self.proc.wait()
+
+class KatexPool(object):
+    """
+    A pool of KaTeX workers, started on first use. If the workers cannot
+    be started (or die), falls back to katex_subprocess.
+    """
+
+    def __init__(self, num_workers=1, batch_size=256):
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.workers = None
+
+    def start(self):
+        if self.workers is None:
+            self.workers = []
+            try:
+                for i in range(self.num_workers):
+                    self.workers.append(KatexWorker())
+            except (OSError, ValueError) as e:
+                print("Unable to start KaTeX server (%s) -- falling back to one node process per formula" % e)
+                self.close()
+        return self.workers
+
+    def render(self, items):
+        """
+        Renders a list of (latex, display) pairs, returning a list of
+        HTML strings in the same order.
+        """
+        items = list(items)
+        results = []
+        workers = self.start()
+        if workers:
+            try:
+                step = self.batch_size * len(workers)
+                for start in range(0, len(items), step):
+                    chunk = items[start:start+step]
+                    chunks = [chunk[i:i+self.batch_size] for i in range(0, len(chunk), self.batch_size)]
+                    for worker, c in zip(workers, chunks):
+                        worker.send(c)
+                    for worker, c in zip(workers, chunks):
+                        results += worker.receive()
+            except (OSError, ValueError) as e:
+                print("KaTeX server failed (%s) -- falling back to one node process per formula" % e)
+                self.close()
+        for (string, display) in items[len(results):]:
+            results.append(katex_subprocess(string, display))
+        return results
+
+    def close(self):
+        if self.workers:
+            for worker in self.workers:
+                worker.close()
+        self.workers = []
+
+katex_pool = KatexPool(num_workers=jobs)
+atexit.register(katex_pool.close)
+
+def katex_version():
+    try:
+        return subprocess.check_output(["node", "-p", "require('katex').version"], universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+class KatexCache(object):
+    """
+    On-disk cache of rendered formulas, indexed by (latex, display) pairs.
+
+    Entries are stored under a hash of the LaTeX string, the display mode
+    and the KaTeX version, spread over 256 shard files, and are appended
+    to disk as soon as they are rendered. Keeps count of cache hits and
+    misses (for distinct formulas) and of which entries have been used,
+    so that stale entries can be removed with gc().
+    """
+
+    def __init__(self, path, version):
+        self.path = path
+        self.version = version
+        self.data = {}
+        self.files = {}
+        self.referenced = set()
+        self.deferred = None
+        self.hits = 0
+        self.misses = 0
+        if not os.path.exists(path):
+            os.makedirs(path)
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".jsonl"):
+                with open(os.path.join(path, name), encoding="utf-8") as fp:
+                    for line in fp:
+                        try:
+                            h, html = json.loads(line)
+                        except ValueError:
+                            # truncated by an interrupted build
+                            continue
+                        self.data[h] = html
+
+    def hash(self, key):
+        string, display = key
+        s = "%s\0%s\0%s" % (self.version, {True:"display",False:"inline"}[display], string)
+        return hashlib.sha1(s.encode("utf-8")).hexdigest()
+
+    def __contains__(self, key):
+        return self.hash(key) in self.data
+
+    def get(self, key):
+        h = self.hash(key)
+        html = self.data.get(h)
+        if h not in self.referenced:
+            self.referenced.add(h)
+            if html is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return html
+
+    def __setitem__(self, key, html):
+        h = self.hash(key)
+        self.referenced.add(h)
+        self.data[h] = html
+        if self.deferred is not None:
+            # in a page writer process; the parent stores the entry
+            self.deferred[key] = html
+            return
+        self.append(h, html)
+
+    def append(self, h, html):
+        shard = h[:2]
+        if shard not in self.files:
+            self.files[shard] = open(os.path.join(self.path, shard + ".jsonl"), "a", encoding="utf-8")
+        fp = self.files[shard]
+        fp.write(json.dumps([h, html]) + "\n")
+        fp.flush()
+
+    def import_pickle(self, path):
+        """
+        Adds the entries of the cache file written by earlier versions (a
+        pickled dict mapping (latex, display) pairs to HTML, assumed to have
+        been rendered with the current KaTeX version) and deletes the file.
+        Returns the number of imported entries.
+        """
+        import pickle
+        try:
+            with open(path, "rb") as fp:
+                try:
+                    old = pickle.load(fp)
+                except UnicodeDecodeError:
+                    fp.seek(0)
+                    old = pickle.load(fp, encoding="utf-8")
+        except FileNotFoundError:
+            return 0
+        except (IOError, ValueError, pickle.UnpicklingError, EOFError):
+            print("Unable to read %s" % path)
+            return 0
+        n = 0
+        for key, html in old.items():
+            h = self.hash(key)
+            if h not in self.data:
+                self.data[h] = html
+                self.append(h, html)
+                n += 1
+        self.close()
+        os.remove(path)
+        return n
+
+    def close(self):
+        for fp in self.files.values():
+            fp.close()
+        self.files = {}
+
+    def gc(self):
+        """
+        Rewrites the shard files, keeping only the entries that have been
+        looked up or added during this run. Returns the number of removed
+        entries.
+        """
+        self.close()
+        removed = len(self.data)
+        self.data = dict((h, html) for (h, html) in self.data.items() if h in self.referenced)
+        removed -= len(self.data)
+        shards = {}
+        for h in sorted(self.data):
+            shards.setdefault(h[:2], []).append(h)
+        for name in os.listdir(self.path):
+            if name.endswith(".jsonl") and name[:-6] not in shards:
+                os.remove(os.path.join(self.path, name))
+        for shard, hashes in shards.items():
+            filename = os.path.join(self.path, shard + ".jsonl")
+            with open(filename + ".tmp", "w", encoding="utf-8") as fp:
+                for h in hashes:
+                    fp.write(json.dumps([h, self.data[h]]) + "\n")
+            os.replace(filename + ".tmp", filename)
+        return removed
+
+katex_cache = KatexCache("build/katex_cache", katex_version())
+atexit.register(katex_cache.close)
+if os.path.exists("build/katex_cache.pickle"):
+    print("Imported %i formulas from build/katex_cache.pickle" % katex_cache.import_pickle("build/katex_cache.pickle"))
 
 def katex(string, display=True):
-    if (string, display) in katex_cache:
-        return katex_cache[(string, display)]
-    s = subprocess.check_output(["node", "katex.js",
-                                 {True:"display",False:"inline"}[display], string],
-                                universal_newlines=True)
-    katex_cache[(string, display)] = s
+    s = katex_cache.get((string, display))
+    if s is None:
+        s = katex_pool.render([(string, display)])[0]
+        katex_cache[(string, display)] = s
     return s
 
 katex_function.append(katex)
@@ -342,14 +598,58 @@ index_text = index_text.replace("%%NUMTOPICS%%", str(len(all_topics)))
 def write_definitions_table(fp, symbols, **kwargs):
     fp.write(Expr.definitions_table_html(symbols, **kwargs))
 
+def symbol_inputs(symbol):
+    load_symbol(symbol)
+    if symbol in descriptions:
+        return str(symbol) + " " + str(descriptions[symbol])
+    return str(symbol)
+
+entry_inputs_cache = {}
+
+def entry_inputs(id):
+    """
+    Returns a list of strings that determine the HTML of the given entry:
+    its source and the descriptions of the symbols in its definitions table.
+    """
+    if id not in entry_inputs_cache:
+        entry = entries_dict[id]
+        inputs = [str(entry)]
+        for symbol in entry.symbols(unique=True):
+            inputs.append(symbol_inputs(symbol))
+        entry_inputs_cache[id] = inputs
+    return entry_inputs_cache[id]
+
 class Webpage:
 
+    dry_run = False
+
     def start(self):
-        if not os.path.exists(os.path.dirname(self.filepath)):
-            os.makedirs(os.path.dirname(self.filepath))
-        self.fp = open(self.filepath, "w")
+        if self.dry_run:
+            self.fp = open(os.devnull, "w")
+        else:
+            if not os.path.exists(os.path.dirname(self.filepath)):
+                os.makedirs(os.path.dirname(self.filepath))
+            self.fp = open(self.filepath, "w")
         self.fp.write(html_start.replace("%%PAGETITLE%%", self.pagetitle))
 
+    def collect(self):
+        """
+        Generates the page without writing it, so that the KaTeX calls
+        made along the way can be recorded.
+        """
+        self.dry_run = True
+        try:
+            self.write()
+        finally:
+            self.dry_run = False
+
+    def inputs(self):
+        """
+        Returns a list of strings that determine the content of the page.
+        The page is only rewritten when these change (see page_hash).
+        """
+        raise NotImplementedError
+
     def entry(self, id, default_visible=False):
         html = entries_dict[id].entry_html(single=False, default_visible=default_visible)
         self.fp.write(html)
@@ -375,6 +675,145 @@ class FrontPage(Webpage):
         Webpage.start(self)
         self.fp.write(index_text)
 
+    def inputs(self):
+        return [index_text, str(len(described_symbols))] + entry_inputs("9ee8bc")
+
+    def topic_link(self, s, highlight=False):
+        if highlight:
+            self.fp.write("""<li><a href="topic/%s/">%s</a> <span style="color:orange;">&#x2605;</span></li>""" % (escape_title(s), s))
+        else:
+            self.fp.write("""<li><a href="topic/%s/">%s</a></li>""" % (escape_title(s), s))
+
+    def write(self):
+        self.start()
+        self.entry("9ee8bc")
+        self.fp.write("""
+<p style="margin: 1em; font-size:0.9em">
+The Fungrim website provides a permanent ID and URL for each entry, symbol or topic. 
+Click "Details" to show an expanded view of an entry, or click the ID (9ee8bc) to show the expanded view on its own page.
+All data in Fungrim is represented in semantic form designed to be usable by computer algebra software.
+</p>""")
+        self.section("Browse by topic")
+
+        self.fp.write("""<div class="topiclist"><ul>""")
+
+        self.fp.write("""<li><a href="topic/">All topics in alphabetical order</a></li>""")
+
+        self.fp.write("""<li>Fundamentals<ul>""")
+        self.topic_link("Symbolic expressions")
+        self.topic_link("Elementary logic and set theory")
+        self.topic_link("Numbers and infinities")
+        self.topic_link("Operators")
+        self.topic_link("Complex plane")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Constants<ul>""")
+        self.topic_link("Pi", highlight=True)
+        self.topic_link("Imaginary unit")
+        self.topic_link("Euler's constant")
+        self.topic_link("Golden ratio")
+        self.topic_link("Catalan's constant")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Elementary functions<ul>""")
+        self.topic_link("Complex parts")
+        self.topic_link("Exponential function")
+        self.topic_link("Natural logarithm")
+        self.topic_link("Square roots")
+        self.topic_link("Powers")
+        self.topic_link("Sine", highlight=True)
+        self.topic_link("Inverse tangent", highlight=True)
+        self.topic_link("Sinc function", highlight=True)
+        self.topic_link("Lambert W-function")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Combinatorial and integer functions<ul>""")
+        self.topic_link("Integer sequences")
+        self.topic_link("Greatest common divisor", highlight=True)
+        self.topic_link("Totient function")
+        self.topic_link("Factorials and binomial coefficients")
+        self.topic_link("Fibonacci numbers", highlight=True)
+        self.topic_link("Prime numbers")
+        self.topic_link("Partition function")
+        self.topic_link("Bernoulli numbers and polynomials")
+        self.topic_link("Stirling numbers")
+        self.topic_link("Bell numbers", highlight=True)
+        self.topic_link("Landau's function")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Gamma function<ul>""")
+        self.topic_link("Gamma function")
+        self.topic_link("Digamma function", highlight=True)
+        self.topic_link("Beta function")
+        self.topic_link("Barnes G-function", highlight=True)
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Hypergeometric functions<ul>""")
+        self.topic_link("Gauss hypergeometric function")
+        self.topic_link("Confluent hypergeometric functions")
+        self.topic_link("Error functions")
+        self.topic_link("Airy functions")
+        self.topic_link("Bessel functions")
+        self.topic_link("Coulomb wave functions")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Orthogonal polynomials<ul>""")
+        self.topic_link("Legendre polynomials")
+        self.topic_link("Chebyshev polynomials", highlight=True)
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Zeta and L-functions<ul>""")
+        self.topic_link("Riemann zeta function")
+        self.topic_link("Riemann hypothesis")
+        self.topic_link("Hurwitz zeta function")
+        self.topic_link("Stieltjes constants")
+        self.topic_link("Dirichlet characters")
+        self.topic_link("Dirichlet L-functions")
+        self.topic_link("Multiple zeta values")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Modular and elliptic functions<ul>""")
+        self.topic_link("Modular transformations")
+        self.topic_link("Jacobi theta functions", highlight=True)
+        self.topic_link("Dedekind eta function")
+        self.topic_link("Modular j-invariant")
+        self.topic_link("Modular lambda function", highlight=True)
+        self.topic_link("Eisenstein series", highlight=True)
+        self.topic_link("Weierstrass elliptic functions")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Elliptic integrals<ul>""")
+        self.topic_link("Arithmetic-geometric mean")
+        self.topic_link("Legendre elliptic integrals")
+        self.topic_link("Carlson symmetric elliptic integrals", highlight=True)
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Tables of sums, products, integrals...<ul>""")
+        self.topic_link("Definite integrals")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""<li>Numerical analysis<ul>""")
+        self.topic_link("General analytic functions")
+        self.topic_link("Gaussian quadrature")
+        self.fp.write("""</ul></li>""")
+
+        self.fp.write("""</ul></div>""")
+
+        self.fp.write("""<p style="margin:1em; text-align:center"><span style="color:orange;">&#x2605;</span> Recommended topic (relatively complete)</p>""")
+
+        self.section("Browse by symbol")
+        self.fp.write("""<ul>""")
+        self.fp.write("""<li><a href="definitions.html">Table of defined symbols</a> &nbsp;(%i total entries)</li>""" % len(described_symbols))
+        self.fp.write("""</ul>""")
+
+        self.section("Browse real numbers (Ordner)")
+        self.fp.write("""<ul>""")
+        self.fp.write("""<li><a href="ordner/">Ordner: index of real numbers</li>""")
+        self.fp.write("""</ul>""")
+
+
+        self.end()
+
 class EntryPage(Webpage):
 
     def __init__(self, id):
@@ -382,6 +821,9 @@ class EntryPage(Webpage):
         self.filepath = "build/html/entry/%s/index.html" % self.id
         self.pagetitle = "Entry %s - Fungrim: The Mathematical Functions Grimoire" % self.id
 
+    def inputs(self):
+        return entry_inputs(self.id) + topics_referencing_entry.get(self.id, [])
+
     def entry(self, id):
         html = entries_dict[id].entry_html(single=True)
         self.fp.write(html)
@@ -408,6 +850,18 @@ class TopicPage(Webpage):
         self.title = title
         self.pagetitle = title + " - Fungrim: The Mathematical Functions Grimoire"
 
+    def inputs(self):
+        topic = topics_dict[self.title]
+        inputs = [str(topic)]
+        for arg in topic.args():
+            if arg.head() is DefinitionsTable:
+                for symbol in arg.args():
+                    inputs.append(symbol_inputs(symbol))
+            if arg.head() is Entries:
+                for id in arg.args():
+                    inputs += entry_inputs(id._text)
+        return inputs
+
     def start(self):
         Webpage.start(self)
         self.fp.write("""<p style="text-align:center; font-size:85%; margin-top: 0.2em;em"><a href="../../">Fungrim home page</a></p>""")
@@ -461,6 +915,9 @@ class TopicIndexPage(Webpage):
         self.title = "All topics in alphabetical order"
         self.pagetitle = "All topics in alphabetical order"
 
+    def inputs(self):
+        return sorted(topic.title() for topic in all_topics)
+
     def start(self):
         Webpage.start(self)
         self.fp.write("""<p style="text-align:center; font-size:85%; margin-top: 0.2em;em"><a href="../">Fungrim home page</a></p>""")
@@ -483,6 +940,9 @@ class DefinitionsPage(Webpage):
         self.title = "All symbol definitions"
         self.pagetitle = "All symbol definitions"
 
+    def inputs(self):
+        return [symbol_inputs(symbol) for symbol in described_symbols]
+
     def start(self):
         Webpage.start(self)
         self.fp.write("""<p style="text-align:center"><a href="index.html">Fungrim home page</a></p>""")
@@ -500,6 +960,16 @@ class SymbolPage(Webpage):
         self.filepath = "build/html/symbol/%s/index.html" % self.symbol
         self.pagetitle = "Symbol %s - Fungrim: The Mathematical Functions Grimoire" % self.symbol
 
+    def inputs(self):
+        symbol = self.symbol
+        if symbol in domain_tables:
+            inputs = list(entry_inputs(domain_tables[symbol]))
+        else:
+            inputs = [symbol_inputs(symbol)]
+        inputs += sorted("%s %i" % item for item in topics_referencing_symbol.get(symbol, {}).items())
+        inputs += sorted(entries_referencing_symbol[symbol])
+        return inputs
+
     def content(self, symbol):
         if symbol in domain_tables:
             self.entry(domain_tables[symbol]) #, default_visible=True)
@@ -549,6 +1019,9 @@ class OrdnerMainPage(Webpage):
         self.title = "Ordner: index of real numbers"
         self.pagetitle = "Ordner: index of real numbers - Fungrim: The Mathematical Functions Grimoire"
 
+    def inputs(self):
+        return [ordner_digest]
+
     def start(self):
         Webpage.start(self)
         self.fp.write("""<p style="text-align:center; font-size:85%; margin-top: 0.2em;em"><a href="../">Fungrim home page</a></p>""")
@@ -641,6 +1114,9 @@ class OrdnerTablePage(Webpage):
         self.max_expressions = max_expressions
         self.max_entries = max_entries
 
+    def inputs(self):
+        return [ordner_digest, repr((self.title, self.num, self.sort, self.integers, self.between, self.max_expressions, self.max_entries))]
+
     def start(self):
         Webpage.start(self)
         self.fp.write("""<p style="text-align:center; font-size:85%; margin-top: 0.2em;em"><a href="../../">Fungrim home page</a></p>""")
@@ -698,24 +1174,22 @@ class OrdnerTablePage(Webpage):
         self.end()
 
 
+pages = []
+
 for entry in all_entries:
-    print("entry " + str(entry.id()))
-    EntryPage(entry.id()).write()
+    pages.append(("entry " + str(entry.id()), EntryPage(entry.id())))
 
 for topic in all_topics:
-    print("topic " + str(topic.title()))
-    TopicPage(topic.title()).write()
+    pages.append(("topic " + str(topic.title()), TopicPage(topic.title())))
 
 for symbol in all_used_symbols:
-    print("symbol " + str(symbol))
-    SymbolPage(symbol).write()
+    pages.append(("symbol " + str(symbol), SymbolPage(symbol)))
 
-TopicIndexPage().write()
-DefinitionsPage().write()
+pages.append(("topic index", TopicIndexPage()))
+pages.append(("definitions", DefinitionsPage()))
 
 if ordner_ is not None:
     ordner = ordner_  # the variable was overwritten; make this local...
-    print("writing ordner...")
     num = len(ordner.values_ordered)
     index_splits = []
     N = 1
@@ -736,164 +1210,186 @@ if ordner_ is not None:
     for i, val in enumerate(ordner.values_ordered):
         expressions = ordner.values_expressions[val]
         if len(expressions) > 4 or max(len(ordner.expressions_entries[expr]) for expr in expressions) > 10:
-            OrdnerTablePage(ordner, val, val, between=(i, i), max_expressions=10000, max_entries=1000).write()
+            pages.append(("ordner " + val, OrdnerTablePage(ordner, val, val, between=(i, i), max_expressions=10000, max_entries=1000)))
 
     for i, (a, b, s) in enumerate(index_splits):
         av = ordner.values_ordered[a]
         bv = ordner.values_ordered[b]
-        OrdnerTablePage(ordner, "Real numbers from %s" % av, "index%02i" % i, between=(a, b), index_splits=index_splits).write()
+        pages.append(("ordner index%02i" % i, OrdnerTablePage(ordner, "Real numbers from %s" % av, "index%02i" % i, between=(a, b), index_splits=index_splits)))
 
-    OrdnerTablePage(ordner, "Top 250 real numbers, excluding integers", "top250", num=250, sort="frequency", integers=False).write()
-    OrdnerTablePage(ordner, "Top 250 real numbers, including integers", "top250inclusive", num=250, sort="frequency", integers=True).write()
-    OrdnerTablePage(ordner, "Top 250 real numbers by number of expressions", "top250expr", num=250, sort="expressions", integers=True).write()
+    pages.append(("ordner top250", OrdnerTablePage(ordner, "Top 250 real numbers, excluding integers", "top250", num=250, sort="frequency", integers=False)))
+    pages.append(("ordner top250inclusive", OrdnerTablePage(ordner, "Top 250 real numbers, including integers", "top250inclusive", num=250, sort="frequency", integers=True)))
+    pages.append(("ordner top250expr", OrdnerTablePage(ordner, "Top 250 real numbers by number of expressions", "top250expr", num=250, sort="expressions", integers=True)))
 
-    OrdnerMainPage(ordner, index_splits).write()
+    pages.append(("ordner", OrdnerMainPage(ordner, index_splits)))
 
 
 #def index_link(symbol):
 #    s = """<a href="%s.html">%s</a> &nbsp; (%i entries)""" % described_symbols
 
-frontpage = FrontPage()
-frontpage.start()
-frontpage.entry("9ee8bc")
-frontpage.fp.write("""
-<p style="margin: 1em; font-size:0.9em">
-The Fungrim website provides a permanent ID and URL for each entry, symbol or topic. 
-Click "Details" to show an expanded view of an entry, or click the ID (9ee8bc) to show the expanded view on its own page.
-All data in Fungrim is represented in semantic form designed to be usable by computer algebra software.
-</p>""")
-frontpage.section("Browse by topic")
-
-def writetopic(s, highlight=False):
-    if highlight:
-        frontpage.fp.write("""<li><a href="topic/%s/">%s</a> <span style="color:orange;">&#x2605;</span></li>""" % (escape_title(s), s))
-    else:
-        frontpage.fp.write("""<li><a href="topic/%s/">%s</a></li>""" % (escape_title(s), s))
-
-frontpage.fp.write("""<div class="topiclist"><ul>""")
-
-frontpage.fp.write("""<li><a href="topic/">All topics in alphabetical order</a></li>""")
-
-frontpage.fp.write("""<li>Fundamentals<ul>""")
-writetopic("Symbolic expressions")
-writetopic("Elementary logic and set theory")
-writetopic("Numbers and infinities")
-writetopic("Operators")
-writetopic("Complex plane")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Constants<ul>""")
-writetopic("Pi", highlight=True)
-writetopic("Imaginary unit")
-writetopic("Euler's constant")
-writetopic("Golden ratio")
-writetopic("Catalan's constant")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Elementary functions<ul>""")
-writetopic("Complex parts")
-writetopic("Exponential function")
-writetopic("Natural logarithm")
-writetopic("Square roots")
-writetopic("Powers")
-writetopic("Sine", highlight=True)
-writetopic("Inverse tangent", highlight=True)
-writetopic("Sinc function", highlight=True)
-writetopic("Lambert W-function")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Combinatorial and integer functions<ul>""")
-writetopic("Integer sequences")
-writetopic("Greatest common divisor", highlight=True)
-writetopic("Totient function")
-writetopic("Factorials and binomial coefficients")
-writetopic("Fibonacci numbers", highlight=True)
-writetopic("Prime numbers")
-writetopic("Partition function")
-writetopic("Bernoulli numbers and polynomials")
-writetopic("Stirling numbers")
-writetopic("Bell numbers", highlight=True)
-writetopic("Landau's function")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Gamma function<ul>""")
-writetopic("Gamma function")
-writetopic("Digamma function", highlight=True)
-writetopic("Beta function")
-writetopic("Barnes G-function", highlight=True)
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Hypergeometric functions<ul>""")
-writetopic("Gauss hypergeometric function")
-writetopic("Confluent hypergeometric functions")
-writetopic("Error functions")
-writetopic("Airy functions")
-writetopic("Bessel functions")
-writetopic("Coulomb wave functions")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Orthogonal polynomials<ul>""")
-writetopic("Legendre polynomials")
-writetopic("Chebyshev polynomials", highlight=True)
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Zeta and L-functions<ul>""")
-writetopic("Riemann zeta function")
-writetopic("Riemann hypothesis")
-writetopic("Hurwitz zeta function")
-writetopic("Stieltjes constants")
-writetopic("Dirichlet characters")
-writetopic("Dirichlet L-functions")
-writetopic("Multiple zeta values")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Modular and elliptic functions<ul>""")
-writetopic("Modular transformations")
-writetopic("Jacobi theta functions", highlight=True)
-writetopic("Dedekind eta function")
-writetopic("Modular j-invariant")
-writetopic("Modular lambda function", highlight=True)
-writetopic("Eisenstein series", highlight=True)
-writetopic("Weierstrass elliptic functions")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Elliptic integrals<ul>""")
-writetopic("Arithmetic-geometric mean")
-writetopic("Legendre elliptic integrals")
-writetopic("Carlson symmetric elliptic integrals", highlight=True)
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Tables of sums, products, integrals...<ul>""")
-writetopic("Definite integrals")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""<li>Numerical analysis<ul>""")
-writetopic("General analytic functions")
-writetopic("Gaussian quadrature")
-frontpage.fp.write("""</ul></li>""")
-
-frontpage.fp.write("""</ul></div>""")
-
-frontpage.fp.write("""<p style="margin:1em; text-align:center"><span style="color:orange;">&#x2605;</span> Recommended topic (relatively complete)</p>""")
-
-frontpage.section("Browse by symbol")
-frontpage.fp.write("""<ul>""")
-frontpage.fp.write("""<li><a href="definitions.html">Table of defined symbols</a> &nbsp;(%i total entries)</li>""" % len(described_symbols))
-frontpage.fp.write("""</ul>""")
-
-frontpage.section("Browse real numbers (Ordner)")
-frontpage.fp.write("""<ul>""")
-frontpage.fp.write("""<li><a href="ordner/">Ordner: index of real numbers</li>""")
-frontpage.fp.write("""</ul>""")
-
-
-frontpage.end()
+pages.append(("front page", FrontPage()))
+
+def code_version():
+    """
+    Hash of the code that generates the HTML and of the KaTeX version;
+    when any of these change, every page is rebuilt.
+    """
+    h = hashlib.sha1(katex_cache.version.encode("utf-8"))
+    for path in ["fungrim.py", "pygrim/expr.py", "pygrim/latex.py", "pygrim/ordner.py"]:
+        with open(path, "rb") as fp:
+            h.update(fp.read())
+    return h.hexdigest()
+
+def page_hash(page, version):
+    h = hashlib.sha1(version.encode("utf-8"))
+    for s in page.inputs():
+        h.update(s.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+class Manifest(object):
+    """
+    Maps the path of every generated page to a hash of its inputs,
+    stored in build/manifest.json. Only pages whose hash differs from
+    the previous build (or which are missing) need to be rewritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path) as fp:
+                self.old = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            self.old = {}
+        self.new = {}
+
+    def dirty(self, pages):
+        version = code_version()
+        dirty = []
+        for label, page in pages:
+            h = page_hash(page, version)
+            self.new[page.filepath] = h
+            if self.old.get(page.filepath) != h or not os.path.exists(page.filepath):
+                dirty.append((label, page))
+        return dirty
+
+    def remove_stale(self):
+        """
+        Deletes pages from the previous build that are no longer generated
+        (for example, pages of removed entries). Returns the number of pages
+        deleted.
+        """
+        count = 0
+        for filepath in self.old:
+            if filepath not in self.new and os.path.exists(filepath):
+                os.remove(filepath)
+                try:
+                    os.rmdir(os.path.dirname(filepath))
+                except OSError:
+                    pass
+                count += 1
+        return count
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as fp:
+            json.dump(self.new, fp, sort_keys=True, indent=0)
+        os.replace(tmp, self.path)
+
+manifest = Manifest("build/manifest.json")
+dirty_pages = manifest.dirty(pages)
+print("%i of %i pages changed" % (len(dirty_pages), len(pages)))
+
+def prerender(pages):
+    """
+    First build phase: generate all pages without writing them, collecting
+    the (latex, display) pairs that are not in katex_cache, and render
+    them in bulk with the KaTeX worker pool.
+    """
+    needed = set()
+
+    def katex_collect(string, display=True):
+        if katex_cache.get((string, display)) is None:
+            needed.add((string, display))
+        return ""
+
+    print("Collecting formulas...")
+    katex_function[0] = katex_collect
+    try:
+        for label, page in pages:
+            page.collect()
+    finally:
+        katex_function[0] = katex
+
+    needed = sorted(needed)
+    if needed:
+        print("Rendering %i formulas with %i KaTeX workers..." % (len(needed), katex_pool.num_workers))
+        # store each chunk as soon as it is done
+        for i in range(0, len(needed), 1000):
+            chunk = needed[i:i+1000]
+            for key, html in zip(chunk, katex_pool.render(chunk)):
+                katex_cache[key] = html
+
+if len(sys.argv) > 1 and sys.argv[1] == "katexgc":
+    # every page must be visited to know which formulas are in use
+    prerender(pages)
+else:
+    prerender(dirty_pages)
+
+if len(sys.argv) > 1 and sys.argv[1] == "katexgc":
+    print("Removed %i unused entries from the KaTeX cache" % katex_cache.gc())
+    sys.exit(0)
 
+def init_page_writer():
+    # the KaTeX processes and cache files belong to the parent process
+    katex_pool.workers = None
+    katex_pool.num_workers = 1
+    katex_cache.files = {}
+    katex_cache.deferred = {}
+
+def write_pages(indices):
+    """
+    Writes the pages with the given indices in a page writer process.
+    Returns the labels of the pages and the new KaTeX cache entries,
+    which the parent process merges.
+    """
+    labels = []
+    for i in indices:
+        label, page = dirty_pages[i]
+        labels.append(label)
+        page.write()
+    new = list(katex_cache.deferred.items())
+    katex_cache.deferred.clear()
+    return labels, new
+
+if jobs > 1:
+    # the workers are forked, so they share the page list, entries_dict,
+    # topics_referencing_entry, entries_referencing_symbol etc. with the
+    # parent process
+    import multiprocessing
+    step = max(1, len(dirty_pages) // (jobs * 16))
+    chunks = [range(i, min(i + step, len(dirty_pages))) for i in range(0, len(dirty_pages), step)]
+    pool = multiprocessing.get_context("fork").Pool(jobs, initializer=init_page_writer)
+    try:
+        for labels, new in pool.imap_unordered(write_pages, chunks):
+            for label in labels:
+                print(label)
+            for key, html in new:
+                if key not in katex_cache:
+                    katex_cache[key] = html
+    finally:
+        pool.close()
+        pool.join()
+else:
+    for label, page in dirty_pages:
+        print(label)
+        page.write()
+
+removed = manifest.remove_stale()
+if removed:
+    print("Removed %i stale pages" % removed)
+manifest.save()
+
+print("KaTeX cache: %i hits, %i misses" % (katex_cache.hits, katex_cache.misses))
 print("The grimoire was built successfully!")
 
-try:
-    with open("build/katex_cache.pickle", "wb") as fp:
-        pickle.dump(katex_cache, fp, protocol=pickle.HIGHEST_PROTOCOL)
-except IOError:
-    print("Error writing katex_cache")
-
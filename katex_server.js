@@ -0,0 +1,23 @@
+const katex = require('katex');
+const readline = require('readline');
+
+// Long-running KaTeX renderer used by fungrim.py.
+//
+// On startup, writes one JSON line {"version": ...}. After that, each line
+// read from stdin is a JSON array of [latex, display] pairs, and the reply
+// is a single JSON line with an array of rendered HTML strings.
+
+process.stdout.write(JSON.stringify({version: katex.version}) + '\n');
+
+var rl = readline.createInterface({input: process.stdin, terminal: false});
+
+rl.on('line', function(line) {
+    var requests = JSON.parse(line);
+    var results = requests.map(function(req) {
+        return katex.renderToString(req[0], {
+            throwOnError: false,
+            displayMode: req[1],
+        });
+    });
+    process.stdout.write(JSON.stringify(results) + '\n');
+});
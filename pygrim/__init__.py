@@ -2,6 +2,7 @@
 
 from .expr import *
 from .brain import *
+from .budget import Budget, BudgetExhausted
 
 # this should maybe not be exported, but it's currently
 # useful for development
@@ -18,30 +19,29 @@ def fungrim_entry(id):
 
 def test_fungrim_entry(id, num=100):
     from .formulas import entries_dict
+    from .verify import formula_parts
     entry = entries_dict[id]
-    formula = entry.get_arg_with_head(Formula)
-    if formula is None:
+    parts = formula_parts(entry)
+    if parts is None:
         print("no Formula() in entry")
         return
-    formula = formula.args()[0]
+    formula, variables, assumptions = parts
     print("Formula: ", formula)
-    variables = entry.get_arg_with_head(Variables)
-    if variables is None:
-        variables = []
-    else:
-        variables = variables.args()
-    assumptions = entry.get_arg_with_head(Assumptions)
-    if assumptions is None:
-        assumptions = True_
-    else:
-        # todo: multiple args to Assumptions()
-        assumptions = assumptions.args()[0]
     print("Variables: ", variables)
     print("Assumptions: ", assumptions)
     return formula.test(variables, assumptions, num=num)
 
-def test_fungrim(nstart=0, nend=10**9, num=100, filter=None):
+def test_fungrim(nstart=0, nend=10**9, num=100, filter=None, results=None, force=False):
+    # see pygrim.verify for a parallel version with timeouts
+    # with results (a JSONL file, see pygrim.verify.ResultStore), entries
+    # are tested quietly and the results are stored; entries with a stored
+    # result for the current formula and code are skipped unless force=True
     from .formulas import entries_dict
+    if results is not None:
+        from .verify import ResultStore, entry_hash, formula_parts, verify_entry, report
+        store = ResultStore(results)
+        previous = dict(store.by_id)
+        records = []
     effective = 0
     ineffective = 0
     truly_effective = 0
@@ -53,7 +53,21 @@ def test_fungrim(nstart=0, nend=10**9, num=100, filter=None):
                     continue
             print("-------------------------------------------------------------------")
             print(eid, n, len(entries_dict))
-            info = test_fungrim_entry(eid, num)
+            if results is not None:
+                h = entry_hash(entry)
+                record = None if force else store.lookup(eid, h)
+                if record is None:
+                    record = dict(id=eid, hash=h, **verify_entry(entry, num))
+                    store.add(record)
+                    records.append(record)
+                else:
+                    print("(stored result)")
+                print(record["status"], "(%i True, %i Unknown, %i False)" % (record["True"], record["Unknown"], record["False"]), "%.2f s" % record["time"])
+                info = None
+                if formula_parts(entry) is not None and record["status"] in ("ok", "false"):
+                    info = record
+            else:
+                info = test_fungrim_entry(eid, num)
             if info is not None:
                 if info["Total"] > 0:
                     effective += 1
@@ -62,6 +76,8 @@ def test_fungrim(nstart=0, nend=10**9, num=100, filter=None):
                 if info["True"] > 0:
                     truly_effective += 1
     print("Tested", effective, "formulas and", truly_effective, "truly effective; unable to satisfy assumptions for", ineffective, "formulas")
+    if results is not None:
+        report(previous, records)
 
 def test():
     import doctest
@@ -83,4 +99,47 @@ def test():
     print("----------------------------------------------------------")
     doctest.testmod(brain, verbose=True, raise_on_error=True, optionflags=doctest.ELLIPSIS)
     TestBrain().run()
+    print("simplification cache:", brain.simplification_cache.stats())
+
+    print("----------------------------------------------------------")
+    print("numeric")
+    print("----------------------------------------------------------")
+    from . import numeric
+    doctest.testmod(numeric, verbose=True, raise_on_error=True, optionflags=doctest.ELLIPSIS)
+    numeric.TestNumeric().run()
+    print("enclosure cache:", numeric.enclosure_cache.stats())
+    print("constant pool:", numeric.constant_pool.stats())
+
+    print("----------------------------------------------------------")
+    print("budget")
+    print("----------------------------------------------------------")
+    from . import budget
+    doctest.testmod(budget, verbose=True, raise_on_error=True, optionflags=doctest.ELLIPSIS)
+
+    print("----------------------------------------------------------")
+    print("snapshot")
+    print("----------------------------------------------------------")
+    from . import snapshot
+    doctest.testmod(snapshot, verbose=True, raise_on_error=True, optionflags=doctest.ELLIPSIS)
+    snapshot.TestSnapshot().run()
 
+    print("----------------------------------------------------------")
+    print("formulas")
+    print("----------------------------------------------------------")
+    from . import formulas
+    assert formulas.index_is_current(), "formula_index.py is out of date (run python fungrim.py index)"
+    formulas.TestFormulas().run()
+
+    print("----------------------------------------------------------")
+    print("rules")
+    print("----------------------------------------------------------")
+    from . import rules
+    doctest.testmod(rules, verbose=True, raise_on_error=True, optionflags=doctest.ELLIPSIS)
+    rules.TestRules().run()
+
+    print("----------------------------------------------------------")
+    print("verify")
+    print("----------------------------------------------------------")
+    from . import verify
+    doctest.testmod(verify, verbose=True, raise_on_error=True, optionflags=doctest.ELLIPSIS)
+    verify.TestVerify().run()
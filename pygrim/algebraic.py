@@ -1,6 +1,8 @@
 from flint import ctx, arb, acb, fmpz, fmpq, fmpz_poly, fmpq_poly, fmpq_series, fmpz_mat, fmpq_mat
 import operator
 
+from .budget import check_budget
+
 _fmpz_poly_x = fmpq_poly([0,1])
 
 # algorithm borrowed from sage
@@ -33,6 +35,7 @@ def composed_op(P1, P2, operation):
             c = fmpq(1)
             a1, a2 = [NP1[0]], [NP2[0]]
             for j in range(1, cap):
+                check_budget()
                 c *= j
                 a1.append(NP1[j] / c)
                 a2.append(NP2[j] / c)
@@ -42,6 +45,7 @@ def composed_op(P1, P2, operation):
             c = fmpq(-1)
             a3 = [fmpq(0)]
             for j in range(1, cap):
+                check_budget()
                 a3.append(NP3E[j] * c)
                 c *= j
             NP = fmpq_series(a3)
@@ -830,6 +834,7 @@ class alg(object):
         check_degree_limit(F.degree() * G.degree())
         check_bits_limit(F.height_bits() + G.height_bits())
         H = composed_op(F, G, operation)
+        check_budget()
         # print("begin factoring", H.degree())
         c, factors = H.factor()
         # print("end factoring")
@@ -1,6 +1,9 @@
 from .expr import *
 
 import contextlib
+import os
+from .budget import effective_budget
+from collections import OrderedDict
 from itertools import chain, zip_longest
 import itertools
 
@@ -325,11 +328,419 @@ def infer_domain(inferences, x, dom):
                 inferences.add(Greater(v, x))
 
 
+class SimplificationCache(object):
+    """
+    Bounded (least recently used) cache of simplification results, shared
+    by all Brain instances. Keys are pairs (context, key) where the context
+    identifies the Brain class, free variables and assumptions in effect
+    (see Brain.cache_context), so that brains with equal assumptions,
+    including the temporary states entered by assuming(), share results.
+
+        >>> cache = SimplificationCache(maxsize=2)
+        >>> cache[1, x] = y
+        >>> (1, x) in cache, (1, z) in cache
+        (True, False)
+        >>> cache[1, x]
+        y
+        >>> cache[1, y] = x; cache[1, z] = x
+        >>> (1, x) in cache
+        False
+        >>> cache.stats()
+        {'hits': 1, 'misses': 2, 'hit_rate': 0.3333333333333333, 'evictions': 1, 'size': 2, 'maxsize': 2}
+
+    """
+
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        if key in self.data:
+            self.data.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.data)
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate(),
+            "evictions": self.evictions, "size": len(self.data), "maxsize": self.maxsize}
+
+    @staticmethod
+    def code_version():
+        """
+        Hash of the pygrim source files; saved caches are discarded
+        when the code (or a formula) changes.
+        """
+        import hashlib
+        h = hashlib.sha1()
+        root = os.path.dirname(os.path.abspath(__file__))
+        for directory, dirnames, filenames in sorted(os.walk(root)):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(".py"):
+                    with open(os.path.join(directory, name), "rb") as fp:
+                        h.update(fp.read())
+        return h.hexdigest()
+
+    def save(self, path):
+        """
+        Writes the cached simplifications of expressions to a file.
+        Other entries (such as algebraic values) are not saved.
+        """
+        import pickle
+        items = [(key, value) for (key, value) in self.data.items()
+            if isinstance(key[1], Expr) and isinstance(value, Expr)]
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fp:
+            pickle.dump((self.code_version(), items), fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        """
+        Adds the entries saved in a file. Returns False if the file
+        does not exist or was written by a different version of the code.
+        """
+        import pickle
+        try:
+            with open(path, "rb") as fp:
+                version, items = pickle.load(fp)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return False
+        if version != self.code_version():
+            return False
+        for key, value in items:
+            if key not in self.data:
+                self[key] = value
+        return True
+
+    def persist(self, path):
+        """
+        Loads the cache from path (if possible) and saves it there
+        when the interpreter exits.
+        """
+        import atexit
+        self.load(path)
+        atexit.register(self.save, path)
+
+# set the environment variable PYGRIM_SIMPLE_CACHE to a file name to keep
+# the cache between runs (e.g. of the test suite)
+simplification_cache = SimplificationCache()
+
+if os.environ.get("PYGRIM_SIMPLE_CACHE"):
+    simplification_cache.persist(os.environ["PYGRIM_SIMPLE_CACHE"])
+
+class SimpleCacheView(object):
+    """
+    The simple_cache of a Brain: the part of a SimplificationCache for
+    one context. Entries set to None (marking expressions currently being
+    simplified, or failed evaluations) are only stored locally, as are all
+    entries once the budget of the brain (see pygrim.budget), or without
+    one the current budget, is exhausted.
+    """
+
+    def __init__(self, cache, context, budget=None):
+        self.cache = cache
+        self.context = context
+        self.budget = budget
+        self.local = {}
+
+    def __contains__(self, key):
+        return key in self.local or (self.context, key) in self.cache
+
+    def __getitem__(self, key):
+        if key in self.local:
+            return self.local[key]
+        return self.cache[self.context, key]
+
+    def peek(self, key):
+        """
+        Checks for key without updating the statistics of the cache.
+        """
+        return key in self.local or (self.context, key) in self.cache.data
+
+    def __setitem__(self, key, value):
+        # results computed after running out of budget may be
+        # incomplete, so they are not shared
+        budget = effective_budget(self.budget)
+        if value is None or (budget is not None and budget.expired()):
+            self.local[key] = value
+        else:
+            self.local.pop(key, None)
+            self.cache[self.context, key] = value
+
+class BrainProfiler(object):
+    """
+    Opt-in instrumentation of Brain instances, recording for simple(),
+    each simple_<name> handler and a few expensive methods (see methods)
+    the number of calls and the cumulative and self time, together with
+    cache hit rates and the maximal recursion depth of simple().
+
+    Attach a profiler with Brain(profiler=...) (or expr.simple(profiler=...)),
+    or temporarily with the attach() context manager. The profiler shadows
+    the methods with timing wrappers on the instance, so brains without a
+    profiler run the uninstrumented code.
+
+        >>> prof = BrainProfiler()
+        >>> b = Brain()
+        >>> with prof.attach(b):
+        ...     b.simple(Or(Not(True_), And(Not(False_), True_)))
+        ...
+        True_
+        >>> prof.calls["simple_Or"], prof.calls["simple_Not"], prof.max_depth
+        (1, 2, 4)
+        >>> print(prof.report())    # doctest: +ELLIPSIS
+        function ...  calls    total (s)     self (s)
+        ...
+        simple cache: 0 hits of 4 lookups (0.0%)
+        max depth of simple(): 4
+        >>> print(prof.folded())    # doctest: +ELLIPSIS
+        simple ...
+        simple;simple_Or ...
+        ...
+        simple;simple_Or;simple;simple_And;simple;simple_Not;simple ...
+
+    """
+
+    methods = ["evaluate_alg", "expand_multivariate", "real_enclosure", "complex_enclosure", "rewrite"]
+
+    def __init__(self):
+        import time
+        self.clock = time.perf_counter
+        self.calls = {}
+        self.total_time = {}
+        self.self_time = {}
+        self.stacks = {}
+        self.cache_hits = {"simple": 0, "arb": 0, "evaluate_alg": 0}
+        self.cache_lookups = {"simple": 0, "arb": 0, "evaluate_alg": 0}
+        self.depth = 0
+        self.max_depth = 0
+        self._stack = []
+        self._active = {}
+
+    def call(self, name, func, args):
+        """
+        Calls func(*args), timing it as name.
+        """
+        stack = self._stack
+        if stack:
+            path = stack[-1][0] + ";" + name
+        else:
+            path = name
+        frame = [path, 0.0]
+        stack.append(frame)
+        active = self._active
+        active[name] = active.get(name, 0) + 1
+        t0 = self.clock()
+        try:
+            return func(*args)
+        finally:
+            elapsed = self.clock() - t0
+            stack.pop()
+            active[name] -= 1
+            own = elapsed - frame[1]
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.self_time[name] = self.self_time.get(name, 0.0) + own
+            # count time in recursive calls once
+            if not active[name]:
+                self.total_time[name] = self.total_time.get(name, 0.0) + elapsed
+            self.stacks[path] = self.stacks.get(path, 0.0) + own
+            if stack:
+                stack[-1][1] += elapsed
+
+    def lookup(self, cache, hit):
+        self.cache_lookups[cache] += 1
+        if hit:
+            self.cache_hits[cache] += 1
+
+    def instrument(self, brain):
+        """
+        Attaches the profiler to brain, returning a function that detaches it.
+        """
+        def simple(expr):
+            if not (expr in brain.inferences or expr.is_atom()):
+                self.lookup("simple", brain.simple_cache.peek(expr))
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+            try:
+                return self.call("simple", original["simple"], (expr,))
+            finally:
+                self.depth -= 1
+        def wrap(name, func):
+            def wrapper(*args):
+                if name == "evaluate_alg":
+                    self.lookup("evaluate_alg", brain.simple_cache.peek(("evaluate_alg", args[0])))
+                elif name.endswith("_enclosure"):
+                    from .numeric import enclosure_cache
+                    self.lookup("arb", args[0] in brain.arb_failures or enclosure_cache.peek(args[0]))
+                return self.call(name, func, args)
+            return wrapper
+        def wrap_handler(name, func):
+            return lambda brain, *args: self.call(name, func, (brain,) + args)
+        original = {}
+        attributes = ["simple", "simple_dispatch"] + self.methods
+        saved = dict((name, brain.__dict__[name]) for name in attributes if name in brain.__dict__)
+        original["simple"] = brain.simple
+        brain.simple = simple
+        for name in self.methods:
+            if hasattr(brain, name):
+                setattr(brain, name, wrap(name, getattr(brain, name)))
+        brain.simple_dispatch = dict((key, wrap_handler("simple_" + key, func))
+            for (key, func) in brain.simple_dispatch.items())
+        def detach():
+            for name in attributes:
+                brain.__dict__.pop(name, None)
+            brain.__dict__.update(saved)
+        return detach
+
+    @contextlib.contextmanager
+    def attach(self, brain):
+        """
+        Context manager that attaches the profiler to brain.
+        """
+        detach = self.instrument(brain)
+        try:
+            yield self
+        finally:
+            detach()
+
+    def report(self, limit=30):
+        """
+        Returns a table of the functions with the most self time, followed
+        by cache hit rates and the maximal recursion depth.
+        """
+        names = sorted(self.calls, key=lambda name: -self.self_time[name])[:limit]
+        width = max([len(name) for name in names] + [8])
+        lines = ["%s  %8s %12s %12s" % ("function".ljust(width), "calls", "total (s)", "self (s)")]
+        for name in names:
+            lines.append("%s  %8i %12.6f %12.6f" % (name.ljust(width), self.calls[name],
+                self.total_time.get(name, 0.0), self.self_time[name]))
+        lines.append("")
+        for cache in sorted(self.cache_lookups):
+            n = self.cache_lookups[cache]
+            h = self.cache_hits[cache]
+            lines.append("%s cache: %i hits of %i lookups (%.1f%%)" % (cache, h, n, 100.0 * h / max(n, 1)))
+        lines.append("max depth of simple(): %i" % self.max_depth)
+        return "\n".join(lines)
+
+    def folded(self):
+        """
+        Returns the self time (in microseconds) of each call stack in the
+        folded format read by flamegraph.pl and compatible tools.
+        """
+        return "\n".join("%s %i" % (path, round(t * 1e6)) for (path, t) in sorted(self.stacks.items()))
+
+    def write_folded(self, path):
+        with open(path, "w") as fp:
+            fp.write(self.folded() + "\n")
+
 class Brain(object):
     """
     A "brain" for performing symbolic computation.
+
+    Results of simple() are stored in the process-wide shared_cache
+    (by default simplification_cache), keyed by the expression and
+    cache_context(). Set shared_cache to None to give each instance
+    a private cache.
+
+    simple() dispatches on the head of an expression through a table
+    built once per class from the methods simple_<name>; handlers for
+    further heads can be added with register_simple().
     """
 
+    shared_cache = simplification_cache
+
+    @classmethod
+    def simple_handlers(cls):
+        """
+        Returns the dispatch table of this class: a dict mapping the names
+        of head symbols to functions f(brain, *args).
+        """
+        table = cls.__dict__.get("_simple_handlers")
+        if table is None:
+            table = {}
+            cls._fill_simple_handlers(table)
+            cls._simple_handlers = table
+        return table
+
+    @classmethod
+    def _fill_simple_handlers(cls, table):
+        # methods and registered handlers of subclasses take precedence
+        for c in reversed(cls.__mro__):
+            for name, func in c.__dict__.items():
+                if name.startswith("simple_") and callable(func):
+                    table[name[7:]] = func
+            table.update(c.__dict__.get("_registered_simple", {}))
+
+    @classmethod
+    def register_simple(cls, head, func=None):
+        """
+        Registers func(brain, *args) as the handler in simple() for
+        expressions with the given head symbol, in this class and its
+        subclasses. Can be used as a decorator:
+
+            >>> class MyBrain(Brain):
+            ...     pass
+            ...
+            >>> @MyBrain.register_simple(Length)
+            ... def simple_Length(brain, x):
+            ...     if x.head() == Tuple:
+            ...         return Expr(len(x.args()))
+            ...     return Length(brain.simple(x))
+            ...
+            >>> MyBrain().simple(Length(Tuple(x, y)))
+            2
+            >>> Brain().simple(Length(Tuple(x, y)))
+            Length(Tuple(x, y))
+
+        """
+        if func is None:
+            def decorator(func):
+                cls.register_simple(head, func)
+                return func
+            return decorator
+        assert head.is_symbol()
+        if "_registered_simple" not in cls.__dict__:
+            cls._registered_simple = {}
+        cls._registered_simple[head._symbol] = func
+        # update the tables already built, in place (instances refer to them)
+        classes = [cls]
+        while classes:
+            c = classes.pop()
+            classes.extend(c.__subclasses__())
+            table = c.__dict__.get("_simple_handlers")
+            if table is not None:
+                table.clear()
+                c._fill_simple_handlers(table)
+
     def infer(self, thm):
         self.inferences.add(thm)
         if thm.head() == Element:
@@ -343,11 +754,13 @@ class Brain(object):
             x, dom = thm.args()
             infer_not_domain(self.inferences, x, dom)
 
-    def __init__(self, variables=(), assumptions=None, fungrim=False, penalty={}):
+    def __init__(self, variables=(), assumptions=None, fungrim=False, penalty={}, profiler=None, budget=None, timeout=None):
         """
         Input: a list of symbols representing free variables and
         assumptions involving the free variables, which may be used
-        in symbolic simplification.
+        in symbolic simplification. Optionally, a BrainProfiler
+        to attach, and a Budget (or a timeout in seconds) limiting
+        the work done by simple().
 
         >>> brain = Brain(variables=[a,b,c],
         ...     assumptions=And(Element(a, CC), Element(b, ZZ),
@@ -355,9 +768,15 @@ class Brain(object):
         >>>
 
         """
-        self.simple_cache = {}
-        self.arb_cache = {}
+        # expressions that could not be evaluated numerically (the values
+        # are cached in numeric.enclosure_cache)
+        self.arb_failures = set()
         self.penalty = penalty
+        self.simple_dispatch = self.simple_handlers()
+        if timeout is not None:
+            from .budget import Budget
+            budget = Budget(timeout=timeout)
+        self.budget = budget
 
         # Init computational types
         from flint import arb, acb, fmpz, fmpq, ctx
@@ -376,11 +795,26 @@ class Brain(object):
         else:
             self.assumptions = frozenset(assumptions.head_args_flattened(And))
 
+        cache = self.shared_cache
+        if cache is None:
+            cache = SimplificationCache(maxsize=None)
+        self.simple_cache = SimpleCacheView(cache, self.cache_context(), self.budget)
+
+        if profiler is not None:
+            profiler.instrument(self)
+
         # Simple inferences (mostly based on the domain)
         for asm in self.assumptions:
             # asm = asm.simple()
             self.infer(asm)
 
+    def cache_context(self):
+        """
+        The part of the state that simplification results depend on:
+        results are shared between brains with the same context.
+        """
+        return (type(self).__name__, self.variables, self.assumptions, frozenset(self.penalty.items()))
+
     @contextlib.contextmanager
     def assuming(self, assumptions):
         """
@@ -405,22 +839,22 @@ class Brain(object):
             variables = assumptions.free_variables()
             old_inferences = self.inferences
             old_variables = self.variables
+            old_assumptions = self.assumptions
             old_cache = self.simple_cache
-            old_arb_cache = self.arb_cache
             try:
+                assumptions = frozenset(assumptions.head_args_flattened(And))
                 self.inferences = old_inferences.copy()
                 self.variables = old_variables.union(variables)
-                self.simple_cache = {}
-                self.arb_cache = {}
-                assumptions = frozenset(assumptions.head_args_flattened(And))
+                self.assumptions = old_assumptions.union(assumptions)
+                self.simple_cache = SimpleCacheView(old_cache.cache, self.cache_context(), self.budget)
                 for asm in assumptions:
                     self.infer(asm)
                 yield
             finally:
                 self.inferences = old_inferences
                 self.variables = old_variables
+                self.assumptions = old_assumptions
                 self.simple_cache = old_cache
-                self.simple_arb_cache = old_arb_cache
 
     def __repr__(self):
         s = ""
@@ -430,7 +864,27 @@ class Brain(object):
             s += "  " + str(thm) + "\n"
         return s
 
-    # todo: cache is duplicated here and in numeric; also doesn't apply to subexpressions...Z
+    def out_of_budget(self):
+        """
+        Checks whether the budget of the brain, or without one the current
+        budget (set by a caller), is exhausted.
+        """
+        budget = effective_budget(self.budget)
+        return budget is not None and budget.expired()
+
+    def numerical_value(self, x):
+        """
+        Evaluates x numerically (as x.n(as_arb=True)) within the budget.
+        """
+        if self.budget is None:
+            return x.n(as_arb=True)
+        from .budget import get_budget, set_budget
+        orig_budget = get_budget()
+        try:
+            set_budget(self.budget)
+            return x.n(as_arb=True)
+        finally:
+            set_budget(orig_budget)
 
     def real_enclosure(self, x):
         """
@@ -439,16 +893,15 @@ class Brain(object):
         Returns None on failure.
         """
         res = None
+        if x in self.arb_failures:
+            return res
         try:
-            if x in self.arb_cache:
-                val = self.arb_cache[x]
-            else:
-                val = x.n(as_arb=True)
-                self.arb_cache[x] = val
+            val = self.numerical_value(x)
             if type(val) == self._arb:
                 res = val
         except (NotImplementedError, ValueError, ImportError):
-            self.arb_cache[x] = None
+            if not self.out_of_budget():
+                self.arb_failures.add(x)
         return res
 
     def complex_enclosure(self, x):
@@ -458,19 +911,18 @@ class Brain(object):
         Returns None on failure.
         """
         res = None
+        if x in self.arb_failures:
+            return res
         try:
-            if x in self.arb_cache:
-                val = self.arb_cache[x]
-            else:
-                val = x.n(as_arb=True)
-                self.arb_cache[x] = val
-            assert val is None or val.is_finite()
+            val = self.numerical_value(x)
+            assert val.is_finite()
             if type(val) == self._acb:
                 res = val
             elif type(val) == self._arb:
                 res = self._acb(val)
         except (NotImplementedError, ValueError, ImportError):
-            self.arb_cache[x] = None
+            if not self.out_of_budget():
+                self.arb_failures.add(x)
         return res
 
     def simple(self, expr):
@@ -490,16 +942,18 @@ class Brain(object):
                 return expr
             return v
 
+        if self.budget is not None and self.budget.charge():
+            return expr
+
         input_expr = expr
         self.simple_cache[input_expr] = None
 
         head = expr.head()
-        if head is not None and head.is_symbol():
-            s = head._symbol
-            f = "simple_" + s
-            if hasattr(self, f):
+        if head is not None and head._kind == SYMBOL:
+            handler = self.simple_dispatch.get(head._data)
+            if handler is not None:
                 args = expr.args()
-                expr2 = getattr(self, f)(*args)
+                expr2 = handler(self, *args)
                 expr = expr2
             else:
                 args = expr.args()
@@ -1575,6 +2029,9 @@ class Brain(object):
         return self.simple(x)
 
     def complexity(self, expr):
+        if not self.penalty:
+            # cached on the expression
+            return expr.complexity()
         if expr in self.penalty:
             return self.penalty[expr]
         if expr.is_integer():
@@ -2178,18 +2635,25 @@ class Brain(object):
         from .algebraic import alg_get_degree_limit, alg_set_degree_limit
         from .algebraic import alg_get_bits_limit, alg_set_bits_limit
         
+        from .budget import get_budget, set_budget
+        
         orig_degree = alg_get_degree_limit()
         orig_bits = alg_get_bits_limit()
+        orig_budget = get_budget()
 
         val = None
         try:
             alg_set_degree_limit(60)
             alg_set_bits_limit(100000)
+            # without a budget of its own, keep the one set by the caller
+            if self.budget is not None:
+                set_budget(self.budget)
             val = self._evaluate_alg(expr)
 
         finally:
             alg_set_degree_limit(orig_degree)
             alg_set_bits_limit(orig_bits)
+            set_budget(orig_budget)
             self.simple_cache[("evaluate_alg", expr)] = val
 
         return val
@@ -3645,7 +4109,11 @@ class Brain(object):
                                     term = expr.replace({var:i}, semantic=True)
                                     notinclude = self.simple(Not(include))
                                     terms.append(Cases(Tuple(term, include), Tuple(0, notinclude)))
-                        return self.simple(Add(*terms))
+                        result = self.simple(Add(*terms))
+                        # keep the Sum rather than a partially simplified expansion
+                        if self.out_of_budget():
+                            return Sum(*args)
+                        return result
                 # Possibly simplified if symbolic output
                 with self.assuming(cond):
                     expr = self.simple(expr)
@@ -3696,7 +4164,11 @@ class Brain(object):
                                     term = expr.replace({var:i}, semantic=True)
                                     notinclude = self.simple(Not(include))
                                     terms.append(Cases(Tuple(term, include), Tuple(0, notinclude)))
-                        return self.simple(Mul(*terms))
+                        result = self.simple(Mul(*terms))
+                        # keep the Product rather than a partially simplified expansion
+                        if self.out_of_budget():
+                            return Product(*args)
+                        return result
                 # Possibly simplified if symbolic output
                 with self.assuming(cond):
                     expr = self.simple(expr)
@@ -5804,7 +6276,7 @@ class Brain(object):
         assumptions_by_var = {}
         for var in variables:
             for a in assumptions:
-                if var in a.subexpressions():
+                if a.contains(var):
                     assumptions_by_var[var] = assumptions_by_var.get(var, [])
                     assumptions_by_var[var].append(a)
         base_sets = {var:some_everything for var in variables}
@@ -5862,72 +6334,32 @@ class Brain(object):
                     yield values
 
     def match(self, expr, rule, free_variables=[], assumptions=None):
+        """
+        Matches expr against the pattern rule with the given free variables,
+        returning a dict of values for the variables if the match succeeds
+        and the assumptions simplify to True_ with these values, and
+        otherwise None. The pattern and assumptions are compiled (see
+        pygrim.rules) on first use.
+        """
+        from .rules import compiled_rule
         if assumptions is None:
             assumptions = True_
-
-        match_values = {}
-
-        def match_recursive(expr, rule):
-            if rule in free_variables:
-                if rule in match_values:
-                    if expr != match_values[rule]:
-                        raise ValueError
-                else:
-                    match_values[rule] = expr
-                return
-            if expr == rule:
-                return
-            expr_head = expr.head()
-            rule_head = rule.head()
-            expr_args = expr.args()
-            rule_args = rule.args()
-            if expr_head != rule_head or expr_head is None or len(expr_args) != len(rule_args):
-                raise ValueError
-            for a, b in zip(expr_args, rule_args):
-                match_recursive(a, b)
-
-        try:
-            match_recursive(expr, rule)
-        except ValueError:
-            return None
-
-        #print("MATCH", rule, match_values)
-
         # todo: some_values search for matching assumptions if missing variables?
-
-        assumptions = assumptions.replace(match_values)
-        assumptions = self.simple(assumptions)
-
-        #print("ASSUMPTIONS", assumptions)
-
-        if assumptions == True_:
-            return match_values
-        else:
-            return None
+        return compiled_rule(rule, free_variables, assumptions).match(self, expr)
 
     def rewrite_fungrim(self, expr, id, recursive=True):
-        from .formulas import entries_dict
-        entry = entries_dict[id]
-        variables = entry.get_arg_with_head(Variables)
-        if variables is None:
-            variables = []
-        else:
-            variables = variables.args()
-        formula = entry.get_arg_with_head(Formula)
-        if formula is None:
-            raise ValueError("unsupported kind of entry for rewriting")
-        formula = formula.args()[0]
-        assumptions = entry.get_arg_with_head(Assumptions)
-        if assumptions is None:
-            assumptions = True_
-        else:
-            assumptions = assumptions.args()[0]
-        if formula is None or formula.head() != Equal or len(formula.args()) != 2:
-            raise ValueError("unsupported kind of entry for rewriting")
-        lhs, rhs = formula.args()
+        from .rules import fungrim_rule
+        return self.rewrite(expr, fungrim_rule(id), recursive)
+
+    def rewrite(self, expr, rule, recursive=True):
+        """
+        Applies the RewriteRule rule to expr (if recursive, also to
+        subexpressions in which expr does not match).
+        """
+        rhs = rule.rhs
 
         def match_local(expr):
-            match = self.match(expr, lhs, variables, assumptions)
+            match = rule.match(self, expr)
             if match is not None:
                 return rhs.replace(match)
             if expr.is_atom():
@@ -5939,7 +6371,7 @@ class Brain(object):
         if recursive:
             return match_local(expr)
         else:    
-            match = self.match(expr, lhs, variables, assumptions)
+            match = rule.match(self, expr)
             if match is not None:
                 return rhs.replace(match)
             return expr
@@ -5952,10 +6384,12 @@ class FungrimBrain(Brain):
         Brain.__init__(self, *args, **kwargs)
 
         # Init Fungrim patterns
+        from .rules import fungrim_rule_index
         self.expr_db = {}
-        self.match_db = {}
+        self.rules = fungrim_rule_index()
 
         from . import formulas
+        formulas.load_all()
         from .expr import all_entries
         for entry in all_entries:
             formula = entry.get_arg_with_head(Formula)
@@ -5981,16 +6415,7 @@ class FungrimBrain(Brain):
                     for arg in args:
                         if arg != best:
                             self.expr_db[arg] = best
-            # Nonconstant expression for matching
-            else:
-                content = formula.args()[0]
-                if content.head() == Equal and len(content.args()) == 2:
-                    eid = entry.id()
-                    lhs_head = content.args()[0].head()
-                    if lhs_head in self.match_db:
-                        self.match_db[lhs_head].add(eid)
-                    else:
-                        self.match_db[lhs_head] = set([eid])
+            # Nonconstant expressions for matching are in self.rules
 
     def simple(self, expr):
         """
@@ -6010,6 +6435,9 @@ class FungrimBrain(Brain):
                 return expr
             return v
 
+        if self.budget is not None and self.budget.charge():
+            return expr
+
         input_expr = expr
         self.simple_cache[input_expr] = None
 
@@ -6022,8 +6450,9 @@ class FungrimBrain(Brain):
 
             head = expr.head()
             expr = head(*(self.simple(arg) for arg in expr.args()))
-            if head in self.match_db:
-                exprs = set((self.rewrite_fungrim(expr, id, recursive=False), id) for id in self.match_db[head])
+            rules = self.rules.candidates(expr)
+            if rules:
+                exprs = set((self.rewrite(expr, rule, recursive=False), rule.id) for rule in rules)
                 #for e in exprs:
                 #    print(e, self.complexity(e[0]))
                 expr2, id = min(exprs, key=lambda v: self.complexity(v[0]))
@@ -6035,12 +6464,11 @@ class FungrimBrain(Brain):
             expr = fungrim_simplify(expr)
 
         head = expr.head()
-        if head is not None and head.is_symbol():
-            s = head._symbol
-            f = "simple_" + s
-            if hasattr(self, f):
+        if head is not None and head._kind == SYMBOL:
+            handler = self.simple_dispatch.get(head._data)
+            if handler is not None:
                 args = expr.args()
-                expr2 = getattr(self, f)(*args)
+                expr2 = handler(self, *args)
                 if self.expr_db and expr2 != expr:
                     expr2 = fungrim_simplify(expr2)
                 expr = expr2
@@ -6112,6 +6540,68 @@ class TestBrain(object):
         assert b.simple(Element(x, QQ)) == False_
         assert b.simple(NotElement(x, QQ)) == True_
 
+    def test_shared_cache(self):
+        import os, tempfile
+        cache = simplification_cache
+        e = And(Element(x, QQ), Element(x, RR))
+        Brain([x], Element(x, ZZ)).simple(e)
+        hits = cache.hits
+        assert Brain([x], Element(x, ZZ)).simple(e) == True_
+        assert cache.hits == hits + 1
+        b = Brain([x], Element(x, ZZ))
+        with b.assuming(Element(y, RR)):
+            assert b.simple(And(Element(y, CC), e)) == True_
+        hits = cache.hits
+        b = Brain([x, y], And(Element(x, ZZ), Element(y, RR)))
+        assert b.simple(And(Element(y, CC), e)) == True_
+        assert cache.hits == hits + 1
+        # different assumptions
+        assert Brain([x], Element(x, RR)).simple(e) == Element(x, QQ)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            cache.save(path)
+            cache2 = SimplificationCache()
+            assert cache2.load(path)
+            assert cache2.data[Brain([x], Element(x, ZZ)).cache_context(), e] == True_
+        finally:
+            os.remove(path)
+
+    def test_budget(self):
+        from .budget import Budget
+        cache = simplification_cache
+        e = And(Not(Equal(Pi, Pi)), Not(Not(Element(Pi, RR))))
+        b = Brain(budget=Budget(steps=1))
+        size = len(cache.data)
+        v = b.simple(e)
+        assert b.budget.exhausted
+        assert v != False_
+        assert len(cache.data) == size
+        assert e.simple(timeout=0) == e
+        assert e.simple(timeout=60) == False_
+        # a brain without a budget keeps the budget set by the caller
+        from .budget import BudgetExhausted, get_budget, set_budget
+        outer = Budget(timeout=0)
+        orig = get_budget()
+        try:
+            set_budget(outer)
+            try:
+                Brain().evaluate_alg(Add(Sqrt(2), Sqrt(3)))
+                assert 0
+            except BudgetExhausted:
+                pass
+            assert get_budget() is outer
+            # nor does it share results computed under the caller's budget
+            size = len(cache.data)
+            b = Brain()
+            assert b.simple(Less(Sqrt(2), Sqrt(3))) == Less(Sqrt(2), Sqrt(3))
+            b.real_enclosure(Sqrt(2))
+            assert len(cache.data) == size
+            assert not b.arb_failures
+        finally:
+            set_budget(orig)
+        assert Brain().simple(Less(Sqrt(2), Sqrt(3))) == True_
+
     def test_simple(self):
         b = Brain()
         assert b.simple(Element(Add(3, 5), ZZ)) == True_
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cooperative limits on the work done by symbolic simplification.
+
+A Budget limits the wall-clock time and/or the number of steps (calls of
+Brain.simple that are not answered from the cache). A Brain with a
+budget charges it in simple(); once the budget is exhausted, simple()
+returns its input unchanged and nothing more is stored in the shared
+simplification cache, so the result is correct but possibly less
+simplified (for a predicate, typically neither True_ nor False_).
+
+While a Brain evaluates algebraic or numerical values, its budget is
+made the current budget (as with the degree limit in pygrim.algebraic),
+and long-running loops there call check_budget(), which raises
+BudgetExhausted (a ValueError, like other evaluation failures).
+
+    >>> from pygrim.expr import And, Not, True_, False_
+    >>> from pygrim.brain import Brain
+    >>> b = Brain(budget=Budget(steps=2))
+    >>> b.simple(And(Not(False_), Not(Not(True_))))
+    Not(Not(True_))
+    >>> b.budget.exhausted
+    True
+"""
+
+import time
+
+class BudgetExhausted(ValueError):
+    pass
+
+class Budget(object):
+    """
+    Allows timeout seconds (from now) and/or the given number of steps.
+    """
+
+    def __init__(self, timeout=None, steps=None):
+        if timeout is None:
+            self.deadline = None
+        else:
+            self.deadline = time.monotonic() + timeout
+        self.steps = steps
+        self.exhausted = False
+
+    def __repr__(self):
+        return "Budget(deadline=%r, steps=%r, exhausted=%r)" % (self.deadline, self.steps, self.exhausted)
+
+    def expired(self):
+        """
+        Checks whether the budget is exhausted, without charging it.
+        """
+        if not self.exhausted and self.deadline is not None and time.monotonic() > self.deadline:
+            self.exhausted = True
+        return self.exhausted
+
+    def charge(self):
+        """
+        Charges one step, returning True if the budget is exhausted.
+        """
+        if self.steps is not None and not self.exhausted:
+            self.steps -= 1
+            if self.steps < 0:
+                self.exhausted = True
+        return self.expired()
+
+_budget = [None]
+
+def get_budget():
+    return _budget[0]
+
+def set_budget(budget):
+    _budget[0] = budget
+
+def effective_budget(budget):
+    """
+    Returns budget, or the current budget if budget is None: the budget
+    that limits code running on behalf of an object with the given budget.
+    """
+    if budget is None:
+        return _budget[0]
+    return budget
+
+def check_budget():
+    """
+    Raises BudgetExhausted if the current budget has run out.
+    """
+    budget = _budget[0]
+    if budget is not None and budget.expired():
+        raise BudgetExhausted("budget exhausted")
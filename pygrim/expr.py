@@ -1,11 +1,52 @@
 # -*- coding: utf-8 -*-
 
+import weakref
+
 int_types = (int, type(1<<128))
 
 katex_function = []
 
 int_cache = {}
 
+# the kinds of Expr nodes (Expr._kind)
+SYMBOL = 0
+INTEGER = 1
+TEXT = 2
+CALL = 3
+
+# Expr for interning, keyed by the argument tuple for a call and by
+# (kind, data) for an atom (the argument tuple is used directly to save
+# memory; it can never be equal to the key of an atom)
+intern_table = None
+
+def intern_key(expr):
+    if expr._kind == CALL:
+        return expr._data
+    return (expr._kind, expr._data)
+
+def enable_interning():
+    """
+    Makes Expr() return the same object for structurally equal
+    expressions, so that comparisons (and lookups in dicts keyed by
+    expressions) usually reduce to identity checks, and equal
+    subexpressions are only stored once. The table holds weak references,
+    so expressions that are no longer used are freed as usual.
+
+    Expressions created before interning was enabled are not interned
+    (except for the builtin symbols and variables), but still compare
+    equal to interned expressions.
+    """
+    global intern_table
+    if intern_table is None:
+        intern_table = weakref.WeakValueDictionary()
+        for obj in list(globals().values()):
+            if isinstance(obj, Expr):
+                intern_table.setdefault(intern_key(obj), obj)
+
+def disable_interning():
+    global intern_table
+    intern_table = None
+
 def escape_title(name):
     # paren = name.find("(")
     # if paren >= 0:
@@ -32,8 +73,16 @@ class Expr(object):
     Most arithmetic operators are overloaded to permit constructing
     expressions in natural syntax, but the == and != operators
     perform structural comparison.
+
+    Internally, an expression stores its kind (SYMBOL, INTEGER, TEXT or
+    CALL) in _kind and the corresponding payload (the symbol name, the
+    integer value, the text, or the tuple (f, a, b, ...)) in _data.
+    The properties _symbol, _integer, _text and _args give the payload
+    when the expression is of the respective kind, and None otherwise.
     """
 
+    __slots__ = ("_kind", "_data", "_hash", "_meta", "__weakref__")
+
     def __new__(self, arg=None, symbol_name=None, call=None):
         """
         Expr(expr) creates a copy of expr (this may actually return
@@ -49,21 +98,22 @@ class Expr(object):
             return arg
         self = object.__new__(Expr)
         self._hash = None
-        self._symbol = None
-        self._integer = None
-        self._text = None
-        self._args = None
+        self._meta = None
         if symbol_name is not None:
-            self._symbol = symbol_name
+            self._kind = SYMBOL
+            self._data = symbol_name
         elif isinstance(arg, str):
-            self._text = arg
+            self._kind = TEXT
+            self._data = arg
         elif isinstance(arg, int_types):
             if isinstance(arg, bool):
                 return [False_, True_][arg]
-            self._integer = int(arg)
+            self._kind = INTEGER
+            self._data = int(arg)
         elif call is not None:
-            self._args = tuple(Expr(obj) for obj in call)
-            assert len(self._args) >= 1
+            self._kind = CALL
+            self._data = tuple(Expr(obj) for obj in call)
+            assert len(self._data) >= 1
         elif isinstance(arg, list):
             return List(*(Expr(x) for x in arg))
         elif isinstance(arg, tuple):
@@ -122,44 +172,60 @@ class Expr(object):
             except ImportError:
                 pass
             raise ValueError("cannot create Expr from type %s", type(arg))
+        if intern_table is not None:
+            key = intern_key(self)
+            obj = intern_table.get(key)
+            if obj is not None:
+                return obj
+            intern_table[key] = self
         return self
 
+    def __reduce__(self):
+        if self._kind == SYMBOL:
+            return (_symbol_by_name, (self._data,))
+        if self._kind == CALL:
+            return (Expr, (None, None, self._data))
+        return (Expr, (self._data,))
+
+    @property
+    def _symbol(self):
+        if self._kind == SYMBOL:
+            return self._data
+        return None
+
+    @property
+    def _integer(self):
+        if self._kind == INTEGER:
+            return self._data
+        return None
+
+    @property
+    def _text(self):
+        if self._kind == TEXT:
+            return self._data
+        return None
+
+    @property
+    def _args(self):
+        if self._kind == CALL:
+            return self._data
+        return None
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if type(self) != type(other):
             return False
         if hash(self) != hash(other):
             return False
-        if self._args is not None:
-            if other._args is not None:
-                return self._args == other._args
-            return False
-        if self._symbol is not None:
-            if other._symbol is not None:
-                return self._symbol == other._symbol
-            return False
-        if self._integer is not None:
-            if other._integer is not None:
-                return self._integer == other._integer
-            return False
-        if self._text is not None:
-            if other._text is not None:
-                return self._text == other._text
-            return False
-        return False
+        return self._kind == other._kind and self._data == other._data
 
     def __ne__(self, other):
         return not (self == other)
 
     def __hash__(self):
         if self._hash is None:
-            if self._symbol is not None:
-                self._hash = hash(self._symbol)
-            elif self._integer is not None:
-                self._hash = hash(self._integer)
-            elif self._text is not None:
-                self._hash = hash(self._text)
-            else:
-                self._hash = hash(self._args)
+            self._hash = hash(self._data)
         return self._hash
 
     def __int__(self):
@@ -168,26 +234,26 @@ class Expr(object):
     def is_atom(self):
         """Returns True if self is an atom (symbol, integer or text),
         False otherwise."""
-        return self._args is None
+        return self._kind != CALL
 
     def is_symbol(self):
-        return self._symbol is not None
+        return self._kind == SYMBOL
 
     def is_integer(self):
-        return self._integer is not None
+        return self._kind == INTEGER
 
     def is_text(self):
-        return self._text is not None
+        return self._kind == TEXT
 
     def head(self):
-        if self._args is None:
+        if self._kind != CALL:
             return None
-        return self._args[0]
+        return self._data[0]
 
     def args(self):
-        if self._args is None:
+        if self._kind != CALL:
             return None
-        return self._args[1:]
+        return self._data[1:]
 
     def __call__(self, *args):
         return Expr(call=((self,) + args))
@@ -229,17 +295,18 @@ class Expr(object):
         return Pow(Expr(other), Expr(self))
 
     def str(self, level=0, **kwargs):
-        if self._symbol is not None:
-            s = str(self._symbol)
-        elif self._integer is not None:
-            s = str(self._integer)
-        elif self._text is not None:
-            s = self._text.replace('"', '\\"')
+        kind = self._kind
+        if kind == SYMBOL:
+            s = str(self._data)
+        elif kind == INTEGER:
+            s = str(self._data)
+        elif kind == TEXT:
+            s = self._data.replace('"', '\\"')
             return '"' + s + '"'
-        elif self._args is not None:
-            fstr = self._args[0].str(level, **kwargs)
-            argstrs = [arg.str(level+1, **kwargs) for arg in self._args[1:]]
-            if self._args[0] == Entry:
+        elif kind == CALL:
+            fstr = self._data[0].str(level, **kwargs)
+            argstrs = [arg.str(level+1, **kwargs) for arg in self._data[1:]]
+            if self._data[0] == Entry:
                 s = fstr + "(" + ",\n    ".join(argstrs) + ")"
             else:
                 s = fstr + "(" + ", ".join(argstrs) + ")"
@@ -270,16 +337,115 @@ class Expr(object):
         else:
             if unique:
                 seen = set()
-                for arg in self._args:
+                for arg in self._data:
                     for atom in arg.atoms():
                         if atom not in seen:
                             yield atom
                             seen.add(atom)
             else:
-                for arg in self._args:
+                for arg in self._data:
                     for atom in arg.atoms():
                         yield atom
 
+    def _metadata(self):
+        """
+        Returns the tuple (size, depth, symbols, heads, complexity) for
+        self. This is computed from the metadata of the children the first
+        time it is needed and then cached.
+        """
+        meta = self._meta
+        if meta is None:
+            kind = self._kind
+            if kind == CALL:
+                metas = [arg._metadata() for arg in self._data]
+                size = 1
+                depth = 0
+                complexity = 2 * sum(m[4] for m in metas) - metas[0][4] + 1
+                for m in metas:
+                    size += m[0]
+                    depth = max(depth, m[1])
+                symbols = _union([m[2] for m in metas])
+                heads = _union([m[3] for m in metas] + [frozenset([self._data[0]])])
+                meta = (size, depth + 1, symbols, heads, complexity)
+            elif kind == INTEGER:
+                v = self._data
+                meta = (1, 0, _empty_set, _empty_set, 1 + v.bit_length() + (v<0))
+            elif kind == SYMBOL:
+                meta = (1, 0, frozenset([self]), _empty_set, complexity_weights.get(self, 1000000))
+            else:
+                meta = (1, 0, _empty_set, _empty_set, 1000000)
+            self._meta = meta
+        return meta
+
+    def size(self):
+        """
+        Returns the number of nodes in self (the length of
+        list(self.subexpressions())).
+
+            >>> Add(x, Mul(2, y)).size()
+            7
+        """
+        return self._metadata()[0]
+
+    def depth(self):
+        """
+        Returns the nesting depth of self (0 for an atom).
+
+            >>> Add(x, Mul(2, y)).depth()
+            2
+        """
+        return self._metadata()[1]
+
+    def symbol_set(self):
+        """
+        Returns the set of symbols in self as a frozenset.
+        """
+        return self._metadata()[2]
+
+    def head_set(self):
+        """
+        Returns the set of heads of all nonatomic subexpressions of self
+        as a frozenset.
+        """
+        return self._metadata()[3]
+
+    def complexity(self):
+        """
+        Structural complexity score, used by Brain to choose between
+        equivalent expressions: 1 + a + 2*b for f(a, b, ...) where a is
+        the score of f and b is the sum of the scores of the arguments.
+
+            >>> Add(x, 1).complexity()
+            2000015
+        """
+        return self._metadata()[4]
+
+    def contains(self, expr):
+        """
+        Returns True if expr is a subexpression of self (or equal to self).
+        The metadata of the subexpressions is used to skip those that
+        cannot contain expr without traversing them.
+
+            >>> Add(x, Mul(2, y)).contains(Mul(2, y))
+            True
+            >>> Add(x, Mul(2, y)).contains(Mul(2, x))
+            False
+        """
+        size, depth, symbols, heads, _ = expr._metadata()
+        def search(e):
+            meta = e._metadata()
+            if meta[0] < size or meta[1] < depth:
+                return False
+            if meta[0] == size:
+                return e == expr
+            if not (symbols <= meta[2] and heads <= meta[3]):
+                return False
+            for arg in e._data:
+                if search(arg):
+                    return True
+            return False
+        return search(self)
+
     def symbols(self, unique=False):
         """
         Generate all symbols in this expression. With unique=True, avoids
@@ -290,13 +456,13 @@ class Expr(object):
         elif not self.is_atom():
             if unique:
                 seen = set()
-                for arg in self._args:
+                for arg in self._data:
                     for symbol in arg.symbols():
                         if symbol not in seen:
                             yield symbol
                             seen.add(symbol)
             else:
-                for arg in self._args:
+                for arg in self._data:
                     for symbol in arg.symbols():
                         yield symbol
 
@@ -404,7 +570,7 @@ class Expr(object):
         if self.is_atom() or not rules:
             return self
         if not semantic:
-            return Expr(call=(arg.replace(rules, semantic=False) for arg in self._args))
+            return Expr(call=(arg.replace(rules, semantic=False) for arg in self._data))
         expr = self
         head = expr.head()
         args = expr.args()
@@ -499,13 +665,13 @@ class Expr(object):
         if not self.is_atom():
             if unique:
                 seen = set()
-                for arg in self._args:
+                for arg in self._data:
                     for expr in arg.subexpressions():
                         if expr not in seen:
                             yield expr
                             seen.add(expr)
             else:
-                for arg in self._args:
+                for arg in self._data:
                     for expr in arg.subexpressions():
                         yield expr
 
@@ -513,7 +679,7 @@ class Expr(object):
         if self.head() == head:
             yield self
         if not self.is_atom():
-            for arg in self._args:
+            for arg in self._data:
                 for expr in arg.subexpressions_with_head(head):
                     yield expr
 
@@ -893,7 +1059,9 @@ class Expr(object):
             s += """<table>"""
         # s += """<tr><th>Fungrim symbol</th> <th>Notation</th> <th>Domain</th> <th>Codomain</th> <th>Description</th></tr>"""
         s += """<tr><th>Fungrim symbol</th> <th>Notation</th> <th>Short description</th></tr>"""
+        from .formulas import load_symbol
         for symbol in symbols:
+            load_symbol(symbol)
             if symbol in descriptions:
                 example, domain, codomain, description = descriptions[symbol]
                 s += """<tr><td><tt><a href="%s%s/">%s</a></tt>""" % (symbol_dir, symbol.str(), symbol.str())
@@ -912,6 +1080,15 @@ class Expr(object):
         from .numeric import neval
         return neval(self, digits, **kwargs)
 
+    def n_batch(self, variables, points, digits=10, **kwargs):
+        """
+        Evaluates self numerically at each of the points (tuples of
+        values of the variables), returning a list of complex numbers.
+        See pygrim.numeric.neval_batch.
+        """
+        from .numeric import neval_batch
+        return neval_batch(self, variables, points, digits, **kwargs)
+
     def simple(self, assumptions=None, variables=None, **kwargs):
         """
         Simple expression simplification: returns an expression that is
@@ -1049,6 +1226,17 @@ def inject_builtin(string):
 
 variable_names = set()
 
+def _symbol_by_name(name):
+    """
+    Returns the existing object for a builtin symbol or variable (so that
+    checks such as head() is Entries work after unpickling), or a new
+    symbol if there is none.
+    """
+    obj = globals().get(name)
+    if isinstance(obj, Expr) and obj._kind == SYMBOL and obj._data == name:
+        return obj
+    return Expr(symbol_name=name)
+
 def inject_vars(string):
     for s in string.split():
         for sym in [s, s + "_"]:
@@ -1276,6 +1464,27 @@ description_xray = Description("An X-ray plot illustrates the geometry of a comp
     "Yellow is used to highlight important regions.")
 
 
+# scores of atoms for Expr.complexity(); other symbols and text get 1000000
+complexity_weights = {}
+for _symbols, _weight in [
+        ([True_, False_], 1),
+        ([Add, Sub, Neg, Pos, Mul], 10),
+        ([Div, Sqrt, GoldenRatio, ConstI], 20),
+        ([Pi, ConstE, Pow, Exp, Log, Sin, Cos, Tan, Sinh, Cosh, Tanh], 100),
+        ([Gamma, Erf, Erfc, Erfi, RiemannZeta, ConstGamma, ConstCatalan], 1000)]:
+    for _symbol in _symbols:
+        complexity_weights[_symbol] = _weight
+
+_empty_set = frozenset()
+
+def _union(sets):
+    # reuses the largest set when it contains all the others
+    largest = max(sets, key=len)
+    union = largest.union(*sets)
+    if len(union) == len(largest):
+        return largest
+    return union
+
 all_entries = []
 all_topics = []
 
@@ -1322,6 +1531,34 @@ class TestExpr:
         assert Where(Sum(a_(i) * b, For(i, 1, n)), Def(Tuple(a_(i), For(i, 1, n)), T)).free_variables() == set([T, b])
         assert Where(a*d-b*c, Def(Matrix2x2(a, b, c, d), M)).free_variables() == set([M])
 
+    def test_interning(self):
+        a = Add(x, Div(1, 2))
+        enable_interning()
+        try:
+            b = Add(x, Div(1, 2))
+            c = Add(x, Div(1, 2))
+            assert b is c
+            assert b.args()[1] is Div(1, 2)
+            assert a == b and a is not b
+            assert Expr(symbol_name="x") is x
+            assert Expr("abc") is Expr("abc")
+            assert Expr(10**30) is Expr(10**30)
+            assert Expr(symbol_name="abc") is not Expr("abc")
+        finally:
+            disable_interning()
+        assert Add(x, Div(1, 2)) is not c
+
+    def test_metadata(self):
+        expr = Add(x, Mul(2, f(y)))
+        assert expr.symbol_set() == frozenset([Add, Mul, f, x, y])
+        assert expr.head_set() == frozenset([Add, Mul, f])
+        assert expr.contains(f(y))
+        assert expr.contains(expr)
+        assert not expr.contains(f(x))
+        assert not expr.contains(Mul(2, f(y), 3))
+        assert not x.contains(y)
+        assert Expr(5).contains(Expr(5))
+
     def test_replace(self):
         assert (x+y+1).replace({x:z}) == (z+y+1)
         assert (x+y).replace({x:y, y:x}) == y+x
@@ -1,119 +1,305 @@
 # -*- coding: utf-8 -*-
 
+"""
+The formula modules are imported lazily. The generated module
+formula_index maps entry IDs, topic titles and described symbols to the
+module defining them, and looking up a key in entries_dict or topics_dict
+imports just that module. Call load_all() to import everything (this also
+puts all_entries, all_topics and described_symbols in the canonical order
+given by formula_modules). Run write_index() to regenerate the index after
+editing the formulas; a stale index makes lookups of entries and topics
+slower, and can leave out the descriptions of newly described symbols.
+
+Run write_snapshot() to save the whole corpus in binary form (see
+pygrim.snapshot). As long as the snapshot is newer than the source files,
+load_all() reads it instead of executing the formula modules.
+"""
+
+import importlib
+import os
+from collections.abc import Mapping
+
 from ..expr import *
+from .. import expr as _expr
+from .. import snapshot
+
+try:
+    from .formula_index import entry_modules, topic_modules, symbol_modules
+except ImportError:
+    entry_modules = {}
+    topic_modules = {}
+    symbol_modules = {}
+
+# the order in which the modules were traditionally imported
+formula_modules = [
+    "symbolic_expressions", "hurwitz_zeta", "logic", "numbers", "operators",
+    "complex_parts", "const_gamma", "pi", "golden_ratio", "imaginary_unit",
+    "exp", "powers", "sqrt", "sine", "sinc", "atan", "agm",
+    "legendre_elliptic", "carlson_elliptic", "lambertw", "gcd", "factorials",
+    "fibonacci", "gamma", "legendre_polynomial", "chebyshev", "log",
+    "partitions", "riemann_zeta", "integrals", "airy", "bessel",
+    "coulomb_wave", "bernoulli_numbers", "stirling_numbers",
+    "gaussian_quadrature", "general_functions", "complex_plane",
+    "gauss_hypergeometric", "confluent_hypergeometric", "error_functions",
+    "jacobi_theta", "weierstrass_elliptic", "prime_numbers",
+    "modular_transformations", "modular_j", "dedekind_eta", "eisenstein",
+    "modular_lambda", "dirichlet", "beta_function", "totient",
+    "landau_function", "const_catalan", "digamma_function",
+    "integer_sequences", "multiple_zeta_values", "bell_numbers", "barnes_g",
+    "halphen_constant", "misc_descriptions",
+]
+
+# module name -> (entries, topics, described symbols) defined by it
+module_contents = {}
+
+snapshot_path = os.path.join(os.path.dirname(__file__), "snapshot.bin")
+use_snapshot = True
+
+def register(name, entries, topics, symbols):
+    module_contents[name] = (entries, topics, symbols)
+    for entry in entries:
+        if entry.id() in entries_dict.data:
+            raise ValueError("duplicated ID %s" % entry.id())
+        entries_dict.data[entry.id()] = entry
+    for topic in topics:
+        if topic.title() in topics_dict.data:
+            raise ValueError("duplicated title %s" % topic.title())
+        topics_dict.data[topic.title()] = topic
+
+def load(name):
+    """
+    Imports the formula module with the given name (if this has not
+    already been done) and registers its entries and topics.
+    """
+    if name in module_contents:
+        return
+    num_entries = len(all_entries)
+    num_topics = len(all_topics)
+    num_symbols = len(described_symbols)
+    # importing sets the attribute of this package with the name of the
+    # submodule, which must not shadow symbols such as pi or gamma
+    shadowed = globals().get(name)
+    importlib.import_module("." + name, __name__)
+    if shadowed is not None:
+        globals()[name] = shadowed
+    entries = all_entries[num_entries:]
+    topics = all_topics[num_topics:]
+    symbols = described_symbols[num_symbols:]
+    register(name, entries, topics, symbols)
+
+def load_all():
+    """
+    Imports all formula modules (from the snapshot, if it is up to date).
+    """
+    if len(module_contents) == len(formula_modules):
+        return
+    if use_snapshot:
+        load_snapshot()
+    for name in formula_modules:
+        load(name)
+    # restore the canonical order if some modules were loaded out of order
+    all_entries[:] = [x for name in formula_modules for x in module_contents[name][0]]
+    all_topics[:] = [x for name in formula_modules for x in module_contents[name][1]]
+    described_symbols[:] = [x for name in formula_modules for x in module_contents[name][2]]
+
+def load_symbol(symbol):
+    """
+    Imports the formula module describing the given symbol, so that it
+    is available in descriptions and long_descriptions. Most symbols
+    (variables, and builtins without a description) are not described,
+    so unlike lookups in entries_dict, a symbol missing from the index
+    only causes all modules to be loaded if there is no index at all.
+    """
+    if symbol not in descriptions:
+        name = symbol_modules.get(str(symbol))
+        if name is not None:
+            load(name)
+        elif not symbol_modules:
+            load_all()
+
+class LazyRegistry(Mapping):
+    """
+    Dict of entries (or topics) which imports the module defining a key
+    on first access, using the given index. Keys missing from the index
+    cause all modules to be loaded, so that lookups are correct even if
+    the index is out of date. Iterating loads all modules.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.data = {}
+
+    def __getitem__(self, key):
+        if key not in self.data:
+            if key in self.index:
+                load(self.index[key])
+            if key not in self.data:
+                load_all()
+        return self.data[key]
+
+    def __iter__(self):
+        load_all()
+        return iter(self.data)
+
+    def __len__(self):
+        load_all()
+        return len(self.data)
+
+entries_dict = LazyRegistry(entry_modules)
+topics_dict = LazyRegistry(topic_modules)
+
+def build_index():
+    """
+    Loads all formula modules and returns the index dicts
+    (entry_modules, topic_modules, symbol_modules).
+    """
+    load_all()
+    index = ({}, {}, {})
+    for name in formula_modules:
+        entries, topics, symbols = module_contents[name]
+        for entry in entries:
+            index[0][entry.id()] = name
+        for topic in topics:
+            index[1][topic.title()] = name
+        for symbol in symbols:
+            # a symbol described twice keeps its first module
+            index[2].setdefault(str(symbol), name)
+    return index
+
+def index_is_current():
+    return build_index() == (entry_modules, topic_modules, symbol_modules)
+
+def write_index(path=None):
+    """
+    Writes the index to formula_index.py.
+    """
+    import os
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), "formula_index.py")
+    index = build_index()
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write("# -*- coding: utf-8 -*-\n\n")
+        fp.write("# Generated by pygrim.formulas.write_index() -- do not edit.\n\n")
+        for varname, d in zip(["entry_modules", "topic_modules", "symbol_modules"], index):
+            fp.write("%s = {\n" % varname)
+            for key in d:
+                fp.write("    %r: %r,\n" % (key, d[key]))
+            fp.write("}\n\n")
+
+def source_files():
+    """
+    The files that the contents of the snapshot depend on.
+    """
+    directory = os.path.dirname(__file__)
+    files = [os.path.join(directory, name + ".py") for name in formula_modules]
+    files += [__file__, _expr.__file__, snapshot.__file__]
+    return files
+
+def snapshot_is_current(path=None):
+    if path is None:
+        path = snapshot_path
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return False
+    return all(os.path.getmtime(f) <= mtime for f in source_files())
+
+def write_snapshot(path=None):
+    """
+    Loads all formula modules and writes the entries, topics and symbol
+    descriptions (with domain tables) defined by each of them to a
+    snapshot file.
+    """
+    if path is None:
+        path = snapshot_path
+    load_all()
+    enc = snapshot.ExprEncoder()
+    def ref(expr):
+        if expr is None:
+            return None
+        return enc.add(expr)
+    data = []
+    for name in formula_modules:
+        entries, topics, symbols = module_contents[name]
+        symbol_data = []
+        for symbol in symbols:
+            example, domain, codomain, description = descriptions[symbol]
+            if domain is not None:
+                domain = [enc.add(d) for d in domain]
+            symbol_data.append((enc.add(symbol), enc.add(example), domain, ref(codomain),
+                description, ref(long_descriptions.get(symbol)), domain_tables.get(symbol)))
+        data.append((name, [enc.add(e) for e in entries], [enc.add(t) for t in topics], symbol_data))
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fp:
+        snapshot.dump(fp, enc.symbols, enc.nodes, data)
+    os.replace(tmp, path)
+
+def load_snapshot(path=None):
+    """
+    Registers the contents of all formula modules that have not been
+    loaded yet from the snapshot, with the same side effects (on
+    all_entries, descriptions, etc.) as importing them. Returns False
+    if there is no up-to-date snapshot.
+    """
+    if path is None:
+        path = snapshot_path
+    if not snapshot_is_current(path):
+        return False
+    try:
+        with open(path, "rb") as fp:
+            exprs, data = snapshot.load(fp)
+    except (OSError, ValueError):
+        return False
+    for name, entries, topics, symbol_data in data:
+        if name in module_contents:
+            continue
+        entries = [exprs[i] for i in entries]
+        topics = [exprs[i] for i in topics]
+        symbols = []
+        for (symbol, example, domain, codomain, description, long_description, domain_table) in symbol_data:
+            symbol = exprs[symbol]
+            if domain is not None:
+                domain = [exprs[i] for i in domain]
+            if codomain is not None:
+                codomain = exprs[codomain]
+            descriptions[symbol] = (exprs[example], domain, codomain, description)
+            if long_description is not None:
+                long_descriptions[symbol] = exprs[long_description]
+            if domain_table is not None:
+                domain_tables[symbol] = domain_table
+            symbols.append(symbol)
+        all_entries.extend(entries)
+        all_topics.extend(topics)
+        described_symbols.extend(symbols)
+        register(name, entries, topics, symbols)
+    return True
+
+class TestFormulas:
+
+    def __init__(self):
+        pass
 
-from .symbolic_expressions import *
-from .hurwitz_zeta import *
-from .logic import *
-from .numbers import *
-from .operators import *
-from .complex_parts import *
-from .const_gamma import *
-from .pi import *
-from .golden_ratio import *
-from .imaginary_unit import *
-from .exp import *
-from .powers import *
-from .sqrt import *
-from .sine import *
-from .sinc import *
-from .atan import *
-from .agm import *
-from .legendre_elliptic import *
-from .carlson_elliptic import *
-from .lambertw import *
-from .gcd import *
-from .factorials import *
-from .fibonacci import *
-from .gamma import *
-from .legendre_polynomial import *
-from .chebyshev import *
-from .log import *
-from .partitions import *
-from .riemann_zeta import *
-from .integrals import *
-from .airy import *
-from .bessel import *
-from .coulomb_wave import *
-from .bernoulli_numbers import *
-from .stirling_numbers import *
-from .gaussian_quadrature import *
-from .general_functions import *
-from .complex_plane import *
-from .gauss_hypergeometric import *
-from .confluent_hypergeometric import *
-from .error_functions import *
-from .jacobi_theta import *
-from .weierstrass_elliptic import *
-from .prime_numbers import *
-from .modular_transformations import *
-from .modular_j import *
-from .dedekind_eta import *
-from .eisenstein import *
-from .modular_lambda import *
-from .dirichlet import *
-from .beta_function import *
-from .totient import *
-from .landau_function import *
-from .const_catalan import *
-from .digamma_function import *
-from .integer_sequences import *
-from .multiple_zeta_values import *
-from .bell_numbers import *
-from .barnes_g import *
-from .halphen_constant import *
-
-describe(Cos, Cos(z), None, None, "Cosine")
-
-describe(SquaresR, SquaresR(k, n), [Element(k, ZZGreaterEqual(0)), Element(n, ZZ)], ZZ, "Sum of squares function")
-describe(LiouvilleLambda, LiouvilleLambda(n), [Element(n, ZZGreaterEqual(0))], ZZ, "Liouville function")
-describe(DivisorSigma, DivisorSigma(k, n), [Element(k, ZZGreaterEqual(0)), Element(n, ZZ)], ZZ, "Sum of divisors function")
-describe(MoebiusMu, MoebiusMu(n), [Element(n, ZZGreaterEqual(1))], ZZ, "Möbius function")
-describe(KroneckerDelta, KroneckerDelta(x,y), [Element(x, CC), Element(y, CC)], Set(0, 1), "Kronecker delta")
-describe(LegendrePolynomial, LegendrePolynomial(n,z), [Element(n, ZZGreaterEqual(0)), Element(z, CC)], CC, "Legendre polynomial")
-describe(LegendrePolynomialZero, LegendrePolynomialZero(n,k), [Element(n, ZZGreaterEqual(1)), Element(k, Range(1, n))], RR, "Legendre polynomial zero")
-describe(GaussLegendreWeight, GaussLegendreWeight(n,k), [Element(n, ZZGreaterEqual(1)), Element(k, Range(1, n))], RR, "Gauss-Legendre quadrature weight")
-describe(HermitePolynomial, HermitePolynomial(n,z), [Element(n, ZZGreaterEqual(0)), Element(z, CC)], CC, "Hermite polynomial")
-
-describe(BernsteinEllipse, BernsteinEllipse(rho), [Element(rho, RR), Greater(rho, 1)], PowerSet(CC), "Bernstein ellipse with foci -1,+1 and semi-axis sum rho")
-describe(UnitCircle, UnitCircle, [], PowerSet(CC), "Unit circle")
-
-describe(Matrix2x2, Matrix2x2(a,b,c,d), [], None, "Two by two matrix")
-
-describe(LogIntegral, LogIntegral(z), [Element(z, SetMinus(CC, Set(1)))], CC, "Logarithmic integral")
-describe(RiemannXi, RiemannXi(s), [Element(s, CC)], CC, "Riemann xi-function")
-
-describe2(PowerSeries, PowerSeries(K,x), "Formal power series", None,
-    Description("Represents the set of formal power series in the (formal) symbol", x,
-    "and with coefficients in the set", K, ", equivalently infinite series",
-    Sum(c(k) * x**k, Tuple(k, 0, Infinity)), "where", Element(c(k), K), "."))
-
-describe2(LaurentSeries, LaurentSeries(K,x), "Formal Laurent series", None,
-    Description("Represents the set of formal Laurent series in the (formal) symbol", x,
-    "and with coefficients in the set", K, ", equivalently infinite series",
-    Sum(c(k) * x**k, Tuple(k, n, Infinity)), "where", Element(c(k), K), "and", Element(n, ZZ), " may be negative."))
-
-describe2(List, List(Ellipsis), "List with given elements", None,
-    Description("Called with a finite number of arguments, represents the list with those arguments as elements.",
-    "The difference between a", List, "and a", Tuple, "is mainly notational (square brackets or parentheses).",
-    "A ", List, "is sometimes more natural for a homogeneous collection while a", Tuple,
-    "is more natural for a heterogeneous collection."))
-
-describe2(Tuple, Tuple(Ellipsis), "Tuple with given elements", None,
-    Description("Called with a finite number of arguments, represents the tuple with those arguments as elements.",
-    "The difference between a", List, "and a", Tuple, "is mainly notational (square brackets or parentheses).",
-    "A ", List, "is sometimes more natural for a homogeneous collection while a", Tuple,
-    "is more natural for a heterogeneous collection."))
-
-entries_dict = {}
-for entry in all_entries:
-    if entry.id() in entries_dict:
-        raise ValueError("duplicated ID %s" % entry.id())
-    entries_dict[entry.id()] = entry
-
-topics_dict = {}
-for topic in all_topics:
-    if topic.title() in topics_dict:
-        raise ValueError("duplicated title %s" % topic.title())
-    topics_dict[topic.title()] = topic
+    def run(self):
+        for method in dir(self):
+            if method.startswith("test_"):
+                print(method, "...", end=" ")
+                getattr(self, method)()
+                print("OK!")
 
+    def test_lazy_entry_html(self):
+        # the modules must not have been loaded yet, so use a new process
+        import subprocess
+        import sys
+        code = "\n".join([
+            "import pygrim.formulas as f",
+            "from pygrim.expr import katex_function",
+            "katex_function.append(lambda s, display=False: s)",
+            "html = f.entries_dict['590136'].entry_html()",
+            "assert len(f.module_contents) < len(f.formula_modules)",
+            "f.load_all()",
+            "assert html == f.entries_dict['590136'].entry_html()",
+        ])
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+        subprocess.check_call([sys.executable, "-c", code], env=env)
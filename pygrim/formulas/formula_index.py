@@ -0,0 +1,3472 @@
+# -*- coding: utf-8 -*-
+
+# Generated by pygrim.formulas.write_index() -- do not edit.
+
+entry_modules = {
+    '6db9b2': 'symbolic_expressions',
+    '0d9952': 'symbolic_expressions',
+    'c2fb41': 'symbolic_expressions',
+    'f37520': 'symbolic_expressions',
+    '3c8d31': 'symbolic_expressions',
+    '8af90e': 'symbolic_expressions',
+    'b976df': 'symbolic_expressions',
+    '43cc72': 'symbolic_expressions',
+    '978576': 'symbolic_expressions',
+    '82c978': 'symbolic_expressions',
+    '73f5e7': 'symbolic_expressions',
+    'ecfe08': 'symbolic_expressions',
+    'd14265': 'symbolic_expressions',
+    'ca1edc': 'symbolic_expressions',
+    '04217b': 'hurwitz_zeta',
+    '855201': 'hurwitz_zeta',
+    '583bf9': 'hurwitz_zeta',
+    '0e2bcb': 'hurwitz_zeta',
+    '56dcbd': 'hurwitz_zeta',
+    'ad269f': 'hurwitz_zeta',
+    'e7224b': 'hurwitz_zeta',
+    'b0f500': 'hurwitz_zeta',
+    'cc523f': 'hurwitz_zeta',
+    'ec2dd5': 'hurwitz_zeta',
+    'a5980a': 'hurwitz_zeta',
+    'd0b234': 'hurwitz_zeta',
+    'c5d844': 'hurwitz_zeta',
+    '4bf3da': 'hurwitz_zeta',
+    'ea271f': 'hurwitz_zeta',
+    '26418b': 'hurwitz_zeta',
+    '93e149': 'hurwitz_zeta',
+    '8c7cdb': 'hurwitz_zeta',
+    '05c2dd': 'hurwitz_zeta',
+    'f045b3': 'hurwitz_zeta',
+    'af23f7': 'hurwitz_zeta',
+    'b721b4': 'hurwitz_zeta',
+    'fc6fe0': 'hurwitz_zeta',
+    '6e69fc': 'hurwitz_zeta',
+    'af7d3d': 'hurwitz_zeta',
+    'c6d6e2': 'hurwitz_zeta',
+    '6c3523': 'hurwitz_zeta',
+    '8bbb6f': 'hurwitz_zeta',
+    '4d1f6b': 'hurwitz_zeta',
+    '575b8f': 'hurwitz_zeta',
+    'ac8d3c': 'hurwitz_zeta',
+    'b4ed44': 'hurwitz_zeta',
+    '4dd87c': 'hurwitz_zeta',
+    '2d4828': 'hurwitz_zeta',
+    '33690e': 'hurwitz_zeta',
+    '868061': 'hurwitz_zeta',
+    '9417f4': 'hurwitz_zeta',
+    '4064f5': 'hurwitz_zeta',
+    '3e82c3': 'hurwitz_zeta',
+    '951f86': 'hurwitz_zeta',
+    'eda0f3': 'hurwitz_zeta',
+    'b347d3': 'hurwitz_zeta',
+    '2fabeb': 'hurwitz_zeta',
+    'edad97': 'hurwitz_zeta',
+    '84196a': 'hurwitz_zeta',
+    '532f31': 'hurwitz_zeta',
+    '5bdba2': 'hurwitz_zeta',
+    '7dab87': 'hurwitz_zeta',
+    'd99808': 'hurwitz_zeta',
+    '150b3e': 'hurwitz_zeta',
+    '3db90c': 'hurwitz_zeta',
+    '6419ac': 'hurwitz_zeta',
+    '448d90': 'hurwitz_zeta',
+    '77e507': 'hurwitz_zeta',
+    '0bd6aa': 'hurwitz_zeta',
+    '1699a9': 'hurwitz_zeta',
+    '498036': 'hurwitz_zeta',
+    'ed4f6f': 'hurwitz_zeta',
+    'bed7ee': 'hurwitz_zeta',
+    '95e270': 'hurwitz_zeta',
+    'ebc49c': 'hurwitz_zeta',
+    '7d9feb': 'hurwitz_zeta',
+    'ba7f85': 'hurwitz_zeta',
+    '69a1a9': 'hurwitz_zeta',
+    '3ba544': 'hurwitz_zeta',
+    'd0d03b': 'hurwitz_zeta',
+    '83065e': 'hurwitz_zeta',
+    '40c3e2': 'hurwitz_zeta',
+    'd25d10': 'hurwitz_zeta',
+    'febdd2': 'hurwitz_zeta',
+    '4228cd': 'hurwitz_zeta',
+    'f3b870': 'hurwitz_zeta',
+    '53026a': 'hurwitz_zeta',
+    '693e0e': 'hurwitz_zeta',
+    '52ea5f': 'hurwitz_zeta',
+    '488b6d': 'logic',
+    '0a6d2e': 'logic',
+    'a53803': 'logic',
+    '2d6cf1': 'logic',
+    '379aa0': 'logic',
+    'cf447f': 'logic',
+    '81efd5': 'logic',
+    '1d963f': 'logic',
+    '985bda': 'logic',
+    '0e613e': 'logic',
+    'ec33ac': 'logic',
+    '27f845': 'logic',
+    '590290': 'logic',
+    'a9e8df': 'logic',
+    'e58aaf': 'logic',
+    '298e9e': 'numbers',
+    '7be5dc': 'numbers',
+    'bfe358': 'numbers',
+    '0deea6': 'numbers',
+    'c01d22': 'numbers',
+    '81c491': 'numbers',
+    '4fd123': 'numbers',
+    'be9c83': 'numbers',
+    'e5a04c': 'numbers',
+    'aa6b07': 'numbers',
+    '24c179': 'numbers',
+    'b738b1': 'numbers',
+    '486ab2': 'numbers',
+    '03fbae': 'numbers',
+    '2a52af': 'numbers',
+    '00b82b': 'numbers',
+    '12d5ab': 'numbers',
+    '3fe68f': 'numbers',
+    'b2162a': 'numbers',
+    'ed302a': 'numbers',
+    '044e42': 'operators',
+    '1e2755': 'operators',
+    '9f703a': 'operators',
+    '2a896d': 'operators',
+    '8baf79': 'operators',
+    '5830eb': 'operators',
+    'f7ce46': 'operators',
+    'd2714b': 'operators',
+    '5862bb': 'operators',
+    'f5ae93': 'operators',
+    '6ec976': 'operators',
+    'bbeb35': 'operators',
+    'd0cb24': 'operators',
+    '65ccf2': 'operators',
+    '0a3e5a': 'operators',
+    '617fe3': 'operators',
+    'f4fbb8': 'operators',
+    'be4926': 'operators',
+    '26ea9f': 'operators',
+    '1d2ee5': 'operators',
+    '6fe5c1': 'operators',
+    'c8a5f0': 'operators',
+    'afd5ca': 'operators',
+    '05a3ee': 'operators',
+    '2be0b5': 'operators',
+    '6cd302': 'operators',
+    'fdf152': 'operators',
+    '1b6a57': 'operators',
+    '452407': 'operators',
+    'b4b319': 'operators',
+    '96f695': 'operators',
+    '4c6780': 'operators',
+    'c285c7': 'operators',
+    '2e4fbc': 'operators',
+    '0be77d': 'operators',
+    'fb2790': 'operators',
+    '499bdf': 'operators',
+    '0895b1': 'operators',
+    '231a99': 'operators',
+    'c54261': 'operators',
+    '4d0e14': 'operators',
+    'bf8f37': 'operators',
+    '457aaa': 'operators',
+    '5e639e': 'complex_parts',
+    '920cc8': 'complex_parts',
+    'b7d740': 'complex_parts',
+    'f5e62c': 'complex_parts',
+    '9086c6': 'complex_parts',
+    'da5d5e': 'complex_parts',
+    'ce8ee4': 'complex_parts',
+    '26565c': 'complex_parts',
+    '4f0049': 'complex_parts',
+    'b2a880': 'complex_parts',
+    '8e6867': 'complex_parts',
+    'ba6d81': 'complex_parts',
+    'acda23': 'complex_parts',
+    '18d335': 'complex_parts',
+    '59a5d6': 'complex_parts',
+    'e9465d': 'complex_parts',
+    'c423d2': 'complex_parts',
+    '735409': 'complex_parts',
+    '089f85': 'complex_parts',
+    'a8b41c': 'complex_parts',
+    '3866dc': 'complex_parts',
+    'f1a29b': 'complex_parts',
+    'bcd22f': 'complex_parts',
+    '8cac46': 'complex_parts',
+    '98efc1': 'complex_parts',
+    'a6e081': 'complex_parts',
+    '48fe10': 'complex_parts',
+    '6a894d': 'complex_parts',
+    'ebf8cc': 'complex_parts',
+    'fc427b': 'complex_parts',
+    '12664e': 'complex_parts',
+    '432926': 'complex_parts',
+    '08268d': 'complex_parts',
+    '54340e': 'complex_parts',
+    '60772e': 'complex_parts',
+    '39e0cb': 'const_gamma',
+    'e876e8': 'const_gamma',
+    '4644c0': 'const_gamma',
+    '288da1': 'const_gamma',
+    '28bf9a': 'const_gamma',
+    'cf3977': 'const_gamma',
+    'd17d0b': 'const_gamma',
+    'a1f1ec': 'const_gamma',
+    '79d6ba': 'const_gamma',
+    '9d5c86': 'const_gamma',
+    '0888b3': 'const_gamma',
+    'e8af68': 'const_gamma',
+    '818008': 'const_gamma',
+    '39fe5f': 'const_gamma',
+    'a1ca3e': 'const_gamma',
+    '014c4e': 'const_gamma',
+    'b5d706': 'pi',
+    '6505a9': 'pi',
+    '47acde': 'pi',
+    '0c838a': 'pi',
+    '155575': 'pi',
+    '271314': 'pi',
+    '0c9939': 'pi',
+    '3ff35f': 'pi',
+    '722241': 'pi',
+    'b89166': 'pi',
+    '590136': 'pi',
+    '030560': 'pi',
+    'f8d280': 'pi',
+    'cbf396': 'pi',
+    'b1357b': 'pi',
+    '0644b6': 'pi',
+    '5278da': 'pi',
+    '7ce79e': 'pi',
+    '8332d8': 'pi',
+    '464961': 'pi',
+    'fc8149': 'pi',
+    '04cd99': 'pi',
+    'dae4a7': 'pi',
+    '81f500': 'pi',
+    'bd3faa': 'pi',
+    '9a3503': 'pi',
+    '8107d6': 'pi',
+    '5033c7': 'pi',
+    '6ed553': 'pi',
+    '859856': 'pi',
+    'd8cb3e': 'pi',
+    'e00d9e': 'pi',
+    'f617c0': 'pi',
+    '93831d': 'pi',
+    '419b45': 'pi',
+    'fddfe6': 'pi',
+    '6b9f81': 'pi',
+    '57fcaf': 'pi',
+    '0479f5': 'pi',
+    '338055': 'pi',
+    'fbc53d': 'pi',
+    '11302a': 'pi',
+    '9bf21b': 'pi',
+    '8dff72': 'pi',
+    '31eecc': 'pi',
+    'bad5d9': 'pi',
+    '54c80d': 'pi',
+    'f78fa0': 'pi',
+    'dbdf08': 'pi',
+    'a2e6f9': 'pi',
+    '69fe63': 'pi',
+    '490cf4': 'pi',
+    'a91200': 'pi',
+    '6fce07': 'pi',
+    'dea83d': 'pi',
+    'e1e106': 'pi',
+    '420007': 'pi',
+    '220e8d': 'pi',
+    '8fab22': 'pi',
+    '2371b9': 'pi',
+    '63ba30': 'pi',
+    '67bb53': 'pi',
+    '591d64': 'pi',
+    '033c51': 'pi',
+    'dabb47': 'pi',
+    'ce5423': 'pi',
+    '07e35f': 'pi',
+    '9206a3': 'pi',
+    '1448e3': 'pi',
+    'a7095f': 'pi',
+    'c6c108': 'pi',
+    '2a0316': 'pi',
+    'f55b36': 'pi',
+    '769f6e': 'pi',
+    '488a30': 'pi',
+    '826257': 'pi',
+    '3d276b': 'pi',
+    '2806fd': 'pi',
+    '68b73d': 'pi',
+    '42d727': 'pi',
+    '8ee7c9': 'pi',
+    'f56273': 'pi',
+    '2516c2': 'pi',
+    '1e3a25': 'pi',
+    'fdc3a3': 'pi',
+    '4c0698': 'pi',
+    '37f505': 'golden_ratio',
+    '08fcaf': 'golden_ratio',
+    '77d2f8': 'golden_ratio',
+    'e09458': 'golden_ratio',
+    '31f52c': 'golden_ratio',
+    'b464d3': 'golden_ratio',
+    'd774fe': 'golden_ratio',
+    '77c324': 'golden_ratio',
+    '6d2709': 'golden_ratio',
+    '2e0596': 'golden_ratio',
+    'ebfcd8': 'golden_ratio',
+    '98a765': 'golden_ratio',
+    '487e35': 'golden_ratio',
+    'fad16f': 'golden_ratio',
+    '0cd1a4': 'golden_ratio',
+    '6a11ce': 'golden_ratio',
+    '2b6e60': 'golden_ratio',
+    'e9a269': 'golden_ratio',
+    'be8e05': 'imaginary_unit',
+    '88ad6f': 'imaginary_unit',
+    'cd8a07': 'imaginary_unit',
+    'a08fb9': 'imaginary_unit',
+    '08ad28': 'imaginary_unit',
+    '72cef9': 'imaginary_unit',
+    '27586f': 'imaginary_unit',
+    '65bbd6': 'imaginary_unit',
+    '249fd6': 'imaginary_unit',
+    '61784f': 'imaginary_unit',
+    '09c107': 'imaginary_unit',
+    '31b0df': 'imaginary_unit',
+    '8be138': 'imaginary_unit',
+    'e0425a': 'imaginary_unit',
+    'c12a41': 'imaginary_unit',
+    '44ae4a': 'imaginary_unit',
+    '67c262': 'imaginary_unit',
+    'f8a56f': 'imaginary_unit',
+    '15f92d': 'imaginary_unit',
+    'a39534': 'imaginary_unit',
+    '9c93bb': 'imaginary_unit',
+    '3ac0ce': 'imaginary_unit',
+    '208da7': 'imaginary_unit',
+    'dfbcd9': 'exp',
+    'f758c6': 'exp',
+    'e74de0': 'exp',
+    '6ef3d1': 'exp',
+    'be1092': 'exp',
+    '819b5f': 'exp',
+    'ca8b0a': 'exp',
+    '66f4c8': 'exp',
+    '424db5': 'exp',
+    'a807a7': 'exp',
+    '0d82d4': 'exp',
+    '148f96': 'exp',
+    '9e388b': 'exp',
+    '2ea614': 'exp',
+    '27ca8d': 'exp',
+    '9a944c': 'exp',
+    '54aaf1': 'exp',
+    'a90f35': 'exp',
+    'bb7d22': 'exp',
+    '8f9143': 'exp',
+    '71a0b8': 'exp',
+    'e2b379': 'exp',
+    '812707': 'exp',
+    'e51ec3': 'exp',
+    '2f4f74': 'exp',
+    '77d6bf': 'exp',
+    '97ba8d': 'exp',
+    '1fa6b7': 'exp',
+    '296627': 'exp',
+    '987e3c': 'exp',
+    '28d158': 'exp',
+    '0901a1': 'exp',
+    'be4b28': 'exp',
+    '184c11': 'exp',
+    'b62d05': 'exp',
+    'bceb84': 'exp',
+    '1635f5': 'exp',
+    'bad502': 'exp',
+    '935b2f': 'exp',
+    '96af56': 'exp',
+    '4491b8': 'exp',
+    '1568e1': 'exp',
+    'e103e7': 'exp',
+    '1b3014': 'exp',
+    'caf706': 'exp',
+    'b7d62b': 'exp',
+    'e2fac7': 'exp',
+    'a0d93c': 'exp',
+    '52d827': 'exp',
+    '3c4480': 'exp',
+    '2f57ad': 'exp',
+    '3ac8a5': 'exp',
+    'ef9f8a': 'powers',
+    'd316bc': 'powers',
+    '310f36': 'powers',
+    'a249f6': 'powers',
+    '6c2b31': 'powers',
+    'c53d94': 'powers',
+    '4d6416': 'powers',
+    '634687': 'powers',
+    '2e0d99': 'powers',
+    '0aac97': 'powers',
+    'bc4d0a': 'powers',
+    'caf8cf': 'powers',
+    '18873d': 'powers',
+    '2090c3': 'powers',
+    '21d9b8': 'sqrt',
+    'af984e': 'sqrt',
+    '627c9c': 'sqrt',
+    '97b736': 'sqrt',
+    '9d5b81': 'sqrt',
+    '61480c': 'sqrt',
+    '2eb54a': 'sqrt',
+    '0ad836': 'sqrt',
+    '31a8ca': 'sqrt',
+    '9dec73': 'sqrt',
+    'f9f31d': 'sqrt',
+    '08d275': 'sqrt',
+    'e0ac95': 'sqrt',
+    'fc2582': 'sqrt',
+    '0984ef': 'sqrt',
+    'd8791e': 'sqrt',
+    '3cc884': 'sqrt',
+    '57af50': 'sqrt',
+    '08bd37': 'sqrt',
+    '616bcb': 'sqrt',
+    '73b76c': 'sqrt',
+    'd0a331': 'sqrt',
+    '0d8e03': 'sqrt',
+    '1232f7': 'sqrt',
+    '99c0b3': 'sqrt',
+    'd40229': 'sqrt',
+    '6f63dd': 'sqrt',
+    '185efc': 'sqrt',
+    'ac54c7': 'sqrt',
+    '22e0be': 'sqrt',
+    '8c1ee5': 'sqrt',
+    '4ed6a8': 'sqrt',
+    'e722ca': 'sqrt',
+    'c58f46': 'sqrt',
+    '02751f': 'sqrt',
+    '14cbeb': 'sqrt',
+    '34136c': 'sqrt',
+    '2a11ab': 'sqrt',
+    '3e71f4': 'sqrt',
+    '83abff': 'sqrt',
+    '6ddbf4': 'sqrt',
+    'b14da0': 'sqrt',
+    '3c2557': 'sqrt',
+    '6202cb': 'sqrt',
+    '5ff181': 'sqrt',
+    'b63dce': 'sine',
+    '31fef8': 'sine',
+    '21f156': 'sine',
+    '984d9c': 'sine',
+    'f1691f': 'sine',
+    'c52772': 'sine',
+    'e2161b': 'sine',
+    '69c5ef': 'sine',
+    '56667c': 'sine',
+    '3c833f': 'sine',
+    '5fc688': 'sine',
+    'ad6b74': 'sine',
+    'c62afa': 'sine',
+    '506d0c': 'sine',
+    '09cd0b': 'sine',
+    '713501': 'sine',
+    '056c0e': 'sine',
+    '2f6818': 'sine',
+    'c5bdcc': 'sine',
+    'ad04bd': 'sine',
+    'bfe28b': 'sine',
+    '27766c': 'sine',
+    '114913': 'sine',
+    'f4cc9e': 'sine',
+    '6aa0bc': 'sine',
+    '96550d': 'sine',
+    'a45c61': 'sine',
+    'a2a30d': 'sine',
+    '82c83f': 'sine',
+    '6a8889': 'sine',
+    '393b62': 'sine',
+    '1c22f1': 'sine',
+    '9cc0f2': 'sine',
+    'bae475': 'sine',
+    'da58f7': 'sine',
+    '742943': 'sine',
+    '508e2c': 'sine',
+    '3b839c': 'sine',
+    '755655': 'sine',
+    '1b11be': 'sine',
+    '729215': 'sine',
+    'e3f8a4': 'sine',
+    'd59bd9': 'sine',
+    'e69cf6': 'sine',
+    'ad6c1c': 'sine',
+    '012eba': 'sine',
+    'f183d0': 'sine',
+    '6c3ba9': 'sine',
+    'adbc1a': 'sine',
+    '4948ea': 'sine',
+    '954066': 'sine',
+    '244127': 'sine',
+    'cf6e35': 'sine',
+    'acf63c': 'sine',
+    '2a6702': 'sine',
+    '54f420': 'sine',
+    '71a264': 'sine',
+    'd0505f': 'sine',
+    '2392f5': 'sine',
+    'f6d0c6': 'sine',
+    'b8ab9c': 'sine',
+    '906569': 'sine',
+    '925e5b': 'sine',
+    '3fb3ca': 'sine',
+    '18f40c': 'sine',
+    '299209': 'sine',
+    'cfc5c3': 'sine',
+    '54daa9': 'sine',
+    '0fbd15': 'sine',
+    'd38a03': 'sine',
+    '729b70': 'sine',
+    '037a6e': 'sine',
+    'abaf91': 'sine',
+    'f7ab32': 'sine',
+    '297b3c': 'sine',
+    '612b21': 'sine',
+    'a6667d': 'sine',
+    'd81355': 'sine',
+    'c93b81': 'sine',
+    'f340cb': 'sine',
+    '6b13be': 'sine',
+    '11687b': 'sine',
+    '4039ec': 'sine',
+    'c47a86': 'sine',
+    '22c4f6': 'sine',
+    'd38739': 'sine',
+    'f77752': 'sine',
+    'dd5787': 'sine',
+    '3dd162': 'sine',
+    '092377': 'sine',
+    '1721bf': 'sine',
+    '941a86': 'sine',
+    'f3a901': 'sine',
+    '03f713': 'sine',
+    '4cbfd4': 'sinc',
+    '639d7b': 'sinc',
+    'baf960': 'sinc',
+    'a527c4': 'sinc',
+    '89be58': 'sinc',
+    '2379e6': 'sinc',
+    '41998e': 'sinc',
+    'fa9283': 'sinc',
+    'b18020': 'sinc',
+    '01422b': 'sinc',
+    'af4516': 'sinc',
+    '1349b5': 'sinc',
+    '593e63': 'sinc',
+    'fdc94c': 'sinc',
+    '340936': 'sinc',
+    'c9ead2': 'sinc',
+    '45740a': 'sinc',
+    'f19e0a': 'sinc',
+    '3a428f': 'sinc',
+    'b41d08': 'sinc',
+    'd5000a': 'sinc',
+    '768c77': 'sinc',
+    '90c66a': 'sinc',
+    'c6e6b2': 'sinc',
+    'aa15f0': 'sinc',
+    '1c3766': 'sinc',
+    'ff5e82': 'sinc',
+    '4f9844': 'sinc',
+    'f64eef': 'sinc',
+    '24c17b': 'sinc',
+    'e2878f': 'sinc',
+    '50f72f': 'sinc',
+    '19d7d9': 'sinc',
+    '6e4f58': 'sinc',
+    'e2c10d': 'sinc',
+    '729c78': 'sinc',
+    '08583a': 'sinc',
+    'b1d132': 'sinc',
+    '99ad29': 'sinc',
+    '45f05f': 'sinc',
+    '122e3d': 'sinc',
+    'd6c29e': 'sinc',
+    '8ef3d7': 'sinc',
+    '2b7b1d': 'sinc',
+    'f0f0a6': 'sinc',
+    '81f531': 'sinc',
+    'f5887b': 'sinc',
+    '108daa': 'sinc',
+    '3fe2b0': 'sinc',
+    '2a69ce': 'sinc',
+    '38dc04': 'sinc',
+    '78fca3': 'sinc',
+    'a0b0b3': 'sinc',
+    'cb152f': 'sinc',
+    '1a7e22': 'sinc',
+    'be0f54': 'sinc',
+    '1596d2': 'sinc',
+    'af8328': 'sinc',
+    'c2976e': 'sinc',
+    '4a5b9a': 'sinc',
+    'dad27b': 'sinc',
+    '5c9675': 'sinc',
+    '632d1c': 'sinc',
+    'b1a260': 'sinc',
+    '1e6344': 'sinc',
+    'da7fb1': 'sinc',
+    '95c04c': 'sinc',
+    '2ac5eb': 'sinc',
+    '5e0c58': 'sinc',
+    'a2f5a9': 'sinc',
+    '2f09ad': 'sinc',
+    '6c28fa': 'sinc',
+    'aa404c': 'sinc',
+    '088fdb': 'sinc',
+    'f4fd7d': 'sinc',
+    '20f069': 'sinc',
+    '4d3f04': 'sinc',
+    'f0325d': 'sinc',
+    'd8d286': 'sinc',
+    'a934d1': 'sinc',
+    '351d87': 'sinc',
+    '5d16e5': 'sinc',
+    'c7c483': 'sinc',
+    '51f9b4': 'sinc',
+    '2a8ec9': 'sinc',
+    '005478': 'sinc',
+    '4d5410': 'sinc',
+    '1f9beb': 'sinc',
+    '8814ad': 'sinc',
+    '49514d': 'sinc',
+    '0c847f': 'sinc',
+    'b894a3': 'sinc',
+    '4a1b00': 'sinc',
+    'b120b9': 'atan',
+    'ce3a8e': 'atan',
+    '8bb3d8': 'atan',
+    '1f026d': 'atan',
+    'd4b0b6': 'atan',
+    '0b829e': 'atan',
+    'f516e3': 'atan',
+    'cbce7f': 'atan',
+    'a2af66': 'atan',
+    '61d8f3': 'atan',
+    '90a864': 'atan',
+    '645e30': 'atan',
+    'd418d3': 'atan',
+    '7295b5': 'atan',
+    'a2d208': 'atan',
+    '9b0994': 'atan',
+    '157c6c': 'atan',
+    '706783': 'atan',
+    '3c1021': 'atan',
+    'a9ecff': 'atan',
+    'c6c92a': 'atan',
+    '7dd050': 'atan',
+    'b0049f': 'atan',
+    'a6cd13': 'atan',
+    '30ba67': 'atan',
+    '48031d': 'atan',
+    '26c47c': 'atan',
+    '3b11d3': 'atan',
+    '718a9b': 'atan',
+    'a6776b': 'atan',
+    '77e519': 'atan',
+    '22fb4a': 'atan',
+    '0ee626': 'atan',
+    '632063': 'atan',
+    'e3d274': 'atan',
+    '073e1a': 'atan',
+    'bfc13f': 'atan',
+    '072166': 'atan',
+    '268c9e': 'atan',
+    '14f8c2': 'atan',
+    '67c0be': 'atan',
+    'cf64b3': 'atan',
+    '00e608': 'atan',
+    '3ea11b': 'atan',
+    '503d4d': 'atan',
+    'a020e9': 'atan',
+    '1d730a': 'atan',
+    'a18b77': 'atan',
+    '500c0a': 'atan',
+    '12765e': 'atan',
+    '9dec3e': 'atan',
+    'eca4ce': 'atan',
+    'c580f4': 'atan',
+    '7954ad': 'atan',
+    'ec7f2d': 'atan',
+    '34ff28': 'atan',
+    'df52fc': 'atan',
+    'b65d19': 'atan',
+    '8fbf69': 'atan',
+    'a4eb86': 'atan',
+    '90631b': 'atan',
+    '36171f': 'atan',
+    '6b8963': 'atan',
+    '1d3fd7': 'atan',
+    '4e5947': 'atan',
+    'b63481': 'atan',
+    'e7a9b1': 'atan',
+    '5d6f74': 'atan',
+    '466095': 'atan',
+    '3478af': 'atan',
+    '1eeccf': 'atan',
+    'efebb8': 'atan',
+    'a42212': 'atan',
+    '3fe47b': 'atan',
+    'f5d28c': 'atan',
+    'b0a4e9': 'atan',
+    'd04a5b': 'atan',
+    'b971fe': 'atan',
+    '7272a8': 'atan',
+    'fa9b71': 'atan',
+    '47331d': 'atan',
+    '96289e': 'atan',
+    'fa30c7': 'atan',
+    '4d2168': 'atan',
+    'b0d256': 'agm',
+    'eda1e3': 'agm',
+    '00d5df': 'agm',
+    'c941c4': 'agm',
+    '21f412': 'agm',
+    '32b3b4': 'agm',
+    'c38209': 'agm',
+    'f9caac': 'agm',
+    '098757': 'agm',
+    '08329d': 'agm',
+    '8f176c': 'agm',
+    '3e1398': 'agm',
+    'b41bdd': 'agm',
+    '0d9352': 'agm',
+    'e3896e': 'agm',
+    '361801': 'agm',
+    'f9190b': 'agm',
+    '69d0a3': 'agm',
+    '5174ea': 'agm',
+    '7b362f': 'agm',
+    'eb0661': 'agm',
+    '3da9b7': 'agm',
+    'f178f2': 'agm',
+    '447541': 'agm',
+    '95fb3e': 'agm',
+    '84b888': 'agm',
+    '08b69d': 'agm',
+    '41f67b': 'agm',
+    'a2b0f9': 'agm',
+    '6d9ceb': 'agm',
+    '13c539': 'agm',
+    '042551': 'agm',
+    '59fab1': 'agm',
+    'c0dea0': 'agm',
+    '7189d6': 'agm',
+    'ce2395': 'agm',
+    'ea1d58': 'agm',
+    'd60119': 'agm',
+    'c7f885': 'agm',
+    'fa6ff7': 'agm',
+    '8e80c6': 'agm',
+    '46c021': 'agm',
+    '9d84d8': 'agm',
+    'd6d836': 'agm',
+    '71a0ff': 'agm',
+    'e15f43': 'agm',
+    '26fd1b': 'agm',
+    '20828c': 'agm',
+    'a4cc5a': 'agm',
+    'cfefa9': 'agm',
+    '417619': 'agm',
+    '162ecf': 'agm',
+    '23ee29': 'agm',
+    '75e692': 'agm',
+    'e8ae42': 'legendre_elliptic',
+    '723fd0': 'legendre_elliptic',
+    '34482b': 'legendre_elliptic',
+    '107140': 'legendre_elliptic',
+    'afdf5d': 'legendre_elliptic',
+    '53b1e7': 'legendre_elliptic',
+    '89d93c': 'legendre_elliptic',
+    '210213': 'legendre_elliptic',
+    '4704f9': 'legendre_elliptic',
+    '20d72c': 'legendre_elliptic',
+    '0455b3': 'legendre_elliptic',
+    '190843': 'legendre_elliptic',
+    '83a535': 'legendre_elliptic',
+    '47dead': 'legendre_elliptic',
+    'fa8666': 'legendre_elliptic',
+    'c10014': 'legendre_elliptic',
+    '7cd257': 'legendre_elliptic',
+    '81fb10': 'legendre_elliptic',
+    '2ff7e7': 'legendre_elliptic',
+    '60f858': 'legendre_elliptic',
+    '33ee4a': 'legendre_elliptic',
+    '5e869b': 'legendre_elliptic',
+    '06223c': 'legendre_elliptic',
+    'bb4501': 'legendre_elliptic',
+    '1d62a7': 'legendre_elliptic',
+    '45b157': 'legendre_elliptic',
+    '958a3f': 'legendre_elliptic',
+    'afb22a': 'legendre_elliptic',
+    'cc22bf': 'legendre_elliptic',
+    '630eca': 'legendre_elliptic',
+    '9f3474': 'legendre_elliptic',
+    '3b272e': 'legendre_elliptic',
+    '5d2c01': 'legendre_elliptic',
+    '2991b5': 'legendre_elliptic',
+    '4b040d': 'legendre_elliptic',
+    '0abbe1': 'legendre_elliptic',
+    '175b7a': 'legendre_elliptic',
+    'b95ffa': 'legendre_elliptic',
+    '40a376': 'legendre_elliptic',
+    '618a54': 'legendre_elliptic',
+    '18e226': 'legendre_elliptic',
+    '061c49': 'legendre_elliptic',
+    '3c4979': 'legendre_elliptic',
+    '124d02': 'legendre_elliptic',
+    '9b0385': 'legendre_elliptic',
+    'ce4df4': 'legendre_elliptic',
+    'e9c797': 'legendre_elliptic',
+    '5d8804': 'legendre_elliptic',
+    'dd67fb': 'legendre_elliptic',
+    '9227bf': 'legendre_elliptic',
+    'ba1965': 'legendre_elliptic',
+    '4268fc': 'legendre_elliptic',
+    'd2adb6': 'legendre_elliptic',
+    '0b8fd6': 'legendre_elliptic',
+    '81f7db': 'legendre_elliptic',
+    'afabeb': 'legendre_elliptic',
+    'c0ad12': 'legendre_elliptic',
+    'ace837': 'legendre_elliptic',
+    '16612f': 'legendre_elliptic',
+    '04c829': 'legendre_elliptic',
+    'c584c3': 'legendre_elliptic',
+    'f5d489': 'legendre_elliptic',
+    'a91f8d': 'legendre_elliptic',
+    '8b4be6': 'legendre_elliptic',
+    'aac129': 'legendre_elliptic',
+    'b7cfb3': 'legendre_elliptic',
+    '087a7c': 'legendre_elliptic',
+    'a6c07e': 'legendre_elliptic',
+    'be3e09': 'legendre_elliptic',
+    'efc7a4': 'legendre_elliptic',
+    '1b881e': 'legendre_elliptic',
+    '2ef763': 'legendre_elliptic',
+    'a14442': 'legendre_elliptic',
+    '75e141': 'legendre_elliptic',
+    'f35a37': 'legendre_elliptic',
+    '51a946': 'legendre_elliptic',
+    '2573ba': 'legendre_elliptic',
+    'b62aae': 'legendre_elliptic',
+    'dec0d2': 'legendre_elliptic',
+    '2245df': 'legendre_elliptic',
+    '3aed02': 'legendre_elliptic',
+    'd88dd1': 'legendre_elliptic',
+    '4dabda': 'legendre_elliptic',
+    'eba27c': 'legendre_elliptic',
+    'f0bcb5': 'legendre_elliptic',
+    '713966': 'legendre_elliptic',
+    '8e5c81': 'legendre_elliptic',
+    'b0eb37': 'legendre_elliptic',
+    'aa1b8e': 'legendre_elliptic',
+    '255d81': 'legendre_elliptic',
+    '685126': 'legendre_elliptic',
+    'c28288': 'legendre_elliptic',
+    '5f84d9': 'legendre_elliptic',
+    'b760d1': 'legendre_elliptic',
+    '16d2e1': 'legendre_elliptic',
+    '752619': 'legendre_elliptic',
+    '0cc11f': 'legendre_elliptic',
+    '6520e7': 'legendre_elliptic',
+    '9ccaef': 'legendre_elliptic',
+    '41cf8e': 'legendre_elliptic',
+    '94f646': 'legendre_elliptic',
+    '55d23d': 'legendre_elliptic',
+    'e2445d': 'legendre_elliptic',
+    'f48f54': 'legendre_elliptic',
+    '8f4e31': 'legendre_elliptic',
+    '5cd377': 'carlson_elliptic',
+    '8f7c2a': 'carlson_elliptic',
+    'bac745': 'carlson_elliptic',
+    '132ec5': 'carlson_elliptic',
+    '663d75': 'carlson_elliptic',
+    'b0921b': 'carlson_elliptic',
+    '6ae152': 'carlson_elliptic',
+    'cc234c': 'carlson_elliptic',
+    '61f98d': 'carlson_elliptic',
+    '409873': 'carlson_elliptic',
+    '655f6b': 'carlson_elliptic',
+    'cc4cd8': 'carlson_elliptic',
+    'c90834': 'carlson_elliptic',
+    '9c9173': 'carlson_elliptic',
+    '8bac89': 'carlson_elliptic',
+    '671fcb': 'carlson_elliptic',
+    '7aa9be': 'carlson_elliptic',
+    'da33ce': 'carlson_elliptic',
+    'ba7b32': 'carlson_elliptic',
+    '8236ff': 'carlson_elliptic',
+    '0ba30f': 'carlson_elliptic',
+    'c56825': 'carlson_elliptic',
+    '583c27': 'carlson_elliptic',
+    '114f9e': 'carlson_elliptic',
+    '73cf98': 'carlson_elliptic',
+    '0d3186': 'carlson_elliptic',
+    'f9b773': 'carlson_elliptic',
+    'b8ca70': 'carlson_elliptic',
+    '9673f7': 'carlson_elliptic',
+    '6923d5': 'carlson_elliptic',
+    'f29729': 'carlson_elliptic',
+    'b478a1': 'carlson_elliptic',
+    '655a2b': 'carlson_elliptic',
+    '1e8061': 'carlson_elliptic',
+    '7a168a': 'carlson_elliptic',
+    'f9ca94': 'carlson_elliptic',
+    '4e21c7': 'carlson_elliptic',
+    '197a91': 'carlson_elliptic',
+    'a839d5': 'carlson_elliptic',
+    '2499cd': 'carlson_elliptic',
+    '8e6189': 'carlson_elliptic',
+    '47cf5d': 'carlson_elliptic',
+    '31a3ba': 'carlson_elliptic',
+    '791c44': 'carlson_elliptic',
+    '8f5d76': 'carlson_elliptic',
+    '7609c8': 'carlson_elliptic',
+    '6dda7a': 'carlson_elliptic',
+    '38fa65': 'carlson_elliptic',
+    '4eac3f': 'carlson_elliptic',
+    'a203e9': 'carlson_elliptic',
+    '9357b9': 'carlson_elliptic',
+    'dab889': 'carlson_elliptic',
+    '02a8d7': 'carlson_elliptic',
+    'f3b8dc': 'carlson_elliptic',
+    '944a14': 'carlson_elliptic',
+    'da16db': 'carlson_elliptic',
+    '7fbbe8': 'carlson_elliptic',
+    '9a0bc8': 'carlson_elliptic',
+    '8f0a91': 'carlson_elliptic',
+    '0d8639': 'carlson_elliptic',
+    '5f0adb': 'carlson_elliptic',
+    '638fa6': 'carlson_elliptic',
+    'ce327b': 'carlson_elliptic',
+    '3e1435': 'carlson_elliptic',
+    '644d75': 'carlson_elliptic',
+    'de8485': 'carlson_elliptic',
+    '741859': 'carlson_elliptic',
+    'b576e6': 'carlson_elliptic',
+    'a82bd6': 'carlson_elliptic',
+    '72b5bd': 'carlson_elliptic',
+    'b2fdfe': 'carlson_elliptic',
+    'e98dd0': 'carlson_elliptic',
+    '9bfd88': 'carlson_elliptic',
+    'bbf003': 'carlson_elliptic',
+    '13f252': 'carlson_elliptic',
+    '4cb707': 'carlson_elliptic',
+    '2443de': 'carlson_elliptic',
+    'a21395': 'carlson_elliptic',
+    'da47f6': 'carlson_elliptic',
+    '0a7f30': 'carlson_elliptic',
+    '8f71cb': 'carlson_elliptic',
+    'fda084': 'carlson_elliptic',
+    'b2cd79': 'carlson_elliptic',
+    'e93f43': 'carlson_elliptic',
+    '7ded8f': 'carlson_elliptic',
+    '42c7f1': 'carlson_elliptic',
+    '8d304b': 'carlson_elliptic',
+    'e1a3fb': 'carlson_elliptic',
+    'cbcad9': 'carlson_elliptic',
+    'd0c9ff': 'carlson_elliptic',
+    '00c331': 'carlson_elliptic',
+    '37ffb7': 'carlson_elliptic',
+    '5a8f57': 'carlson_elliptic',
+    '7314c4': 'carlson_elliptic',
+    'b4a735': 'carlson_elliptic',
+    'a1f7ea': 'carlson_elliptic',
+    'c5d388': 'carlson_elliptic',
+    '2c1df7': 'carlson_elliptic',
+    'b81ca0': 'carlson_elliptic',
+    '926b36': 'carlson_elliptic',
+    '799894': 'carlson_elliptic',
+    '618a9f': 'carlson_elliptic',
+    'c03f78': 'carlson_elliptic',
+    '1d2811': 'carlson_elliptic',
+    '07584a': 'carlson_elliptic',
+    'edcf6c': 'carlson_elliptic',
+    'a4e47f': 'carlson_elliptic',
+    'd3b39c': 'carlson_elliptic',
+    '230a49': 'carlson_elliptic',
+    '34e932': 'carlson_elliptic',
+    '688efb': 'carlson_elliptic',
+    '978287': 'carlson_elliptic',
+    '0e209c': 'carlson_elliptic',
+    '2e40b8': 'carlson_elliptic',
+    '62eade': 'carlson_elliptic',
+    '36ae10': 'carlson_elliptic',
+    'add3ea': 'carlson_elliptic',
+    '60541a': 'carlson_elliptic',
+    'd70b12': 'carlson_elliptic',
+    '255142': 'carlson_elliptic',
+    '398bb7': 'carlson_elliptic',
+    '7a9dad': 'carlson_elliptic',
+    '2cdd2f': 'carlson_elliptic',
+    '584a61': 'carlson_elliptic',
+    '423b36': 'carlson_elliptic',
+    '33e034': 'carlson_elliptic',
+    'd9765b': 'carlson_elliptic',
+    '124339': 'carlson_elliptic',
+    '5c2b08': 'carlson_elliptic',
+    '1acb07': 'carlson_elliptic',
+    'e464ec': 'carlson_elliptic',
+    'd38c27': 'carlson_elliptic',
+    'eac389': 'carlson_elliptic',
+    'a15c03': 'carlson_elliptic',
+    '35cb93': 'carlson_elliptic',
+    '56d1bc': 'carlson_elliptic',
+    '25435b': 'carlson_elliptic',
+    '7ea1ad': 'carlson_elliptic',
+    '7cbe17': 'carlson_elliptic',
+    'ff58cf': 'carlson_elliptic',
+    'ad96f4': 'carlson_elliptic',
+    '09a494': 'carlson_elliptic',
+    'b136bd': 'carlson_elliptic',
+    '8c9ba1': 'carlson_elliptic',
+    '7348e3': 'carlson_elliptic',
+    '5ada5f': 'carlson_elliptic',
+    '718f3a': 'carlson_elliptic',
+    'de0638': 'carlson_elliptic',
+    '00cdb7': 'carlson_elliptic',
+    'bc2f88': 'carlson_elliptic',
+    '4becdd': 'carlson_elliptic',
+    '7b5755': 'carlson_elliptic',
+    '0cf60d': 'carlson_elliptic',
+    'eb1d4f': 'carlson_elliptic',
+    '157ebb': 'carlson_elliptic',
+    'e39456': 'carlson_elliptic',
+    '9a95a5': 'carlson_elliptic',
+    '8bb972': 'carlson_elliptic',
+    'c166ca': 'carlson_elliptic',
+    '4cd504': 'carlson_elliptic',
+    '0bf328': 'carlson_elliptic',
+    '28237a': 'carlson_elliptic',
+    'f1dd8a': 'carlson_elliptic',
+    '4c1988': 'carlson_elliptic',
+    '6c4567': 'carlson_elliptic',
+    '90af98': 'carlson_elliptic',
+    '3a84d6': 'carlson_elliptic',
+    '6674bb': 'carlson_elliptic',
+    '5c178f': 'carlson_elliptic',
+    'e30d7e': 'carlson_elliptic',
+    '67e015': 'carlson_elliptic',
+    '8519dd': 'carlson_elliptic',
+    'cf5caa': 'carlson_elliptic',
+    '13a092': 'carlson_elliptic',
+    '53d869': 'carlson_elliptic',
+    'ab5af3': 'carlson_elliptic',
+    '415ff0': 'carlson_elliptic',
+    '0ed5e2': 'carlson_elliptic',
+    'e54e61': 'carlson_elliptic',
+    '538c8c': 'carlson_elliptic',
+    '271b73': 'carlson_elliptic',
+    '63d11e': 'carlson_elliptic',
+    'ebaa1a': 'carlson_elliptic',
+    '649dc0': 'carlson_elliptic',
+    '9b0388': 'carlson_elliptic',
+    '5ab6bf': 'carlson_elliptic',
+    '23e0a7': 'carlson_elliptic',
+    'bcc121': 'carlson_elliptic',
+    'd5ff09': 'carlson_elliptic',
+    'cd55cf': 'carlson_elliptic',
+    '250ff1': 'carlson_elliptic',
+    '4d7098': 'carlson_elliptic',
+    'd51efc': 'carlson_elliptic',
+    '84f403': 'carlson_elliptic',
+    '9e30e7': 'carlson_elliptic',
+    'c5a9cf': 'carlson_elliptic',
+    'd829be': 'carlson_elliptic',
+    '3f6d40': 'carlson_elliptic',
+    'cdb587': 'carlson_elliptic',
+    '7cddc6': 'carlson_elliptic',
+    '3f1547': 'carlson_elliptic',
+    '7c50d1': 'carlson_elliptic',
+    'a2e9dd': 'carlson_elliptic',
+    '48333c': 'carlson_elliptic',
+    '5d0c95': 'carlson_elliptic',
+    '120284': 'carlson_elliptic',
+    '990145': 'carlson_elliptic',
+    '092716': 'carlson_elliptic',
+    '4091ad': 'carlson_elliptic',
+    '55cd70': 'carlson_elliptic',
+    'f1fd51': 'carlson_elliptic',
+    'b891d1': 'carlson_elliptic',
+    '64a808': 'carlson_elliptic',
+    'e9d5a9': 'carlson_elliptic',
+    'b07652': 'carlson_elliptic',
+    'e60205': 'carlson_elliptic',
+    '522f54': 'carlson_elliptic',
+    'b1c84e': 'carlson_elliptic',
+    'a9f190': 'carlson_elliptic',
+    '397051': 'carlson_elliptic',
+    '6e9544': 'carlson_elliptic',
+    'a1414f': 'carlson_elliptic',
+    '9f2b18': 'carlson_elliptic',
+    'c05ed8': 'carlson_elliptic',
+    '7f8a58': 'carlson_elliptic',
+    '44d300': 'carlson_elliptic',
+    '1b6362': 'carlson_elliptic',
+    'fd3017': 'carlson_elliptic',
+    '3567c5': 'carlson_elliptic',
+    '62b0c4': 'carlson_elliptic',
+    'b468f3': 'carlson_elliptic',
+    '78131f': 'carlson_elliptic',
+    'cdee01': 'carlson_elliptic',
+    'e04867': 'carlson_elliptic',
+    '534335': 'carlson_elliptic',
+    '303827': 'carlson_elliptic',
+    'a091d1': 'carlson_elliptic',
+    '4c1db8': 'carlson_elliptic',
+    '1eaaed': 'carlson_elliptic',
+    'e1a3cb': 'carlson_elliptic',
+    '3dd30a': 'carlson_elliptic',
+    '5c6f10': 'carlson_elliptic',
+    'd4b12e': 'carlson_elliptic',
+    '1faf7a': 'carlson_elliptic',
+    '0aa9ac': 'carlson_elliptic',
+    '4c882a': 'carlson_elliptic',
+    'f6b4a2': 'carlson_elliptic',
+    '3b6175': 'carlson_elliptic',
+    '64d87a': 'carlson_elliptic',
+    '849751': 'carlson_elliptic',
+    '980014': 'carlson_elliptic',
+    'dbe634': 'carlson_elliptic',
+    '748131': 'carlson_elliptic',
+    '84ea08': 'carlson_elliptic',
+    '1c0fee': 'carlson_elliptic',
+    'f47947': 'carlson_elliptic',
+    '4d2c10': 'carlson_elliptic',
+    'eda57d': 'carlson_elliptic',
+    '060366': 'carlson_elliptic',
+    '63644d': 'carlson_elliptic',
+    '14a365': 'carlson_elliptic',
+    '2dcf0c': 'carlson_elliptic',
+    'd52bda': 'carlson_elliptic',
+    '545e8b': 'carlson_elliptic',
+    '3047b1': 'carlson_elliptic',
+    '4a2403': 'carlson_elliptic',
+    'f07e9d': 'carlson_elliptic',
+    '3e05c6': 'carlson_elliptic',
+    '61c002': 'carlson_elliptic',
+    '4e4380': 'carlson_elliptic',
+    '8d0629': 'carlson_elliptic',
+    'c85c2f': 'carlson_elliptic',
+    '771801': 'carlson_elliptic',
+    'ccb4d1': 'carlson_elliptic',
+    'f68409': 'carlson_elliptic',
+    '12b1d0': 'carlson_elliptic',
+    '6da738': 'lambertw',
+    'cb0a9b': 'lambertw',
+    '88168b': 'lambertw',
+    'd7136f': 'lambertw',
+    '314807': 'lambertw',
+    '636929': 'lambertw',
+    '8654a3': 'lambertw',
+    'ed7dac': 'lambertw',
+    '30bd5b': 'lambertw',
+    'a172c7': 'lambertw',
+    '0be17d': 'lambertw',
+    'c95c4f': 'lambertw',
+    'b93d09': 'lambertw',
+    'd09380': 'lambertw',
+    '5d4cce': 'lambertw',
+    'c87ff4': 'lambertw',
+    '8e8a59': 'lambertw',
+    'f372e9': 'lambertw',
+    'e1dd64': 'lambertw',
+    '6d936e': 'lambertw',
+    '0d3b91': 'lambertw',
+    '2caf78': 'lambertw',
+    'aca420': 'lambertw',
+    '41ece5': 'lambertw',
+    '17eaad': 'lambertw',
+    'e6e7a2': 'lambertw',
+    'fdfb16': 'lambertw',
+    '276d78': 'lambertw',
+    '6191cd': 'lambertw',
+    'f0f17c': 'lambertw',
+    '766302': 'lambertw',
+    '8d486c': 'lambertw',
+    '72b6ca': 'lambertw',
+    '58c19a': 'lambertw',
+    'c5a8c2': 'lambertw',
+    '0983d1': 'lambertw',
+    'd37d0f': 'lambertw',
+    'adf83a': 'lambertw',
+    'e50532': 'lambertw',
+    '99ff4c': 'lambertw',
+    '1fc63b': 'lambertw',
+    'da0f15': 'lambertw',
+    'c0ae5b': 'lambertw',
+    '6e05c9': 'lambertw',
+    'ee86fb': 'lambertw',
+    '55498b': 'lambertw',
+    '44ad09': 'lambertw',
+    '2d3356': 'lambertw',
+    '21d9a0': 'lambertw',
+    'd5917b': 'lambertw',
+    'bf3e29': 'lambertw',
+    '4257f4': 'lambertw',
+    '82926c': 'lambertw',
+    'e5bba3': 'lambertw',
+    'a68e0e': 'lambertw',
+    'f171a6': 'lambertw',
+    'a34260': 'lambertw',
+    '9be916': 'lambertw',
+    'b3d435': 'lambertw',
+    '8e06be': 'lambertw',
+    '72712c': 'lambertw',
+    '9136b9': 'lambertw',
+    '0eb699': 'lambertw',
+    '214b1c': 'lambertw',
+    'a1e634': 'lambertw',
+    '287e28': 'gcd',
+    'c03ed9': 'gcd',
+    '5daceb': 'gcd',
+    '8b2743': 'gcd',
+    'a0d13f': 'gcd',
+    '99dc4a': 'gcd',
+    '6880d0': 'gcd',
+    '805c7a': 'gcd',
+    '7638c5': 'gcd',
+    '3605cc': 'gcd',
+    '5d03d2': 'gcd',
+    'a9c81e': 'gcd',
+    '272bc8': 'gcd',
+    '67978f': 'gcd',
+    '4f1441': 'gcd',
+    '65cfe5': 'gcd',
+    'b60924': 'gcd',
+    '1277f6': 'gcd',
+    'e3392b': 'gcd',
+    '663d9c': 'gcd',
+    'be5fcd': 'gcd',
+    '965ac0': 'gcd',
+    'e922c4': 'gcd',
+    'f20503': 'gcd',
+    '4d3127': 'gcd',
+    '6572c5': 'gcd',
+    '927e6e': 'gcd',
+    '126f3e': 'gcd',
+    '19ceaa': 'gcd',
+    'af512f': 'gcd',
+    '554b2e': 'gcd',
+    '34378a': 'gcd',
+    'c40be0': 'gcd',
+    '0a7aff': 'gcd',
+    '720766': 'gcd',
+    '8d90e9': 'gcd',
+    '0f26cc': 'gcd',
+    'c6631e': 'gcd',
+    '5fb5e2': 'gcd',
+    '157c33': 'gcd',
+    'c70178': 'gcd',
+    'e19e40': 'gcd',
+    '80f20f': 'gcd',
+    '7a1799': 'gcd',
+    'e352ca': 'gcd',
+    '6fd925': 'gcd',
+    '13ed5e': 'gcd',
+    'bf877e': 'gcd',
+    '945be9': 'gcd',
+    '0bb73e': 'gcd',
+    'b66d1e': 'gcd',
+    '1b47db': 'gcd',
+    'a5ef5f': 'gcd',
+    '633265': 'gcd',
+    '4e5aad': 'gcd',
+    'da7d00': 'gcd',
+    '569278': 'gcd',
+    '258fc7': 'gcd',
+    '14b96c': 'gcd',
+    'f1817f': 'gcd',
+    'dc0823': 'gcd',
+    'e65763': 'gcd',
+    'b36dba': 'gcd',
+    '07ac4a': 'gcd',
+    '959a25': 'gcd',
+    'd4852c': 'gcd',
+    '9500d3': 'gcd',
+    '5781de': 'gcd',
+    'e74d86': 'gcd',
+    '1bbdaf': 'gcd',
+    '646745': 'gcd',
+    'cb9f61': 'gcd',
+    '4366b2': 'gcd',
+    '1cde02': 'gcd',
+    '8dc1c9': 'gcd',
+    'c4a892': 'gcd',
+    '1d1653': 'gcd',
+    '7009cc': 'gcd',
+    '8621f6': 'gcd',
+    'fbe121': 'gcd',
+    '5aad5c': 'gcd',
+    '250a45': 'gcd',
+    '062423': 'gcd',
+    '499cfc': 'gcd',
+    '25986e': 'gcd',
+    '6cefd7': 'gcd',
+    'fdae67': 'gcd',
+    'da45c0': 'gcd',
+    '7b27cd': 'gcd',
+    '4099d2': 'gcd',
+    'aaef97': 'gcd',
+    'c24323': 'gcd',
+    '125606': 'gcd',
+    '56acd6': 'gcd',
+    'f91d1c': 'gcd',
+    'b43dac': 'gcd',
+    '10ed14': 'gcd',
+    '81aeba': 'factorials',
+    'def588': 'factorials',
+    '579595': 'factorials',
+    '3c2469': 'factorials',
+    '3009a7': 'factorials',
+    'fb5d88': 'factorials',
+    '29741c': 'factorials',
+    '63f368': 'factorials',
+    '55bf43': 'factorials',
+    '788fa4': 'factorials',
+    '19f13b': 'factorials',
+    'a5852d': 'factorials',
+    'd8c274': 'factorials',
+    '988310': 'factorials',
+    '8c21f5': 'factorials',
+    '471485': 'factorials',
+    '5b85bf': 'factorials',
+    '1df686': 'factorials',
+    'e78084': 'factorials',
+    '973b2c': 'factorials',
+    '0feb19': 'factorials',
+    '5b414d': 'factorials',
+    'a7b330': 'factorials',
+    '355c22': 'factorials',
+    '0d92f6': 'factorials',
+    '4f20ff': 'factorials',
+    '2362af': 'factorials',
+    '081188': 'factorials',
+    '209fc8': 'factorials',
+    '6e1f13': 'factorials',
+    '56d4ff': 'factorials',
+    '02ee06': 'factorials',
+    'd651d1': 'factorials',
+    'c640bf': 'factorials',
+    '41f950': 'factorials',
+    'fe9fb7': 'factorials',
+    '62c6c9': 'factorials',
+    'e87c43': 'factorials',
+    '332721': 'factorials',
+    '1d5e92': 'factorials',
+    '22ee07': 'factorials',
+    'c733f7': 'factorials',
+    'e78989': 'factorials',
+    '30652c': 'factorials',
+    '6f7746': 'factorials',
+    '7c014b': 'factorials',
+    '858c8f': 'factorials',
+    '4d1365': 'factorials',
+    '65c610': 'factorials',
+    '50f57e': 'factorials',
+    '2b2066': 'factorials',
+    'c9bcf7': 'factorials',
+    'bb8a75': 'factorials',
+    'f9efd0': 'factorials',
+    '25b7bd': 'factorials',
+    '6b3af0': 'factorials',
+    '001a0b': 'factorials',
+    '5d6f99': 'factorials',
+    '4e7120': 'factorials',
+    'fc8d5d': 'factorials',
+    '1745f5': 'factorials',
+    'd3baaf': 'factorials',
+    '5f7334': 'factorials',
+    '433d8b': 'factorials',
+    'fa3b53': 'factorials',
+    'fe11ce': 'fibonacci',
+    'ce6dd0': 'fibonacci',
+    'b506ad': 'fibonacci',
+    '5818e3': 'fibonacci',
+    '22dc6e': 'fibonacci',
+    '6d437c': 'fibonacci',
+    'a8f2ac': 'fibonacci',
+    '10165f': 'fibonacci',
+    '7ef2c7': 'fibonacci',
+    'cbfe21': 'fibonacci',
+    '5cb57e': 'fibonacci',
+    'a104b0': 'fibonacci',
+    '70878b': 'fibonacci',
+    '35956b': 'fibonacci',
+    '2ca869': 'fibonacci',
+    '5745bd': 'fibonacci',
+    'fc4fd1': 'fibonacci',
+    '073466': 'fibonacci',
+    'ab563e': 'fibonacci',
+    '8db61e': 'fibonacci',
+    '301081': 'fibonacci',
+    '24107d': 'fibonacci',
+    '050fdb': 'fibonacci',
+    'ad0d7a': 'fibonacci',
+    '8a548e': 'fibonacci',
+    '0e2425': 'fibonacci',
+    '3a9c67': 'fibonacci',
+    '05209f': 'fibonacci',
+    'd0d91a': 'fibonacci',
+    '9638c1': 'fibonacci',
+    'd7c89c': 'fibonacci',
+    'b8ed8f': 'fibonacci',
+    '12b336': 'fibonacci',
+    'fd732d': 'fibonacci',
+    'bceed4': 'fibonacci',
+    'c4d78a': 'fibonacci',
+    'aadf90': 'fibonacci',
+    '223ce1': 'fibonacci',
+    'ae76a3': 'fibonacci',
+    '1c90fb': 'fibonacci',
+    '90c290': 'fibonacci',
+    '4b3947': 'fibonacci',
+    '7b0abf': 'fibonacci',
+    'aaa244': 'fibonacci',
+    '6db705': 'fibonacci',
+    'c84407': 'fibonacci',
+    'a0206a': 'fibonacci',
+    '4ec333': 'fibonacci',
+    'f5f706': 'fibonacci',
+    '9d26d2': 'fibonacci',
+    '1eb5e7': 'fibonacci',
+    '3bb7e4': 'fibonacci',
+    '5eb446': 'fibonacci',
+    '82373a': 'fibonacci',
+    'ac4d13': 'fibonacci',
+    'f95561': 'fibonacci',
+    'd454a3': 'fibonacci',
+    '0574c1': 'fibonacci',
+    'fdfdcc': 'fibonacci',
+    'd56025': 'fibonacci',
+    'f3aff5': 'fibonacci',
+    '9c53d7': 'fibonacci',
+    '412334': 'fibonacci',
+    'ae9d30': 'fibonacci',
+    '344963': 'fibonacci',
+    'da1873': 'fibonacci',
+    '22b67a': 'fibonacci',
+    '6d8bf0': 'fibonacci',
+    '09e2ed': 'gamma',
+    'c6038c': 'gamma',
+    '7ddf69': 'gamma',
+    'aa967b': 'gamma',
+    'b0f293': 'gamma',
+    'c7d4c2': 'gamma',
+    'f1d31a': 'gamma',
+    'e68d11': 'gamma',
+    '19d480': 'gamma',
+    'f826a6': 'gamma',
+    '48ac55': 'gamma',
+    '78f1f4': 'gamma',
+    '639d91': 'gamma',
+    '14af98': 'gamma',
+    '56d710': 'gamma',
+    'b510b6': 'gamma',
+    'a787eb': 'gamma',
+    '90a1e1': 'gamma',
+    'a26ac7': 'gamma',
+    '774d37': 'gamma',
+    '4e4e0f': 'gamma',
+    '661054': 'gamma',
+    '37a95a': 'gamma',
+    '8cf1fd': 'gamma',
+    '53a2a1': 'gamma',
+    '6d0a95': 'gamma',
+    '798c5d': 'gamma',
+    '2870f0': 'gamma',
+    '34d6ae': 'gamma',
+    'd086bd': 'gamma',
+    '9a44c5': 'gamma',
+    'a76328': 'gamma',
+    'd7d2a0': 'gamma',
+    'ee56b9': 'gamma',
+    'b7a578': 'gamma',
+    'd16cb4': 'gamma',
+    '6430cc': 'gamma',
+    '1bbbc7': 'gamma',
+    'e010c9': 'gamma',
+    'b05f2b': 'gamma',
+    '2a47d7': 'gamma',
+    'a0ca3e': 'gamma',
+    '2398a1': 'gamma',
+    '99a9c6': 'gamma',
+    'f50ec9': 'gamma',
+    '143002': 'gamma',
+    'b7fec0': 'gamma',
+    '80f7dc': 'gamma',
+    '931d89': 'gamma',
+    '1976db': 'gamma',
+    'c7b921': 'gamma',
+    '94db60': 'gamma',
+    '513a30': 'gamma',
+    '4a2ac8': 'gamma',
+    'dd5e3a': 'gamma',
+    'e0b322': 'gamma',
+    '7af1b9': 'gamma',
+    '06260c': 'gamma',
+    'cb5071': 'gamma',
+    '0010f3': 'legendre_polynomial',
+    '367ac2': 'legendre_polynomial',
+    '27688e': 'legendre_polynomial',
+    '925fdf': 'legendre_polynomial',
+    '9bdf22': 'legendre_polynomial',
+    '217521': 'legendre_polynomial',
+    'd77f0a': 'legendre_polynomial',
+    '9b7f05': 'legendre_polynomial',
+    'a17386': 'legendre_polynomial',
+    '13f971': 'legendre_polynomial',
+    'a7ac51': 'legendre_polynomial',
+    '3df748': 'legendre_polynomial',
+    '674afa': 'legendre_polynomial',
+    '85eebc': 'legendre_polynomial',
+    'd84519': 'legendre_polynomial',
+    '4cfeac': 'legendre_polynomial',
+    'e36542': 'legendre_polynomial',
+    'c5dd9b': 'legendre_polynomial',
+    'f0569a': 'legendre_polynomial',
+    '7a85b7': 'legendre_polynomial',
+    '9395fc': 'legendre_polynomial',
+    'f55f0a': 'legendre_polynomial',
+    '3c87b9': 'legendre_polynomial',
+    '6cd4a1': 'legendre_polynomial',
+    '859445': 'legendre_polynomial',
+    '1ba9a5': 'legendre_polynomial',
+    '155343': 'legendre_polynomial',
+    'ef4b53': 'legendre_polynomial',
+    'b786ad': 'legendre_polynomial',
+    '60ac50': 'legendre_polynomial',
+    '59e5df': 'legendre_polynomial',
+    '3b175b': 'legendre_polynomial',
+    '6476bd': 'legendre_polynomial',
+    '40fa59': 'legendre_polynomial',
+    'd36fd7': 'legendre_polynomial',
+    '99e62f': 'legendre_polynomial',
+    '7680d3': 'legendre_polynomial',
+    '22a42f': 'legendre_polynomial',
+    '415911': 'legendre_polynomial',
+    'df439e': 'legendre_polynomial',
+    '0745ee': 'legendre_polynomial',
+    'b2d723': 'legendre_polynomial',
+    'c8d10e': 'legendre_polynomial',
+    '227d60': 'legendre_polynomial',
+    '1a0c43': 'chebyshev',
+    'd4e9aa': 'chebyshev',
+    '85e42e': 'chebyshev',
+    'fd8310': 'chebyshev',
+    'c76e72': 'chebyshev',
+    'be5652': 'chebyshev',
+    '48765b': 'chebyshev',
+    '75eacb': 'chebyshev',
+    '9001e6': 'chebyshev',
+    'fc5d42': 'chebyshev',
+    '2760e7': 'chebyshev',
+    'a46d91': 'chebyshev',
+    '42102c': 'chebyshev',
+    'e03fa4': 'chebyshev',
+    'be9a45': 'chebyshev',
+    '2a5337': 'chebyshev',
+    '7d111e': 'chebyshev',
+    '7a7d1d': 'chebyshev',
+    'ce39ac': 'chebyshev',
+    '3d25dd': 'chebyshev',
+    'b5a25e': 'chebyshev',
+    'db2b0a': 'chebyshev',
+    '6a24ab': 'chebyshev',
+    '88aeb6': 'chebyshev',
+    '9093a3': 'chebyshev',
+    '78f5bb': 'chebyshev',
+    '2c26a1': 'chebyshev',
+    '473c36': 'chebyshev',
+    '3d77ab': 'chebyshev',
+    '0ed026': 'chebyshev',
+    '30b67b': 'chebyshev',
+    'faeed9': 'chebyshev',
+    'd1ef91': 'chebyshev',
+    '8a785a': 'chebyshev',
+    '303204': 'chebyshev',
+    '7b2c26': 'chebyshev',
+    'ce5e03': 'chebyshev',
+    '0649c9': 'chebyshev',
+    '844561': 'chebyshev',
+    '7e882c': 'chebyshev',
+    'ed5222': 'chebyshev',
+    '4b83c6': 'chebyshev',
+    'de0968': 'chebyshev',
+    '82288c': 'chebyshev',
+    '5f09f4': 'chebyshev',
+    'fda800': 'chebyshev',
+    '2fc479': 'chebyshev',
+    'b8fdcd': 'chebyshev',
+    'f4b3fa': 'chebyshev',
+    '4c7aeb': 'chebyshev',
+    '9789ee': 'chebyshev',
+    '0cbe75': 'chebyshev',
+    '61375f': 'chebyshev',
+    'fdf80d': 'chebyshev',
+    '42eb01': 'chebyshev',
+    '5bd0ec': 'chebyshev',
+    '305a29': 'chebyshev',
+    'f5fa23': 'chebyshev',
+    'ae791d': 'chebyshev',
+    '4f3e30': 'chebyshev',
+    '99aa38': 'chebyshev',
+    'e9232b': 'chebyshev',
+    '4e914f': 'chebyshev',
+    '50cb6b': 'chebyshev',
+    'a9077a': 'chebyshev',
+    '382679': 'chebyshev',
+    'ce9a39': 'chebyshev',
+    '685d1a': 'chebyshev',
+    'b5049d': 'chebyshev',
+    '27b2bb': 'chebyshev',
+    '9d7c61': 'chebyshev',
+    'fff8ff': 'chebyshev',
+    '1a0d11': 'chebyshev',
+    '05fe07': 'chebyshev',
+    '35e13b': 'chebyshev',
+    '12ce84': 'chebyshev',
+    '9d66de': 'chebyshev',
+    'a68f0e': 'chebyshev',
+    'b6b014': 'chebyshev',
+    '6582c4': 'chebyshev',
+    'e1797b': 'chebyshev',
+    '15dd69': 'chebyshev',
+    '3c662e': 'chebyshev',
+    'c718ea': 'chebyshev',
+    '0b3fd6': 'chebyshev',
+    '443759': 'chebyshev',
+    '2a4b9d': 'chebyshev',
+    'b0c84b': 'chebyshev',
+    '2ada0f': 'chebyshev',
+    '54be3e': 'chebyshev',
+    'f61927': 'chebyshev',
+    'ed210c': 'log',
+    '4fe0ff': 'log',
+    '07731b': 'log',
+    '699c83': 'log',
+    'd496b8': 'log',
+    'c331da': 'log',
+    '2f1f7b': 'log',
+    '4538ba': 'log',
+    'c464e3': 'log',
+    'ddc8a1': 'log',
+    '940c48': 'log',
+    'b5ded1': 'log',
+    'ed6590': 'log',
+    'c1bee1': 'log',
+    'a2189a': 'log',
+    'cbfd70': 'log',
+    '1d447b': 'log',
+    '13895b': 'log',
+    '099b19': 'log',
+    'fbfb81': 'log',
+    'dcc1e5': 'log',
+    '4986ed': 'log',
+    '792c76': 'log',
+    'd87f6e': 'log',
+    '4c1e1e': 'log',
+    'a3a253': 'log',
+    'c43533': 'log',
+    'f67fa2': 'log',
+    '0ba9b2': 'log',
+    '77aa12': 'log',
+    'c77f9a': 'log',
+    'e4f73a': 'log',
+    'a4ac32': 'log',
+    'f5e153': 'partitions',
+    '3eae25': 'partitions',
+    '856db2': 'partitions',
+    '9933df': 'partitions',
+    'cebe1b': 'partitions',
+    'e84642': 'partitions',
+    'b2583f': 'partitions',
+    '7ef291': 'partitions',
+    '6018a4': 'partitions',
+    'cd3013': 'partitions',
+    '599417': 'partitions',
+    'acdce8': 'partitions',
+    '4d2e45': 'partitions',
+    'd8e37d': 'partitions',
+    '89260d': 'partitions',
+    'dacd74': 'partitions',
+    'f7407a': 'partitions',
+    'df3c07': 'partitions',
+    'd72123': 'partitions',
+    'e1f15b': 'partitions',
+    '7697af': 'partitions',
+    'fb7a63': 'partitions',
+    '5adbc3': 'partitions',
+    'afd27a': 'partitions',
+    'e0a6a2': 'riemann_zeta',
+    '669509': 'riemann_zeta',
+    '3131df': 'riemann_zeta',
+    'da2fdb': 'riemann_zeta',
+    '1d46d4': 'riemann_zeta',
+    '8f5e66': 'riemann_zeta',
+    'a01b6e': 'riemann_zeta',
+    'e84983': 'riemann_zeta',
+    '72ccda': 'riemann_zeta',
+    '51fd98': 'riemann_zeta',
+    '9ee8bc': 'riemann_zeta',
+    '1a63af': 'riemann_zeta',
+    '7cb17f': 'riemann_zeta',
+    'e50a56': 'riemann_zeta',
+    'e93ca8': 'riemann_zeta',
+    '809bc0': 'riemann_zeta',
+    '3a5eb6': 'riemann_zeta',
+    '792f7b': 'riemann_zeta',
+    'd31b04': 'riemann_zeta',
+    'e37535': 'riemann_zeta',
+    '69348a': 'riemann_zeta',
+    '8b5ddb': 'riemann_zeta',
+    '52c4ab': 'riemann_zeta',
+    'fdb94b': 'riemann_zeta',
+    '36a095': 'riemann_zeta',
+    '9a258f': 'riemann_zeta',
+    '2e1ff3': 'riemann_zeta',
+    'a78abc': 'riemann_zeta',
+    '692e42': 'riemann_zeta',
+    'cbbf16': 'riemann_zeta',
+    '60c2ec': 'riemann_zeta',
+    'e6ff64': 'riemann_zeta',
+    '945fa5': 'riemann_zeta',
+    'c0ae99': 'riemann_zeta',
+    'dc558b': 'riemann_zeta',
+    '2e1cc7': 'riemann_zeta',
+    '71d9d9': 'riemann_zeta',
+    'c03de4': 'riemann_zeta',
+    '9fa2a1': 'riemann_zeta',
+    '49704a': 'riemann_zeta',
+    'bfaeb5': 'riemann_zeta',
+    '3142ec': 'riemann_zeta',
+    'e4287f': 'riemann_zeta',
+    '22ab47': 'riemann_zeta',
+    'a71ddd': 'riemann_zeta',
+    '7783f9': 'riemann_zeta',
+    'cf70ce': 'riemann_zeta',
+    '432bee': 'riemann_zeta',
+    'fcab61': 'riemann_zeta',
+    'cce75b': 'riemann_zeta',
+    '081205': 'riemann_zeta',
+    'd8d820': 'riemann_zeta',
+    'faf448': 'riemann_zeta',
+    '706f66': 'riemann_zeta',
+    '64bd32': 'riemann_zeta',
+    'e68f82': 'riemann_zeta',
+    'a5d65f': 'riemann_zeta',
+    '8f8fb7': 'riemann_zeta',
+    'd10029': 'riemann_zeta',
+    'b1a2e1': 'riemann_zeta',
+    '60c6da': 'riemann_zeta',
+    '411f3b': 'riemann_zeta',
+    '51206a': 'riemann_zeta',
+    '8ae153': 'riemann_zeta',
+    'b6808d': 'riemann_zeta',
+    '70a705': 'riemann_zeta',
+    'e5bd3c': 'riemann_zeta',
+    '569d5c': 'riemann_zeta',
+    '687b4d': 'riemann_zeta',
+    'a41c92': 'riemann_zeta',
+    '1dec0d': 'riemann_zeta',
+    '463077': 'integrals',
+    '02e3d2': 'integrals',
+    '9a06fb': 'integrals',
+    'f8de2e': 'integrals',
+    '16a1f4': 'integrals',
+    'b77faf': 'integrals',
+    '66fefb': 'integrals',
+    '9ac289': 'airy',
+    '5a9d3f': 'airy',
+    'b4c968': 'airy',
+    'fa65f3': 'airy',
+    '51b241': 'airy',
+    'de9800': 'airy',
+    '693cfe': 'airy',
+    '807917': 'airy',
+    '9a8d4d': 'airy',
+    'fba07c': 'airy',
+    'b2e9d0': 'airy',
+    '70ec9f': 'airy',
+    'eadca2': 'airy',
+    '01bbb6': 'airy',
+    'bd319e': 'airy',
+    '20e530': 'airy',
+    '4d65e5': 'airy',
+    'def37e': 'airy',
+    '1f0577': 'airy',
+    '90f31e': 'airy',
+    'b88f65': 'airy',
+    '7194d4': 'airy',
+    'd1f9d0': 'airy',
+    'a2df77': 'airy',
+    'b4165c': 'bessel',
+    '5bb42e': 'bessel',
+    '8ac81d': 'bessel',
+    'ff93d0': 'bessel',
+    'ad9caa': 'bessel',
+    '62f23c': 'bessel',
+    '95e561': 'bessel',
+    'fd9add': 'bessel',
+    'f1afc0': 'bessel',
+    '8b6264': 'bessel',
+    '5aceb9': 'bessel',
+    '40aeb6': 'bessel',
+    '2488bb': 'bessel',
+    '68cc2f': 'bessel',
+    'd56914': 'bessel',
+    'b6d600': 'bessel',
+    '15ac84': 'bessel',
+    '9b2f38': 'bessel',
+    'e85dee': 'bessel',
+    'c0247f': 'bessel',
+    '81ffcd': 'bessel',
+    '58d91f': 'bessel',
+    'a0ff0b': 'bessel',
+    'e284d7': 'bessel',
+    '807f3f': 'bessel',
+    '4fb391': 'bessel',
+    '9d98f8': 'bessel',
+    'f303c9': 'bessel',
+    'e233b0': 'bessel',
+    '7377c8': 'bessel',
+    'ecd36f': 'bessel',
+    '81eec6': 'bessel',
+    'b049dc': 'bessel',
+    '7efe21': 'bessel',
+    '98703d': 'bessel',
+    '9ad254': 'bessel',
+    '32e162': 'bessel',
+    '127f05': 'bessel',
+    '54bce2': 'bessel',
+    'afbd22': 'bessel',
+    '86bc7d': 'bessel',
+    '15bbb1': 'bessel',
+    '2a4195': 'bessel',
+    'd5b7e8': 'bessel',
+    '24d383': 'bessel',
+    'd154dd': 'bessel',
+    '6a6a09': 'bessel',
+    '1dce21': 'bessel',
+    '99c077': 'bessel',
+    'cac83e': 'bessel',
+    '7ae3ed': 'bessel',
+    'c29d6f': 'bessel',
+    '3bffa9': 'bessel',
+    'e7b5be': 'bessel',
+    '7f3485': 'bessel',
+    '0836b4': 'bessel',
+    'cc4572': 'bessel',
+    '621a9b': 'bessel',
+    '121b21': 'bessel',
+    'a2a294': 'bessel',
+    '5679f2': 'bessel',
+    '4dfd41': 'bessel',
+    '8472cc': 'bessel',
+    '5d9c43': 'bessel',
+    'a59981': 'bessel',
+    '65647f': 'bessel',
+    '7ac286': 'bessel',
+    'd1f5c5': 'bessel',
+    '0c09cc': 'bessel',
+    '685892': 'bessel',
+    'd39c46': 'bessel',
+    'e72e96': 'bessel',
+    'fda595': 'bessel',
+    '49d754': 'bessel',
+    'c362e8': 'bessel',
+    '8b2cb9': 'coulomb_wave',
+    'f25e3d': 'coulomb_wave',
+    '16a4e7': 'coulomb_wave',
+    '2b12f4': 'coulomb_wave',
+    '512063': 'coulomb_wave',
+    'ad8df6': 'coulomb_wave',
+    '74274a': 'coulomb_wave',
+    '192a3e': 'coulomb_wave',
+    '8547ab': 'coulomb_wave',
+    '01af55': 'coulomb_wave',
+    'e20938': 'coulomb_wave',
+    '304559': 'coulomb_wave',
+    '4a4739': 'coulomb_wave',
+    'ed2bf6': 'coulomb_wave',
+    'a51a4b': 'coulomb_wave',
+    '2fec14': 'coulomb_wave',
+    '07a654': 'coulomb_wave',
+    'faa118': 'coulomb_wave',
+    'eca10b': 'coulomb_wave',
+    'd280c5': 'coulomb_wave',
+    '2a2f18': 'coulomb_wave',
+    '1976e1': 'coulomb_wave',
+    'e2efbf': 'coulomb_wave',
+    '8027e8': 'coulomb_wave',
+    '69e5fb': 'coulomb_wave',
+    'bcdfc6': 'coulomb_wave',
+    'f0414a': 'coulomb_wave',
+    '781eae': 'coulomb_wave',
+    '0cc301': 'coulomb_wave',
+    'ac8eca': 'bernoulli_numbers',
+    '1f88a4': 'bernoulli_numbers',
+    'aed6bd': 'bernoulli_numbers',
+    '588889': 'bernoulli_numbers',
+    '522b04': 'bernoulli_numbers',
+    'f79ff0': 'bernoulli_numbers',
+    '555e10': 'bernoulli_numbers',
+    '14ecc4': 'bernoulli_numbers',
+    'a98234': 'bernoulli_numbers',
+    'd10873': 'bernoulli_numbers',
+    'a1d2d7': 'bernoulli_numbers',
+    '829185': 'bernoulli_numbers',
+    '03ee0b': 'bernoulli_numbers',
+    '8b4f7f': 'bernoulli_numbers',
+    'c2dcfa': 'bernoulli_numbers',
+    'f80439': 'bernoulli_numbers',
+    '7adfd6': 'bernoulli_numbers',
+    '05202b': 'bernoulli_numbers',
+    'e89eb5': 'bernoulli_numbers',
+    '4aab8a': 'bernoulli_numbers',
+    '0f02a5': 'bernoulli_numbers',
+    '3a1316': 'bernoulli_numbers',
+    '1d2f4a': 'bernoulli_numbers',
+    '69ca86': 'bernoulli_numbers',
+    '292d70': 'bernoulli_numbers',
+    '4246ae': 'bernoulli_numbers',
+    'ff190c': 'bernoulli_numbers',
+    'c33e2b': 'bernoulli_numbers',
+    '778fa2': 'stirling_numbers',
+    '2e9d0c': 'stirling_numbers',
+    '4c6c43': 'stirling_numbers',
+    'f0d72c': 'stirling_numbers',
+    '18ec99': 'stirling_numbers',
+    '9fbe4f': 'stirling_numbers',
+    '071a94': 'stirling_numbers',
+    '21241f': 'stirling_numbers',
+    'f46e0e': 'stirling_numbers',
+    'b823b0': 'stirling_numbers',
+    'b01280': 'stirling_numbers',
+    'a9a610': 'stirling_numbers',
+    '6189b9': 'stirling_numbers',
+    'ea9e2f': 'stirling_numbers',
+    '255576': 'stirling_numbers',
+    '7774a3': 'stirling_numbers',
+    'f88455': 'stirling_numbers',
+    'a93679': 'stirling_numbers',
+    'cecede': 'stirling_numbers',
+    'ea4754': 'gaussian_quadrature',
+    '47b181': 'gaussian_quadrature',
+    '545987': 'gaussian_quadrature',
+    '1b1ec5': 'general_functions',
+    'b6582a': 'general_functions',
+    '78bb08': 'general_functions',
+    'ce2272': 'general_functions',
+    'af2d4b': 'general_functions',
+    '77ef0c': 'complex_plane',
+    'a65a14': 'complex_plane',
+    'd7962e': 'complex_plane',
+    'fc0d55': 'complex_plane',
+    '912ff9': 'complex_plane',
+    'c98bad': 'complex_plane',
+    'd1cf0c': 'complex_plane',
+    '40baa9': 'complex_plane',
+    'e03016': 'gauss_hypergeometric',
+    'c43abd': 'gauss_hypergeometric',
+    'ad8db2': 'gauss_hypergeometric',
+    '306ef7': 'gauss_hypergeometric',
+    'fe6e74': 'gauss_hypergeometric',
+    '65693e': 'gauss_hypergeometric',
+    'f1bd89': 'gauss_hypergeometric',
+    '18d955': 'gauss_hypergeometric',
+    '659ce8': 'gauss_hypergeometric',
+    'a85994': 'gauss_hypergeometric',
+    '20bf69': 'gauss_hypergeometric',
+    '0e0393': 'gauss_hypergeometric',
+    '3d6d7e': 'gauss_hypergeometric',
+    '651a4a': 'gauss_hypergeometric',
+    'b25089': 'gauss_hypergeometric',
+    '504717': 'gauss_hypergeometric',
+    '90ac58': 'gauss_hypergeometric',
+    '27bc34': 'gauss_hypergeometric',
+    'db3eb9': 'gauss_hypergeometric',
+    'ca9123': 'gauss_hypergeometric',
+    'c60679': 'gauss_hypergeometric',
+    '853a62': 'gauss_hypergeometric',
+    '316533': 'confluent_hypergeometric',
+    'f565f5': 'confluent_hypergeometric',
+    '512bea': 'confluent_hypergeometric',
+    'cee331': 'confluent_hypergeometric',
+    'd6add6': 'confluent_hypergeometric',
+    '1b9cc5': 'confluent_hypergeometric',
+    'b9cc75': 'confluent_hypergeometric',
+    '4c41ad': 'confluent_hypergeometric',
+    '0a0aec': 'confluent_hypergeometric',
+    'a61f01': 'confluent_hypergeometric',
+    'dec042': 'confluent_hypergeometric',
+    '70111e': 'confluent_hypergeometric',
+    'be533c': 'confluent_hypergeometric',
+    'a047eb': 'confluent_hypergeometric',
+    '9d3147': 'confluent_hypergeometric',
+    '06f229': 'confluent_hypergeometric',
+    'bb5d67': 'confluent_hypergeometric',
+    'c8fcc7': 'confluent_hypergeometric',
+    '4cf1e9': 'confluent_hypergeometric',
+    'f7f84e': 'confluent_hypergeometric',
+    '6cf802': 'confluent_hypergeometric',
+    '18ef23': 'confluent_hypergeometric',
+    '2df3e3': 'confluent_hypergeometric',
+    '325a0e': 'confluent_hypergeometric',
+    '00dfd1': 'confluent_hypergeometric',
+    'd1b3b5': 'confluent_hypergeometric',
+    '99f69c': 'confluent_hypergeometric',
+    '876844': 'confluent_hypergeometric',
+    '279e4f': 'confluent_hypergeometric',
+    '461a54': 'confluent_hypergeometric',
+    '7b91b4': 'confluent_hypergeometric',
+    'e46223': 'error_functions',
+    '7375c0': 'error_functions',
+    'd2914b': 'error_functions',
+    '3be335': 'error_functions',
+    '2aaba8': 'error_functions',
+    '36ef64': 'error_functions',
+    '622772': 'error_functions',
+    '94db18': 'error_functions',
+    'ec0205': 'error_functions',
+    '603a49': 'error_functions',
+    'abadc7': 'error_functions',
+    '98688d': 'error_functions',
+    'cb93ea': 'error_functions',
+    'ae3110': 'error_functions',
+    '7f355d': 'error_functions',
+    'bfc86e': 'error_functions',
+    '01440f': 'error_functions',
+    'b5bd5d': 'error_functions',
+    'fae9d3': 'error_functions',
+    'd7a4e5': 'jacobi_theta',
+    'a75407': 'jacobi_theta',
+    'bac5fb': 'jacobi_theta',
+    '8c9f96': 'jacobi_theta',
+    '56acfe': 'jacobi_theta',
+    'e47bfb': 'jacobi_theta',
+    'd98ccc': 'jacobi_theta',
+    '7902fc': 'jacobi_theta',
+    'c4febd': 'jacobi_theta',
+    'fa8e96': 'jacobi_theta',
+    '80f43a': 'jacobi_theta',
+    '0ce854': 'jacobi_theta',
+    'ad8a9a': 'jacobi_theta',
+    '6636f2': 'jacobi_theta',
+    '9522c6': 'jacobi_theta',
+    'e2035a': 'jacobi_theta',
+    '9b868d': 'jacobi_theta',
+    'c2c002': 'jacobi_theta',
+    'd3b45d': 'jacobi_theta',
+    'f96eac': 'jacobi_theta',
+    '700d94': 'jacobi_theta',
+    '495a98': 'jacobi_theta',
+    '2f97f5': 'jacobi_theta',
+    'd923de': 'jacobi_theta',
+    'ed4ce5': 'jacobi_theta',
+    '7cb651': 'jacobi_theta',
+    '580ba0': 'jacobi_theta',
+    '27c319': 'jacobi_theta',
+    '2ba423': 'jacobi_theta',
+    '06633e': 'jacobi_theta',
+    'f3e75c': 'jacobi_theta',
+    '8a34d1': 'jacobi_theta',
+    '2ae142': 'jacobi_theta',
+    '42d832': 'jacobi_theta',
+    'f551ca': 'jacobi_theta',
+    '1842d9': 'jacobi_theta',
+    '024a84': 'jacobi_theta',
+    'd6a799': 'jacobi_theta',
+    '77aed2': 'jacobi_theta',
+    '2a2a38': 'jacobi_theta',
+    '13d2a1': 'jacobi_theta',
+    '39b699': 'jacobi_theta',
+    '465810': 'jacobi_theta',
+    '21851b': 'jacobi_theta',
+    'd45548': 'jacobi_theta',
+    'd2f183': 'jacobi_theta',
+    '64081c': 'jacobi_theta',
+    '816057': 'jacobi_theta',
+    '3c88a7': 'jacobi_theta',
+    'dfbddd': 'jacobi_theta',
+    'c7f7a5': 'jacobi_theta',
+    '44e8fb': 'jacobi_theta',
+    '1848f1': 'jacobi_theta',
+    '1cdd7b': 'jacobi_theta',
+    'd637c5': 'jacobi_theta',
+    'd81f05': 'jacobi_theta',
+    '561d75': 'jacobi_theta',
+    'a5e568': 'jacobi_theta',
+    '7c90eb': 'jacobi_theta',
+    'df88a0': 'jacobi_theta',
+    '290f36': 'jacobi_theta',
+    'a0ba58': 'jacobi_theta',
+    'f1f42f': 'jacobi_theta',
+    'e4e707': 'jacobi_theta',
+    '0650f8': 'jacobi_theta',
+    'c743eb': 'jacobi_theta',
+    '8a316c': 'jacobi_theta',
+    'dc7c83': 'jacobi_theta',
+    '1cec67': 'jacobi_theta',
+    '4d26ec': 'jacobi_theta',
+    '9b7d8c': 'jacobi_theta',
+    'f8cd8f': 'jacobi_theta',
+    '7b3ac4': 'jacobi_theta',
+    'ab1c77': 'jacobi_theta',
+    '154c44': 'jacobi_theta',
+    'ad1eaf': 'jacobi_theta',
+    'caf10a': 'jacobi_theta',
+    '926b2c': 'jacobi_theta',
+    'fe1b96': 'jacobi_theta',
+    '6b2078': 'jacobi_theta',
+    'cde93e': 'jacobi_theta',
+    '9c1e9a': 'jacobi_theta',
+    'a5c258': 'jacobi_theta',
+    'e8ce0b': 'jacobi_theta',
+    '06319a': 'jacobi_theta',
+    'c4b16c': 'jacobi_theta',
+    'ed8ba7': 'jacobi_theta',
+    '1fa8e7': 'jacobi_theta',
+    'd0dfba': 'jacobi_theta',
+    '28b4c3': 'jacobi_theta',
+    '64f0a5': 'jacobi_theta',
+    'b978f0': 'jacobi_theta',
+    'd11b7f': 'jacobi_theta',
+    '772c88': 'jacobi_theta',
+    '19acd8': 'jacobi_theta',
+    'b9c650': 'jacobi_theta',
+    '4cf228': 'jacobi_theta',
+    'abc1e7': 'jacobi_theta',
+    'fb4b1b': 'jacobi_theta',
+    '20172a': 'jacobi_theta',
+    '9bda2f': 'jacobi_theta',
+    'c4714a': 'jacobi_theta',
+    '03356b': 'jacobi_theta',
+    '3c56c7': 'jacobi_theta',
+    'fc3ef5': 'jacobi_theta',
+    '89e79d': 'jacobi_theta',
+    '4d8b0f': 'jacobi_theta',
+    '100d3c': 'jacobi_theta',
+    '59fd23': 'jacobi_theta',
+    'de7918': 'jacobi_theta',
+    '476642': 'jacobi_theta',
+    '7527f1': 'jacobi_theta',
+    '59184e': 'jacobi_theta',
+    '66eb8b': 'jacobi_theta',
+    'a9cdda': 'jacobi_theta',
+    'e6d333': 'jacobi_theta',
+    '69b32e': 'jacobi_theta',
+    'c92a6f': 'jacobi_theta',
+    '95e508': 'jacobi_theta',
+    '9a2054': 'jacobi_theta',
+    '21c2f7': 'jacobi_theta',
+    'c3d8c2': 'jacobi_theta',
+    'f14471': 'jacobi_theta',
+    '46f244': 'jacobi_theta',
+    'e13fe9': 'jacobi_theta',
+    '7137a2': 'jacobi_theta',
+    'db4e29': 'jacobi_theta',
+    'f12569': 'jacobi_theta',
+    '3479be': 'jacobi_theta',
+    '7e0002': 'jacobi_theta',
+    '0a9ec2': 'jacobi_theta',
+    '686ce0': 'jacobi_theta',
+    'a0a1ee': 'jacobi_theta',
+    '53fef4': 'jacobi_theta',
+    '27b169': 'jacobi_theta',
+    'a255e1': 'jacobi_theta',
+    '0096a8': 'jacobi_theta',
+    'fc3c44': 'jacobi_theta',
+    'a222ed': 'jacobi_theta',
+    '37e644': 'jacobi_theta',
+    'ebc673': 'jacobi_theta',
+    '936694': 'jacobi_theta',
+    'd967af': 'jacobi_theta',
+    'cdbdc7': 'jacobi_theta',
+    'a19141': 'jacobi_theta',
+    '901934': 'jacobi_theta',
+    'f2e28a': 'jacobi_theta',
+    '278274': 'jacobi_theta',
+    'cb493d': 'jacobi_theta',
+    'd41a95': 'jacobi_theta',
+    'a4eecf': 'jacobi_theta',
+    '713b6b': 'jacobi_theta',
+    '64b65d': 'jacobi_theta',
+    '89985a': 'jacobi_theta',
+    '0373dc': 'jacobi_theta',
+    '2853d4': 'jacobi_theta',
+    '378949': 'jacobi_theta',
+    'a0552b': 'jacobi_theta',
+    '775637': 'jacobi_theta',
+    '23077c': 'jacobi_theta',
+    '59f8e1': 'jacobi_theta',
+    'fb55cb': 'jacobi_theta',
+    '380076': 'jacobi_theta',
+    '4f939e': 'jacobi_theta',
+    'a891da': 'jacobi_theta',
+    '2faeb9': 'jacobi_theta',
+    'b46534': 'jacobi_theta',
+    '5cdae6': 'jacobi_theta',
+    'f697d5': 'jacobi_theta',
+    'e56f77': 'jacobi_theta',
+    '4448f1': 'jacobi_theta',
+    'd989cd': 'jacobi_theta',
+    'cd5f45': 'jacobi_theta',
+    '103bfb': 'jacobi_theta',
+    'b83f63': 'jacobi_theta',
+    '43fa0e': 'jacobi_theta',
+    'd29148': 'jacobi_theta',
+    '2e4da0': 'jacobi_theta',
+    '8d6a1d': 'jacobi_theta',
+    '563d18': 'jacobi_theta',
+    '47f6dd': 'jacobi_theta',
+    '7d559c': 'jacobi_theta',
+    'bb2d01': 'jacobi_theta',
+    'd5a29e': 'jacobi_theta',
+    'cc6d21': 'jacobi_theta',
+    '2d2dde': 'jacobi_theta',
+    '429093': 'jacobi_theta',
+    '95988c': 'jacobi_theta',
+    '4c462b': 'jacobi_theta',
+    'ed0756': 'jacobi_theta',
+    '785668': 'jacobi_theta',
+    '0878a4': 'jacobi_theta',
+    '6a7704': 'jacobi_theta',
+    'b3fc6d': 'jacobi_theta',
+    '71d5ee': 'jacobi_theta',
+    '235d0d': 'jacobi_theta',
+    '5d41b1': 'jacobi_theta',
+    '6d918c': 'jacobi_theta',
+    '10ca40': 'jacobi_theta',
+    '5fe58d': 'jacobi_theta',
+    '3a77e0': 'jacobi_theta',
+    'e6dc09': 'jacobi_theta',
+    'aaa582': 'jacobi_theta',
+    'b1d07b': 'jacobi_theta',
+    '20d581': 'jacobi_theta',
+    'ed3ff9': 'jacobi_theta',
+    '794106': 'jacobi_theta',
+    'a94b43': 'jacobi_theta',
+    '8b825c': 'jacobi_theta',
+    '7131cd': 'jacobi_theta',
+    '931201': 'jacobi_theta',
+    '21dc98': 'jacobi_theta',
+    '1792a9': 'jacobi_theta',
+    '5f9e54': 'jacobi_theta',
+    '9a9487': 'jacobi_theta',
+    'f4554f': 'jacobi_theta',
+    'd36e97': 'jacobi_theta',
+    '73eb5d': 'jacobi_theta',
+    '34d1c6': 'jacobi_theta',
+    '47e587': 'jacobi_theta',
+    'ee8617': 'jacobi_theta',
+    'dfea7d': 'jacobi_theta',
+    '9973ef': 'jacobi_theta',
+    '077394': 'jacobi_theta',
+    '45165c': 'jacobi_theta',
+    '75cb8c': 'jacobi_theta',
+    '663a02': 'jacobi_theta',
+    '1feda6': 'jacobi_theta',
+    '89c9e4': 'jacobi_theta',
+    '48a1c6': 'jacobi_theta',
+    '66efb8': 'jacobi_theta',
+    '9aa437': 'jacobi_theta',
+    '5752b8': 'jacobi_theta',
+    'c891a1': 'jacobi_theta',
+    '3cac28': 'jacobi_theta',
+    '45a130': 'jacobi_theta',
+    '1fbc09': 'jacobi_theta',
+    '08822c': 'jacobi_theta',
+    '5a3ebf': 'jacobi_theta',
+    'e08bb4': 'jacobi_theta',
+    'fa7251': 'jacobi_theta',
+    '265d9c': 'jacobi_theta',
+    '0e2635': 'jacobi_theta',
+    '6fad93': 'jacobi_theta',
+    'abbe42': 'jacobi_theta',
+    '1c67c8': 'jacobi_theta',
+    'e6b579': 'jacobi_theta',
+    '1dcf7e': 'jacobi_theta',
+    'a8ea67': 'jacobi_theta',
+    'bf747b': 'jacobi_theta',
+    '8f43ab': 'jacobi_theta',
+    'b3c440': 'jacobi_theta',
+    '474c51': 'jacobi_theta',
+    'd4e418': 'jacobi_theta',
+    '055b0a': 'jacobi_theta',
+    'd15f11': 'jacobi_theta',
+    '1403b5': 'jacobi_theta',
+    '0d4608': 'jacobi_theta',
+    '7d7c65': 'jacobi_theta',
+    '8697b8': 'jacobi_theta',
+    '66df95': 'jacobi_theta',
+    '2f3ed3': 'jacobi_theta',
+    'dd5f43': 'jacobi_theta',
+    '3fb309': 'jacobi_theta',
+    '8c4ab4': 'jacobi_theta',
+    '47f4ba': 'jacobi_theta',
+    'e2288d': 'jacobi_theta',
+    'cf7ee3': 'jacobi_theta',
+    '81550a': 'jacobi_theta',
+    '4256f0': 'jacobi_theta',
+    '52302f': 'jacobi_theta',
+    '7f9273': 'jacobi_theta',
+    'cf3c8e': 'jacobi_theta',
+    'f12e20': 'jacobi_theta',
+    '95e9e4': 'jacobi_theta',
+    '483e7e': 'jacobi_theta',
+    'cb6c9c': 'jacobi_theta',
+    '669765': 'jacobi_theta',
+    '72f583': 'jacobi_theta',
+    '8356db': 'jacobi_theta',
+    '6ade92': 'jacobi_theta',
+    '4c8873': 'jacobi_theta',
+    '324483': 'jacobi_theta',
+    'b58070': 'jacobi_theta',
+    '6cbce8': 'jacobi_theta',
+    '5384f3': 'jacobi_theta',
+    'e2bc80': 'jacobi_theta',
+    '390158': 'jacobi_theta',
+    '675f23': 'jacobi_theta',
+    'c60033': 'jacobi_theta',
+    '799b5e': 'jacobi_theta',
+    'f42652': 'jacobi_theta',
+    'b2f31a': 'jacobi_theta',
+    '1ee920': 'jacobi_theta',
+    '594cc3': 'jacobi_theta',
+    '8a857c': 'jacobi_theta',
+    '74be8f': 'jacobi_theta',
+    '026e44': 'jacobi_theta',
+    'a46f94': 'jacobi_theta',
+    '321538': 'jacobi_theta',
+    'f5a15a': 'jacobi_theta',
+    '64c188': 'jacobi_theta',
+    '5c054e': 'jacobi_theta',
+    '9376ec': 'jacobi_theta',
+    '41631f': 'jacobi_theta',
+    '709905': 'jacobi_theta',
+    'f2a0c7': 'jacobi_theta',
+    'ecb406': 'jacobi_theta',
+    '799742': 'jacobi_theta',
+    'f89d5a': 'jacobi_theta',
+    'ae6718': 'jacobi_theta',
+    '4f3d2b': 'jacobi_theta',
+    '140815': 'jacobi_theta',
+    'fe4967': 'jacobi_theta',
+    '727715': 'jacobi_theta',
+    'ea304c': 'jacobi_theta',
+    '02d9e4': 'jacobi_theta',
+    '963daf': 'jacobi_theta',
+    'e4cdf1': 'jacobi_theta',
+    '86d68c': 'jacobi_theta',
+    '45267a': 'jacobi_theta',
+    '5b87f3': 'jacobi_theta',
+    '1a15f9': 'jacobi_theta',
+    '7c78ea': 'jacobi_theta',
+    'f71675': 'jacobi_theta',
+    'cc59e4': 'jacobi_theta',
+    '2429b2': 'jacobi_theta',
+    'a0955b': 'jacobi_theta',
+    'dac0aa': 'jacobi_theta',
+    '001234': 'jacobi_theta',
+    '24a793': 'jacobi_theta',
+    'c574fd': 'jacobi_theta',
+    'a9c825': 'jacobi_theta',
+    '85b2ff': 'jacobi_theta',
+    '9448f2': 'jacobi_theta',
+    '557b19': 'jacobi_theta',
+    'f7a534': 'weierstrass_elliptic',
+    '69be32': 'weierstrass_elliptic',
+    '5f3210': 'weierstrass_elliptic',
+    'ff0c9f': 'weierstrass_elliptic',
+    '0c8084': 'weierstrass_elliptic',
+    '3009a8': 'weierstrass_elliptic',
+    '3c1659': 'weierstrass_elliptic',
+    'd530b1': 'weierstrass_elliptic',
+    '58d67b': 'weierstrass_elliptic',
+    'b10ca7': 'weierstrass_elliptic',
+    '7c4457': 'weierstrass_elliptic',
+    'e677fb': 'weierstrass_elliptic',
+    '0e649f': 'weierstrass_elliptic',
+    'af0dfc': 'weierstrass_elliptic',
+    '0207dc': 'weierstrass_elliptic',
+    'b96c9d': 'weierstrass_elliptic',
+    '12a9e8': 'weierstrass_elliptic',
+    '72eb69': 'weierstrass_elliptic',
+    '23beb5': 'weierstrass_elliptic',
+    'a95b7e': 'weierstrass_elliptic',
+    'ffcc0f': 'weierstrass_elliptic',
+    'a0c85d': 'weierstrass_elliptic',
+    '35403b': 'weierstrass_elliptic',
+    'de9f42': 'weierstrass_elliptic',
+    'ae2c5d': 'weierstrass_elliptic',
+    '6021ba': 'weierstrass_elliptic',
+    '1da705': 'weierstrass_elliptic',
+    'c6234b': 'weierstrass_elliptic',
+    '69eb9b': 'weierstrass_elliptic',
+    '151e42': 'weierstrass_elliptic',
+    '881aee': 'weierstrass_elliptic',
+    '38f111': 'prime_numbers',
+    '0b643d': 'prime_numbers',
+    '6c22c8': 'prime_numbers',
+    '3fc797': 'prime_numbers',
+    '04427b': 'prime_numbers',
+    'd1ec2d': 'prime_numbers',
+    '69fd4b': 'prime_numbers',
+    '375afe': 'prime_numbers',
+    'd898b9': 'prime_numbers',
+    '5258c0': 'prime_numbers',
+    '8c52de': 'prime_numbers',
+    '6f3cf7': 'prime_numbers',
+    'bfa464': 'prime_numbers',
+    '1e3388': 'prime_numbers',
+    'a3035f': 'prime_numbers',
+    '1e142c': 'prime_numbers',
+    '5404ce': 'prime_numbers',
+    '094772': 'modular_transformations',
+    '1e211d': 'modular_transformations',
+    '76de9d': 'modular_transformations',
+    'dc2c26': 'modular_transformations',
+    'c84f3f': 'modular_transformations',
+    '80279d': 'modular_transformations',
+    '127a52': 'modular_transformations',
+    '5636db': 'modular_transformations',
+    'a637cd': 'modular_transformations',
+    '1d1028': 'modular_transformations',
+    '21b67f': 'modular_transformations',
+    'e28209': 'modular_transformations',
+    'fd53ab': 'modular_transformations',
+    '8a9884': 'modular_transformations',
+    '70eb98': 'modular_j',
+    '8c2862': 'modular_j',
+    'a997f2': 'modular_j',
+    '42a909': 'modular_j',
+    'd5f569': 'modular_j',
+    '9aa62c': 'modular_j',
+    'ad228f': 'modular_j',
+    '229c97': 'modular_j',
+    '1356e4': 'modular_j',
+    '8be46c': 'modular_j',
+    '3189b9': 'modular_j',
+    '29c095': 'modular_j',
+    'a498dd': 'modular_j',
+    '3ee358': 'modular_j',
+    '5b108e': 'modular_j',
+    '951017': 'modular_j',
+    '1cb24e': 'modular_j',
+    'cedcfc': 'modular_j',
+    '664b4c': 'modular_j',
+    'dc8251': 'modular_j',
+    'f0f53b': 'modular_j',
+    '348b26': 'modular_j',
+    '27f9d2': 'modular_j',
+    'ea3e3c': 'modular_j',
+    '1b2d8a': 'modular_j',
+    'dcc8b1': 'modular_j',
+    '441301': 'modular_j',
+    '36eb82': 'modular_j',
+    '0b4d4b': 'modular_j',
+    'fd72e0': 'modular_j',
+    'dd5681': 'modular_j',
+    '20b6d2': 'modular_j',
+    'a203bb': 'dedekind_eta',
+    '82a63c': 'dedekind_eta',
+    '2e7fdb': 'dedekind_eta',
+    '8f10b0': 'dedekind_eta',
+    'ff587a': 'dedekind_eta',
+    '1dc520': 'dedekind_eta',
+    '6b9935': 'dedekind_eta',
+    'd8025b': 'dedekind_eta',
+    '9b8c9f': 'dedekind_eta',
+    '5706ab': 'dedekind_eta',
+    '87e9ed': 'dedekind_eta',
+    '9ce413': 'dedekind_eta',
+    '3a56d8': 'dedekind_eta',
+    'd2900f': 'dedekind_eta',
+    '62ffb3': 'dedekind_eta',
+    '7cc3d3': 'dedekind_eta',
+    'be2f32': 'dedekind_eta',
+    '0701dc': 'dedekind_eta',
+    'e3e4c5': 'dedekind_eta',
+    '204acd': 'dedekind_eta',
+    '4af6db': 'dedekind_eta',
+    '737805': 'dedekind_eta',
+    'f4dc79': 'dedekind_eta',
+    '1bae52': 'dedekind_eta',
+    'acee1a': 'dedekind_eta',
+    '3b806f': 'dedekind_eta',
+    '29d9ab': 'dedekind_eta',
+    '9f19c1': 'dedekind_eta',
+    'f04e01': 'dedekind_eta',
+    '921ef0': 'dedekind_eta',
+    'a1a3d4': 'dedekind_eta',
+    '871996': 'dedekind_eta',
+    '1c25d3': 'dedekind_eta',
+    '02d14f': 'dedekind_eta',
+    'df5f38': 'dedekind_eta',
+    'e06d87': 'dedekind_eta',
+    '04f4a0': 'dedekind_eta',
+    'f2e2c2': 'dedekind_eta',
+    '6d7668': 'dedekind_eta',
+    '39fb36': 'dedekind_eta',
+    '7af83f': 'dedekind_eta',
+    '23961e': 'dedekind_eta',
+    'c2e919': 'dedekind_eta',
+    '9bb960': 'eisenstein',
+    'df3334': 'eisenstein',
+    '7e1850': 'eisenstein',
+    'dac0bb': 'eisenstein',
+    '54951a': 'eisenstein',
+    '356d7a': 'eisenstein',
+    '626026': 'eisenstein',
+    'a14cfc': 'eisenstein',
+    '0a2120': 'eisenstein',
+    '2246a7': 'eisenstein',
+    'c1ffd4': 'eisenstein',
+    'b07750': 'eisenstein',
+    '0b5b04': 'eisenstein',
+    '8ffe07': 'eisenstein',
+    '23a5e0': 'eisenstein',
+    'd56eb6': 'eisenstein',
+    '5161ab': 'eisenstein',
+    '7f4c85': 'eisenstein',
+    'b1a5e4': 'eisenstein',
+    '10cdf4': 'eisenstein',
+    'f8dfaf': 'eisenstein',
+    'e20db0': 'eisenstein',
+    '7c00e6': 'eisenstein',
+    '848d97': 'eisenstein',
+    '15b347': 'eisenstein',
+    '18a4d1': 'eisenstein',
+    '7b62e4': 'eisenstein',
+    'a92c1a': 'eisenstein',
+    '171724': 'eisenstein',
+    'cc579c': 'eisenstein',
+    '10f3b2': 'eisenstein',
+    '6d2880': 'eisenstein',
+    'a0dff6': 'eisenstein',
+    'bd7d8e': 'eisenstein',
+    'dbf388': 'eisenstein',
+    '03ad5a': 'eisenstein',
+    '4da2cd': 'eisenstein',
+    '0a5ef4': 'eisenstein',
+    'b52b6f': 'eisenstein',
+    '3bf702': 'eisenstein',
+    '044128': 'eisenstein',
+    'adaf5a': 'eisenstein',
+    'e60fd4': 'eisenstein',
+    '9e1f83': 'eisenstein',
+    'feb95e': 'eisenstein',
+    '36fff2': 'eisenstein',
+    '5540a1': 'eisenstein',
+    '9bf0ad': 'eisenstein',
+    '3e84e3': 'eisenstein',
+    '7cda09': 'eisenstein',
+    'af2ea9': 'eisenstein',
+    '3bfced': 'eisenstein',
+    '570399': 'eisenstein',
+    '9ea739': 'eisenstein',
+    'a691b3': 'eisenstein',
+    '30a054': 'eisenstein',
+    'e03b7c': 'eisenstein',
+    '53fcdd': 'eisenstein',
+    '3102a7': 'eisenstein',
+    '0fda1b': 'eisenstein',
+    '6c71c0': 'eisenstein',
+    'a4109c': 'eisenstein',
+    'c6be24': 'eisenstein',
+    'ad9ba2': 'eisenstein',
+    'e46697': 'eisenstein',
+    '2f6805': 'eisenstein',
+    'a50278': 'eisenstein',
+    '13cac5': 'eisenstein',
+    '097efc': 'eisenstein',
+    '298bb1': 'eisenstein',
+    '4a200a': 'eisenstein',
+    'ec4f56': 'eisenstein',
+    '83566f': 'eisenstein',
+    '26faf3': 'eisenstein',
+    '6ae250': 'eisenstein',
+    'ad91ae': 'eisenstein',
+    'cae067': 'eisenstein',
+    'f33f09': 'eisenstein',
+    '67f2ef': 'eisenstein',
+    'be9790': 'eisenstein',
+    'f53771': 'modular_lambda',
+    '6c6204': 'modular_lambda',
+    'f0981b': 'modular_lambda',
+    'fc6cf6': 'modular_lambda',
+    '813d25': 'modular_lambda',
+    'c7f85b': 'modular_lambda',
+    'ad5aff': 'modular_lambda',
+    '55ee4a': 'modular_lambda',
+    '6678af': 'modular_lambda',
+    'ec5a44': 'modular_lambda',
+    '21839d': 'modular_lambda',
+    '73427b': 'modular_lambda',
+    'bbfb6c': 'modular_lambda',
+    '07bf27': 'modular_lambda',
+    'e9f0c8': 'modular_lambda',
+    '2ba627': 'modular_lambda',
+    '3a7a0b': 'modular_lambda',
+    '099301': 'modular_lambda',
+    '737f2b': 'modular_lambda',
+    'b23575': 'modular_lambda',
+    '5b9c02': 'modular_lambda',
+    '903962': 'modular_lambda',
+    '04d3a6': 'modular_lambda',
+    '5dd24a': 'modular_lambda',
+    '033d39': 'modular_lambda',
+    '166402': 'modular_lambda',
+    '921f34': 'modular_lambda',
+    'e96684': 'modular_lambda',
+    'ac236f': 'modular_lambda',
+    '90b419': 'modular_lambda',
+    '4b20ab': 'modular_lambda',
+    'e4315f': 'modular_lambda',
+    '830dd4': 'modular_lambda',
+    'a35b3c': 'modular_lambda',
+    'fe2627': 'modular_lambda',
+    '078869': 'modular_lambda',
+    'ea56d1': 'modular_lambda',
+    'b0e1cb': 'modular_lambda',
+    '4877f2': 'modular_lambda',
+    '35c85f': 'modular_lambda',
+    'e8252c': 'modular_lambda',
+    '231141': 'modular_lambda',
+    'b7174d': 'modular_lambda',
+    '5d550c': 'modular_lambda',
+    '44a529': 'modular_lambda',
+    '27b2c7': 'modular_lambda',
+    'c18c95': 'modular_lambda',
+    '38b4f3': 'modular_lambda',
+    'e810d8': 'dirichlet',
+    '2f52bc': 'dirichlet',
+    'c7e2fb': 'dirichlet',
+    '47d430': 'dirichlet',
+    'ed65c8': 'dirichlet',
+    '62f7d5': 'dirichlet',
+    '0ba38f': 'dirichlet',
+    'f88596': 'dirichlet',
+    '3b43b0': 'dirichlet',
+    'd9a187': 'dirichlet',
+    '57d31a': 'dirichlet',
+    '1c3957': 'dirichlet',
+    '0851cf': 'dirichlet',
+    'afd0c5': 'dirichlet',
+    'bdf58d': 'dirichlet',
+    'd29554': 'dirichlet',
+    '458198': 'dirichlet',
+    'd8c6d1': 'dirichlet',
+    'a7d592': 'dirichlet',
+    '166a87': 'dirichlet',
+    '75231e': 'dirichlet',
+    '540931': 'dirichlet',
+    'a9847a': 'dirichlet',
+    '2a48bd': 'dirichlet',
+    '4cf4e4': 'dirichlet',
+    'fc4f6a': 'dirichlet',
+    '03fbe8': 'dirichlet',
+    '4877d1': 'dirichlet',
+    '3ab92d': 'dirichlet',
+    'a4e947': 'dirichlet',
+    'f4de66': 'dirichlet',
+    '338b5c': 'dirichlet',
+    'c40df4': 'dirichlet',
+    'ef432d': 'dirichlet',
+    '287d9b': 'dirichlet',
+    '5dc1c0': 'dirichlet',
+    '668877': 'dirichlet',
+    'd8cac6': 'dirichlet',
+    'ec0054': 'dirichlet',
+    'fc267b': 'dirichlet',
+    '0c7de4': 'dirichlet',
+    'd8155f': 'dirichlet',
+    '7a56c2': 'dirichlet',
+    '5e1d3b': 'dirichlet',
+    'e6deb7': 'dirichlet',
+    '5df909': 'dirichlet',
+    'd5a598': 'dirichlet',
+    '604c7c': 'dirichlet',
+    '291569': 'dirichlet',
+    'd088ea': 'dirichlet',
+    '0f96c3': 'dirichlet',
+    'c31c10': 'dirichlet',
+    '4c3678': 'dirichlet',
+    'a9337b': 'dirichlet',
+    'ff8254': 'dirichlet',
+    '629f70': 'dirichlet',
+    '1bd945': 'dirichlet',
+    '6c3fff': 'dirichlet',
+    '3d5327': 'dirichlet',
+    '5c4552': 'dirichlet',
+    '23256b': 'dirichlet',
+    'c2750a': 'dirichlet',
+    'd83109': 'dirichlet',
+    '3b8c97': 'dirichlet',
+    'c9d117': 'dirichlet',
+    'a07d28': 'dirichlet',
+    '789ca4': 'dirichlet',
+    'fad52f': 'dirichlet',
+    'cb5d51': 'dirichlet',
+    'e44796': 'dirichlet',
+    '3e0817': 'dirichlet',
+    'f7a866': 'dirichlet',
+    'd69b41': 'dirichlet',
+    'f5c3c5': 'dirichlet',
+    '3f96c1': 'dirichlet',
+    'dc593e': 'dirichlet',
+    'e2a734': 'dirichlet',
+    '982e3b': 'dirichlet',
+    '214a91': 'dirichlet',
+    '9ba78a': 'dirichlet',
+    'bc755b': 'dirichlet',
+    '2a34c3': 'dirichlet',
+    '7c86d5': 'dirichlet',
+    '50adea': 'dirichlet',
+    '97fe89': 'dirichlet',
+    'cc6a5a': 'dirichlet',
+    'b788a1': 'dirichlet',
+    '11a763': 'dirichlet',
+    '62f12c': 'dirichlet',
+    'b78a50': 'dirichlet',
+    '288207': 'dirichlet',
+    '8533f5': 'dirichlet',
+    '97f631': 'dirichlet',
+    'ea8c55': 'dirichlet',
+    'fe4692': 'dirichlet',
+    '312147': 'dirichlet',
+    '4911bd': 'dirichlet',
+    '8ff1ff': 'dirichlet',
+    '9b3fde': 'dirichlet',
+    '1c46fa': 'beta_function',
+    '795fe5': 'beta_function',
+    '6bd011': 'beta_function',
+    '888581': 'beta_function',
+    'ba7baf': 'beta_function',
+    '3141e4': 'beta_function',
+    'c92da4': 'beta_function',
+    'ff613a': 'beta_function',
+    '6bcfa6': 'beta_function',
+    '542cf7': 'beta_function',
+    '48910b': 'beta_function',
+    '3e08b6': 'beta_function',
+    'a1941b': 'beta_function',
+    '5ec9c0': 'beta_function',
+    'cc2ebb': 'beta_function',
+    '315b3d': 'beta_function',
+    'fd0e48': 'beta_function',
+    '082a69': 'beta_function',
+    'bb4f41': 'beta_function',
+    '72db94': 'beta_function',
+    'a7dbf6': 'beta_function',
+    '1f72e9': 'beta_function',
+    'bdea17': 'beta_function',
+    'e9f966': 'beta_function',
+    '2c46dc': 'totient',
+    'c19cd6': 'totient',
+    'b9c50f': 'totient',
+    '081abd': 'totient',
+    'cb410e': 'totient',
+    '1d731f': 'totient',
+    'db4763': 'totient',
+    '56d7fe': 'totient',
+    '05e9ae': 'totient',
+    'c0e088': 'totient',
+    'b9c36d': 'totient',
+    'd1ea57': 'totient',
+    '11a56b': 'totient',
+    'f0639c': 'totient',
+    'eae0de': 'totient',
+    '8f51dd': 'totient',
+    'a68214': 'totient',
+    '36fe36': 'totient',
+    '3f5711': 'totient',
+    '93a877': 'totient',
+    'efd378': 'totient',
+    '91f156': 'totient',
+    'bb4ce0': 'totient',
+    'a08583': 'totient',
+    '08ff0b': 'totient',
+    'cdd7e7': 'totient',
+    '90bb4a': 'totient',
+    '0fdb94': 'totient',
+    'a05466': 'totient',
+    'ea27a7': 'totient',
+    '1a907e': 'totient',
+    '7f5468': 'totient',
+    'a9a405': 'totient',
+    'cd7877': 'totient',
+    'acfc1f': 'totient',
+    '4b5b44': 'totient',
+    '33139b': 'totient',
+    'feb1a0': 'totient',
+    '8d7b3d': 'totient',
+    '9923b7': 'totient',
+    'e3005f': 'totient',
+    '485ab6': 'totient',
+    'd0b5a7': 'totient',
+    'b81b45': 'totient',
+    '08fb81': 'totient',
+    '775e10': 'totient',
+    '433a5c': 'totient',
+    '86fcf1': 'totient',
+    'acb28a': 'totient',
+    '0477b3': 'totient',
+    '6d37c9': 'totient',
+    '32e430': 'landau_function',
+    '177218': 'landau_function',
+    '7932c3': 'landau_function',
+    'a3ab2a': 'landau_function',
+    '9697b8': 'landau_function',
+    '3d5019': 'landau_function',
+    '87d19b': 'landau_function',
+    '65fa9f': 'landau_function',
+    'f7b6aa': 'const_catalan',
+    '6a83ad': 'const_catalan',
+    '2744d4': 'const_catalan',
+    'e85723': 'const_catalan',
+    '1d65c2': 'const_catalan',
+    '9e9922': 'const_catalan',
+    '4c166d': 'const_catalan',
+    'a766f2': 'const_catalan',
+    '33aa62': 'const_catalan',
+    'd43f30': 'const_catalan',
+    '0bd544': 'const_catalan',
+    '37fb5f': 'const_catalan',
+    'a8657e': 'const_catalan',
+    'ba58e0': 'const_catalan',
+    'd864b2': 'const_catalan',
+    '49df16': 'const_catalan',
+    '997777': 'const_catalan',
+    'd6703a': 'const_catalan',
+    'fd82ab': 'const_catalan',
+    '38c2d5': 'const_catalan',
+    'c54c85': 'const_catalan',
+    'ec1435': 'const_catalan',
+    '79f20e': 'const_catalan',
+    'fc5ea9': 'const_catalan',
+    '08cda4': 'const_catalan',
+    '270e67': 'const_catalan',
+    '4dec89': 'const_catalan',
+    'd6415e': 'const_catalan',
+    'e09b77': 'const_catalan',
+    '6d3591': 'const_catalan',
+    '1f1fb4': 'const_catalan',
+    'd3cfc2': 'const_catalan',
+    '937fa9': 'const_catalan',
+    '5b31ee': 'const_catalan',
+    'ed4cca': 'const_catalan',
+    'f1527d': 'digamma_function',
+    '8bdd03': 'digamma_function',
+    'cf93bc': 'digamma_function',
+    'a20761': 'digamma_function',
+    '03d70f': 'digamma_function',
+    'a0845d': 'digamma_function',
+    'e7aef3': 'digamma_function',
+    'f29019': 'digamma_function',
+    '453c11': 'digamma_function',
+    '9ee737': 'digamma_function',
+    'd0bba3': 'digamma_function',
+    'a8ab81': 'digamma_function',
+    '394cdc': 'digamma_function',
+    'd9403e': 'digamma_function',
+    '86333d': 'digamma_function',
+    '8415c7': 'digamma_function',
+    '4b6ccb': 'digamma_function',
+    'f1e02b': 'digamma_function',
+    '6db9fc': 'digamma_function',
+    '21f4f9': 'digamma_function',
+    '686524': 'digamma_function',
+    'dfb55b': 'digamma_function',
+    'c76eaf': 'digamma_function',
+    'a2675b': 'digamma_function',
+    'b4825b': 'digamma_function',
+    'ddc7e1': 'digamma_function',
+    'cf5355': 'digamma_function',
+    '24c9e9': 'digamma_function',
+    'bf533f': 'digamma_function',
+    'bba4ec': 'digamma_function',
+    'd6fbc8': 'digamma_function',
+    'ee3dc5': 'digamma_function',
+    'a6bdf5': 'digamma_function',
+    'd0b65a': 'digamma_function',
+    '6000d0': 'digamma_function',
+    '233814': 'digamma_function',
+    '950e5a': 'digamma_function',
+    'fb9942': 'digamma_function',
+    '3f15eb': 'digamma_function',
+    '42c1f5': 'digamma_function',
+    '78c19c': 'digamma_function',
+    '1cbe83': 'digamma_function',
+    'dce62c': 'digamma_function',
+    'ea2482': 'digamma_function',
+    'ada157': 'digamma_function',
+    '75f9bf': 'digamma_function',
+    '00c02a': 'digamma_function',
+    '89bed3': 'digamma_function',
+    '98f642': 'digamma_function',
+    '45a969': 'digamma_function',
+    '7ec4f0': 'digamma_function',
+    'f93bae': 'digamma_function',
+    '177de7': 'digamma_function',
+    '967bbb': 'digamma_function',
+    '8c368f': 'digamma_function',
+    '3fe553': 'digamma_function',
+    'babd3c': 'digamma_function',
+    'fa0292': 'digamma_function',
+    '4a30f1': 'digamma_function',
+    'a62320': 'digamma_function',
+    '90b26f': 'digamma_function',
+    '595f46': 'digamma_function',
+    '5ce30b': 'digamma_function',
+    '807c7d': 'digamma_function',
+    'd2f9fb': 'digamma_function',
+    '03aca0': 'digamma_function',
+    'e83059': 'digamma_function',
+    'b31fd2': 'digamma_function',
+    '2251c6': 'digamma_function',
+    'bb88c8': 'digamma_function',
+    '921d61': 'digamma_function',
+    '03e2a6': 'digamma_function',
+    '22a9cd': 'digamma_function',
+    '6f3fec': 'digamma_function',
+    '11dfd2': 'digamma_function',
+    '9f32fe': 'digamma_function',
+    '554ac2': 'digamma_function',
+    '039051': 'digamma_function',
+    '34fafa': 'digamma_function',
+    'c687d6': 'digamma_function',
+    'adf5e2': 'digamma_function',
+    '361f61': 'digamma_function',
+    'eec21a': 'digamma_function',
+    '7b724b': 'digamma_function',
+    'aa47cd': 'digamma_function',
+    '5db5f2': 'digamma_function',
+    '62b81d': 'digamma_function',
+    'e1e71f': 'digamma_function',
+    'a4cc3b': 'digamma_function',
+    'f946a5': 'digamma_function',
+    'cfb999': 'digamma_function',
+    'd9c818': 'digamma_function',
+    '4f5575': 'digamma_function',
+    'c89abc': 'digamma_function',
+    '547fcd': 'digamma_function',
+    '4e3853': 'digamma_function',
+    '88e89f': 'digamma_function',
+    '1e47db': 'digamma_function',
+    '458a97': 'digamma_function',
+    '739819': 'digamma_function',
+    'bb9eb6': 'digamma_function',
+    '1165fc': 'digamma_function',
+    '39ce44': 'digamma_function',
+    'a4f9c9': 'digamma_function',
+    '6547da': 'digamma_function',
+    '4fdf65': 'digamma_function',
+    '3c4f5f': 'digamma_function',
+    'd4bdf8': 'digamma_function',
+    'c86ca1': 'digamma_function',
+    '15d56a': 'digamma_function',
+    '0e5d90': 'digamma_function',
+    '24d810': 'digamma_function',
+    '94a81f': 'digamma_function',
+    'e63fe8': 'digamma_function',
+    '8671a4': 'digamma_function',
+    '5a3c4a': 'digamma_function',
+    '6cabb7': 'digamma_function',
+    'b16177': 'digamma_function',
+    '7212ea': 'digamma_function',
+    'f42042': 'digamma_function',
+    'd02cf9': 'digamma_function',
+    '21e21a': 'digamma_function',
+    'b7f13b': 'digamma_function',
+    '19e67f': 'digamma_function',
+    'aac67f': 'integer_sequences',
+    '963387': 'integer_sequences',
+    '9d0839': 'integer_sequences',
+    '8eed2c': 'integer_sequences',
+    '373aa1': 'integer_sequences',
+    '60dc3e': 'integer_sequences',
+    'd12aa0': 'integer_sequences',
+    '4fa169': 'integer_sequences',
+    '6af603': 'integer_sequences',
+    '483547': 'integer_sequences',
+    'b6111c': 'integer_sequences',
+    'aab550': 'multiple_zeta_values',
+    '94a39f': 'multiple_zeta_values',
+    '345c26': 'multiple_zeta_values',
+    '62de01': 'multiple_zeta_values',
+    'a5e52e': 'multiple_zeta_values',
+    'ef2c71': 'multiple_zeta_values',
+    '856317': 'multiple_zeta_values',
+    '3a5167': 'multiple_zeta_values',
+    'ef8b17': 'multiple_zeta_values',
+    '4a23c7': 'multiple_zeta_values',
+    'da71d3': 'multiple_zeta_values',
+    '70c42b': 'multiple_zeta_values',
+    '1706bb': 'bell_numbers',
+    '16fe51': 'bell_numbers',
+    '4b4816': 'bell_numbers',
+    '534f7d': 'bell_numbers',
+    '3627de': 'bell_numbers',
+    '92cc17': 'bell_numbers',
+    '4c6267': 'bell_numbers',
+    '7466a2': 'bell_numbers',
+    '050c46': 'bell_numbers',
+    '948167': 'bell_numbers',
+    '4b65d0': 'bell_numbers',
+    '1026e3': 'bell_numbers',
+    '9d666f': 'bell_numbers',
+    'aab4e3': 'bell_numbers',
+    'f4e249': 'bell_numbers',
+    'a71381': 'bell_numbers',
+    '343946': 'bell_numbers',
+    '589758': 'bell_numbers',
+    '2e576e': 'bell_numbers',
+    '320dc9': 'bell_numbers',
+    'fb6ce2': 'bell_numbers',
+    '46bc62': 'bell_numbers',
+    'd1f218': 'bell_numbers',
+    '512beb': 'bell_numbers',
+    '7e449a': 'bell_numbers',
+    'a747a4': 'bell_numbers',
+    '468def': 'bell_numbers',
+    'b29b24': 'bell_numbers',
+    '1e00d2': 'bell_numbers',
+    'd1438d': 'bell_numbers',
+    '60740b': 'bell_numbers',
+    'dd9d26': 'bell_numbers',
+    'b41c49': 'bell_numbers',
+    '050ee1': 'bell_numbers',
+    'a4d6fc': 'bell_numbers',
+    'b7e899': 'bell_numbers',
+    'a1108d': 'bell_numbers',
+    'b5a382': 'bell_numbers',
+    'dc6806': 'bell_numbers',
+    '82a1b1': 'barnes_g',
+    'da1509': 'barnes_g',
+    '488c5c': 'barnes_g',
+    '106bf7': 'barnes_g',
+    'e1497f': 'barnes_g',
+    'f3f0a7': 'barnes_g',
+    '3d46ea': 'barnes_g',
+    '8ec739': 'barnes_g',
+    '971881': 'barnes_g',
+    '19b40f': 'barnes_g',
+    'a471d0': 'barnes_g',
+    '037342': 'barnes_g',
+    '62bdb8': 'barnes_g',
+    'b4355e': 'barnes_g',
+    '5a11eb': 'barnes_g',
+    'd9a7a3': 'barnes_g',
+    'e488dc': 'barnes_g',
+    'f77124': 'barnes_g',
+    '2b021c': 'barnes_g',
+    'c3e340': 'barnes_g',
+    'e1f73d': 'barnes_g',
+    'a044e1': 'barnes_g',
+    'cc3a51': 'barnes_g',
+    'd35c54': 'barnes_g',
+    '33f13a': 'barnes_g',
+    'daef08': 'barnes_g',
+    '5cb675': 'barnes_g',
+    'dbc117': 'barnes_g',
+    '8b7991': 'barnes_g',
+    'ce66a9': 'barnes_g',
+    'dc507f': 'barnes_g',
+    '90b367': 'barnes_g',
+    'dbfd5b': 'barnes_g',
+    'a54fb0': 'barnes_g',
+    'f50c74': 'barnes_g',
+    '86b3ec': 'barnes_g',
+    '5261e3': 'barnes_g',
+    '7a36e5': 'barnes_g',
+    '541e2e': 'barnes_g',
+    'd1a0ec': 'barnes_g',
+    'b6017f': 'barnes_g',
+    '23ed69': 'barnes_g',
+    '82b410': 'barnes_g',
+    'ea26d4': 'barnes_g',
+    '147db6': 'barnes_g',
+    '6c6d3e': 'barnes_g',
+    '5babc2': 'barnes_g',
+    'af31ae': 'barnes_g',
+    'e05807': 'barnes_g',
+    '0ad263': 'barnes_g',
+    '54d4e2': 'barnes_g',
+    '752bde': 'barnes_g',
+    '6f8e14': 'barnes_g',
+    'b16d00': 'barnes_g',
+    '092cee': 'barnes_g',
+    '645c98': 'barnes_g',
+    '1d4638': 'barnes_g',
+    '8c96a5': 'barnes_g',
+    '95f771': 'barnes_g',
+    'b64782': 'barnes_g',
+    '6395ee': 'barnes_g',
+    '4a3612': 'barnes_g',
+    '3544a0': 'barnes_g',
+    '7df1c4': 'barnes_g',
+    '1c770c': 'barnes_g',
+    '306699': 'barnes_g',
+    'f4750b': 'barnes_g',
+    '6161c7': 'halphen_constant',
+    'e2bfdb': 'halphen_constant',
+    'f5e0b0': 'halphen_constant',
+    'd0993b': 'halphen_constant',
+    '5c1e44': 'halphen_constant',
+    '9758ac': 'halphen_constant',
+    '31adf6': 'halphen_constant',
+    '831ea4': 'halphen_constant',
+    'c26bc9': 'halphen_constant',
+    '06c468': 'halphen_constant',
+}
+
+topic_modules = {
+    'Symbolic expressions': 'symbolic_expressions',
+    'Hurwitz zeta function': 'hurwitz_zeta',
+    'Elementary logic and set theory': 'logic',
+    'Numbers and infinities': 'numbers',
+    'Operators': 'operators',
+    'Complex parts': 'complex_parts',
+    "Euler's constant": 'const_gamma',
+    'Pi': 'pi',
+    'Golden ratio': 'golden_ratio',
+    'Imaginary unit': 'imaginary_unit',
+    'Exponential function': 'exp',
+    'Powers': 'powers',
+    'Square roots': 'sqrt',
+    'Sine': 'sine',
+    'Sinc function': 'sinc',
+    'Inverse tangent': 'atan',
+    'Arithmetic-geometric mean': 'agm',
+    'Legendre elliptic integrals': 'legendre_elliptic',
+    'Carlson symmetric elliptic integrals': 'carlson_elliptic',
+    'Specific values of Carlson symmetric elliptic integrals': 'carlson_elliptic',
+    'Series representations of Carlson symmetric elliptic integrals': 'carlson_elliptic',
+    'Lambert W-function': 'lambertw',
+    'Greatest common divisor': 'gcd',
+    'Factorials and binomial coefficients': 'factorials',
+    'Specific values of factorials and binomial coefficients': 'factorials',
+    'Fibonacci numbers': 'fibonacci',
+    'Gamma function': 'gamma',
+    'Bounds and inequalities for the gamma function': 'gamma',
+    'Legendre polynomials': 'legendre_polynomial',
+    'Chebyshev polynomials': 'chebyshev',
+    'Natural logarithm': 'log',
+    'Partition function': 'partitions',
+    'Riemann zeta function': 'riemann_zeta',
+    'Zeros of the Riemann zeta function': 'riemann_zeta',
+    'Riemann hypothesis': 'riemann_zeta',
+    'Keiper-Li coefficients': 'riemann_zeta',
+    'Stieltjes constants': 'riemann_zeta',
+    'Definite integrals': 'integrals',
+    'Airy functions': 'airy',
+    'Bessel functions': 'bessel',
+    'Recurrence relations for Bessel functions': 'bessel',
+    'Hypergeometric representations of Bessel functions': 'bessel',
+    'Specific values of Bessel functions': 'bessel',
+    'Coulomb wave functions': 'coulomb_wave',
+    'Bernoulli numbers and polynomials': 'bernoulli_numbers',
+    'Stirling numbers': 'stirling_numbers',
+    'Gaussian quadrature': 'gaussian_quadrature',
+    'General analytic functions': 'general_functions',
+    'Complex plane': 'complex_plane',
+    'Gauss hypergeometric function': 'gauss_hypergeometric',
+    'Confluent hypergeometric functions': 'confluent_hypergeometric',
+    'Error functions': 'error_functions',
+    'Jacobi theta functions': 'jacobi_theta',
+    'Approximations of Jacobi theta functions': 'jacobi_theta',
+    'Illustrations of Jacobi theta functions': 'jacobi_theta',
+    'Series and product representations of Jacobi theta functions': 'jacobi_theta',
+    'Lattice transformations for Jacobi theta functions': 'jacobi_theta',
+    'Differential equations for Jacobi theta functions': 'jacobi_theta',
+    'Argument transformations for Jacobi theta functions': 'jacobi_theta',
+    'Specific values of Jacobi theta functions': 'jacobi_theta',
+    'Integrals of Jacobi theta functions': 'jacobi_theta',
+    'Weierstrass elliptic functions': 'weierstrass_elliptic',
+    'Prime numbers': 'prime_numbers',
+    'Modular transformations': 'modular_transformations',
+    'Modular j-invariant': 'modular_j',
+    'Dedekind eta function': 'dedekind_eta',
+    'Illustrations of Eisenstein series': 'eisenstein',
+    'Eisenstein series': 'eisenstein',
+    'Modular lambda function': 'modular_lambda',
+    'Dirichlet characters': 'dirichlet',
+    'Dirichlet L-functions': 'dirichlet',
+    'Beta function': 'beta_function',
+    'Totient function': 'totient',
+    "Landau's function": 'landau_function',
+    "Catalan's constant": 'const_catalan',
+    'Digamma function': 'digamma_function',
+    'Specific values of the digamma function': 'digamma_function',
+    'Integer sequences': 'integer_sequences',
+    'Multiple zeta values': 'multiple_zeta_values',
+    'Bell numbers': 'bell_numbers',
+    'Barnes G-function': 'barnes_g',
+    "Halphen's constant": 'halphen_constant',
+}
+
+symbol_modules = {
+    'Entry': 'symbolic_expressions',
+    'ID': 'symbolic_expressions',
+    'Formula': 'symbolic_expressions',
+    'Variables': 'symbolic_expressions',
+    'Assumptions': 'symbolic_expressions',
+    'References': 'symbolic_expressions',
+    'Description': 'symbolic_expressions',
+    'For': 'symbolic_expressions',
+    'ForElement': 'symbolic_expressions',
+    'Repeat': 'symbolic_expressions',
+    'Step': 'symbolic_expressions',
+    'Parentheses': 'symbolic_expressions',
+    'Brackets': 'symbolic_expressions',
+    'Braces': 'symbolic_expressions',
+    'HurwitzZeta': 'hurwitz_zeta',
+    'Not': 'logic',
+    'And': 'logic',
+    'Or': 'logic',
+    'Equivalent': 'logic',
+    'Implies': 'logic',
+    'Set': 'logic',
+    'Cardinality': 'logic',
+    'PowerSet': 'logic',
+    'Union': 'logic',
+    'Intersection': 'logic',
+    'SetMinus': 'logic',
+    'Element': 'logic',
+    'NotElement': 'logic',
+    'Subset': 'logic',
+    'SubsetEqual': 'logic',
+    'ZZ': 'numbers',
+    'QQ': 'numbers',
+    'RR': 'numbers',
+    'CC': 'numbers',
+    'AlgebraicNumbers': 'numbers',
+    'Infinity': 'numbers',
+    'UnsignedInfinity': 'numbers',
+    'ZZGreaterEqual': 'numbers',
+    'ZZLessEqual': 'numbers',
+    'Range': 'numbers',
+    'ClosedInterval': 'numbers',
+    'OpenInterval': 'numbers',
+    'ClosedOpenInterval': 'numbers',
+    'OpenClosedInterval': 'numbers',
+    'Sum': 'operators',
+    'Product': 'operators',
+    'PrimeSum': 'operators',
+    'PrimeProduct': 'operators',
+    'DivisorSum': 'operators',
+    'DivisorProduct': 'operators',
+    'Zeros': 'operators',
+    'UniqueZero': 'operators',
+    'Solutions': 'operators',
+    'UniqueSolution': 'operators',
+    'Supremum': 'operators',
+    'Infimum': 'operators',
+    'Minimum': 'operators',
+    'Maximum': 'operators',
+    'ArgMin': 'operators',
+    'ArgMax': 'operators',
+    'ArgMinUnique': 'operators',
+    'ArgMaxUnique': 'operators',
+    'Limit': 'operators',
+    'SequenceLimit': 'operators',
+    'RealLimit': 'operators',
+    'LeftLimit': 'operators',
+    'RightLimit': 'operators',
+    'ComplexLimit': 'operators',
+    'MeromorphicLimit': 'operators',
+    'SequenceLimitInferior': 'operators',
+    'SequenceLimitSuperior': 'operators',
+    'Derivative': 'operators',
+    'RealDerivative': 'operators',
+    'ComplexDerivative': 'operators',
+    'ComplexBranchDerivative': 'operators',
+    'MeromorphicDerivative': 'operators',
+    'Integral': 'operators',
+    'IndefiniteIntegralEqual': 'operators',
+    'RealIndefiniteIntegralEqual': 'operators',
+    'ComplexIndefiniteIntegralEqual': 'operators',
+    'IsHolomorphic': 'operators',
+    'IsMeromorphic': 'operators',
+    'ComplexZeroMultiplicity': 'operators',
+    'Residue': 'operators',
+    'Path': 'operators',
+    'CurvePath': 'operators',
+    'AnalyticContinuation': 'operators',
+    'Sign': 'complex_parts',
+    'Abs': 'complex_parts',
+    'Arg': 'complex_parts',
+    'Re': 'complex_parts',
+    'Im': 'complex_parts',
+    'Conjugate': 'complex_parts',
+    'Csgn': 'complex_parts',
+    'ConstGamma': 'const_gamma',
+    'Pi': 'pi',
+    'GoldenRatio': 'golden_ratio',
+    'ConstI': 'imaginary_unit',
+    'Exp': 'exp',
+    'ConstE': 'exp',
+    'Pow': 'powers',
+    'Sqrt': 'sqrt',
+    'Sin': 'sine',
+    'Sinc': 'sinc',
+    'Atan': 'atan',
+    'Atan2': 'atan',
+    'AGM': 'agm',
+    'AGMSequence': 'agm',
+    'EllipticK': 'legendre_elliptic',
+    'EllipticE': 'legendre_elliptic',
+    'EllipticPi': 'legendre_elliptic',
+    'IncompleteEllipticF': 'legendre_elliptic',
+    'IncompleteEllipticE': 'legendre_elliptic',
+    'IncompleteEllipticPi': 'legendre_elliptic',
+    'CarlsonRF': 'carlson_elliptic',
+    'CarlsonRG': 'carlson_elliptic',
+    'CarlsonRJ': 'carlson_elliptic',
+    'CarlsonRC': 'carlson_elliptic',
+    'CarlsonRD': 'carlson_elliptic',
+    'CarlsonHypergeometricR': 'carlson_elliptic',
+    'CarlsonHypergeometricT': 'carlson_elliptic',
+    'LambertW': 'lambertw',
+    'LambertWPuiseuxCoefficient': 'lambertw',
+    'GCD': 'gcd',
+    'LCM': 'gcd',
+    'XGCD': 'gcd',
+    'Factorial': 'factorials',
+    'Binomial': 'factorials',
+    'RisingFactorial': 'factorials',
+    'FallingFactorial': 'factorials',
+    'Fibonacci': 'fibonacci',
+    'Gamma': 'gamma',
+    'LogGamma': 'gamma',
+    'StirlingSeriesRemainder': 'gamma',
+    'ChebyshevT': 'chebyshev',
+    'ChebyshevU': 'chebyshev',
+    'Log': 'log',
+    'PartitionsP': 'partitions',
+    'HardyRamanujanA': 'partitions',
+    'RiemannZeta': 'riemann_zeta',
+    'RiemannZetaZero': 'riemann_zeta',
+    'RiemannHypothesis': 'riemann_zeta',
+    'DeBruijnNewmanLambda': 'riemann_zeta',
+    'KeiperLiLambda': 'riemann_zeta',
+    'StieltjesGamma': 'riemann_zeta',
+    'AiryAi': 'airy',
+    'AiryBi': 'airy',
+    'BesselJ': 'bessel',
+    'BesselY': 'bessel',
+    'BesselI': 'bessel',
+    'BesselK': 'bessel',
+    'HankelH1': 'bessel',
+    'HankelH2': 'bessel',
+    'CoulombF': 'coulomb_wave',
+    'CoulombG': 'coulomb_wave',
+    'CoulombH': 'coulomb_wave',
+    'CoulombC': 'coulomb_wave',
+    'CoulombSigma': 'coulomb_wave',
+    'BernoulliB': 'bernoulli_numbers',
+    'BernoulliPolynomial': 'bernoulli_numbers',
+    'StirlingCycle': 'stirling_numbers',
+    'StirlingS1': 'stirling_numbers',
+    'StirlingS2': 'stirling_numbers',
+    'HH': 'complex_plane',
+    'Hypergeometric2F1': 'gauss_hypergeometric',
+    'Hypergeometric2F1Regularized': 'gauss_hypergeometric',
+    'Hypergeometric0F1': 'confluent_hypergeometric',
+    'Hypergeometric0F1Regularized': 'confluent_hypergeometric',
+    'Hypergeometric1F1': 'confluent_hypergeometric',
+    'Hypergeometric1F1Regularized': 'confluent_hypergeometric',
+    'HypergeometricU': 'confluent_hypergeometric',
+    'HypergeometricUStar': 'confluent_hypergeometric',
+    'Hypergeometric2F0': 'confluent_hypergeometric',
+    'HypergeometricUStarRemainder': 'confluent_hypergeometric',
+    'Erf': 'error_functions',
+    'Erfc': 'error_functions',
+    'Erfi': 'error_functions',
+    'JacobiTheta': 'jacobi_theta',
+    'JacobiThetaPermutation': 'jacobi_theta',
+    'JacobiThetaEpsilon': 'jacobi_theta',
+    'WeierstrassP': 'weierstrass_elliptic',
+    'WeierstrassZeta': 'weierstrass_elliptic',
+    'WeierstrassSigma': 'weierstrass_elliptic',
+    'Lattice': 'weierstrass_elliptic',
+    'PP': 'prime_numbers',
+    'PrimeNumber': 'prime_numbers',
+    'PrimePi': 'prime_numbers',
+    'SL2Z': 'modular_transformations',
+    'PSL2Z': 'modular_transformations',
+    'ModularGroupAction': 'modular_transformations',
+    'ModularGroupFundamentalDomain': 'modular_transformations',
+    'ModularJ': 'modular_j',
+    'PrimitiveReducedPositiveIntegralBinaryQuadraticForms': 'modular_j',
+    'HilbertClassPolynomial': 'modular_j',
+    'DedekindEta': 'dedekind_eta',
+    'EulerQSeries': 'dedekind_eta',
+    'DedekindEtaEpsilon': 'dedekind_eta',
+    'DedekindSum': 'dedekind_eta',
+    'EisensteinG': 'eisenstein',
+    'EisensteinE': 'eisenstein',
+    'ModularLambda': 'modular_lambda',
+    'ModularLambdaFundamentalDomain': 'modular_lambda',
+    'DirichletGroup': 'dirichlet',
+    'PrimitiveDirichletCharacters': 'dirichlet',
+    'DirichletCharacter': 'dirichlet',
+    'ConreyGenerator': 'dirichlet',
+    'DiscreteLog': 'dirichlet',
+    'DirichletL': 'dirichlet',
+    'GeneralizedBernoulliB': 'dirichlet',
+    'DirichletLZero': 'dirichlet',
+    'GeneralizedRiemannHypothesis': 'dirichlet',
+    'DirichletLambda': 'dirichlet',
+    'GaussSum': 'dirichlet',
+    'BetaFunction': 'beta_function',
+    'IncompleteBeta': 'beta_function',
+    'IncompleteBetaRegularized': 'beta_function',
+    'Totient': 'totient',
+    'LandauG': 'landau_function',
+    'ConstCatalan': 'const_catalan',
+    'DigammaFunction': 'digamma_function',
+    'DigammaFunctionZero': 'digamma_function',
+    'SloaneA': 'integer_sequences',
+    'MultiZetaValue': 'multiple_zeta_values',
+    'BellNumber': 'bell_numbers',
+    'BarnesG': 'barnes_g',
+    'LogBarnesG': 'barnes_g',
+    'LogBarnesGRemainder': 'barnes_g',
+    'HalphenConstant': 'halphen_constant',
+    'Cos': 'misc_descriptions',
+    'SquaresR': 'misc_descriptions',
+    'LiouvilleLambda': 'misc_descriptions',
+    'DivisorSigma': 'misc_descriptions',
+    'MoebiusMu': 'misc_descriptions',
+    'KroneckerDelta': 'misc_descriptions',
+    'LegendrePolynomial': 'misc_descriptions',
+    'LegendrePolynomialZero': 'misc_descriptions',
+    'GaussLegendreWeight': 'misc_descriptions',
+    'HermitePolynomial': 'misc_descriptions',
+    'BernsteinEllipse': 'misc_descriptions',
+    'UnitCircle': 'misc_descriptions',
+    'Matrix2x2': 'misc_descriptions',
+    'LogIntegral': 'misc_descriptions',
+    'RiemannXi': 'misc_descriptions',
+    'PowerSeries': 'misc_descriptions',
+    'LaurentSeries': 'misc_descriptions',
+    'List': 'misc_descriptions',
+    'Tuple': 'misc_descriptions',
+}
+
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+from ..expr import *
+
+describe(Cos, Cos(z), None, None, "Cosine")
+
+describe(SquaresR, SquaresR(k, n), [Element(k, ZZGreaterEqual(0)), Element(n, ZZ)], ZZ, "Sum of squares function")
+describe(LiouvilleLambda, LiouvilleLambda(n), [Element(n, ZZGreaterEqual(0))], ZZ, "Liouville function")
+describe(DivisorSigma, DivisorSigma(k, n), [Element(k, ZZGreaterEqual(0)), Element(n, ZZ)], ZZ, "Sum of divisors function")
+describe(MoebiusMu, MoebiusMu(n), [Element(n, ZZGreaterEqual(1))], ZZ, "Möbius function")
+describe(KroneckerDelta, KroneckerDelta(x,y), [Element(x, CC), Element(y, CC)], Set(0, 1), "Kronecker delta")
+describe(LegendrePolynomial, LegendrePolynomial(n,z), [Element(n, ZZGreaterEqual(0)), Element(z, CC)], CC, "Legendre polynomial")
+describe(LegendrePolynomialZero, LegendrePolynomialZero(n,k), [Element(n, ZZGreaterEqual(1)), Element(k, Range(1, n))], RR, "Legendre polynomial zero")
+describe(GaussLegendreWeight, GaussLegendreWeight(n,k), [Element(n, ZZGreaterEqual(1)), Element(k, Range(1, n))], RR, "Gauss-Legendre quadrature weight")
+describe(HermitePolynomial, HermitePolynomial(n,z), [Element(n, ZZGreaterEqual(0)), Element(z, CC)], CC, "Hermite polynomial")
+
+describe(BernsteinEllipse, BernsteinEllipse(rho), [Element(rho, RR), Greater(rho, 1)], PowerSet(CC), "Bernstein ellipse with foci -1,+1 and semi-axis sum rho")
+describe(UnitCircle, UnitCircle, [], PowerSet(CC), "Unit circle")
+
+describe(Matrix2x2, Matrix2x2(a,b,c,d), [], None, "Two by two matrix")
+
+describe(LogIntegral, LogIntegral(z), [Element(z, SetMinus(CC, Set(1)))], CC, "Logarithmic integral")
+describe(RiemannXi, RiemannXi(s), [Element(s, CC)], CC, "Riemann xi-function")
+
+describe2(PowerSeries, PowerSeries(K,x), "Formal power series", None,
+    Description("Represents the set of formal power series in the (formal) symbol", x,
+    "and with coefficients in the set", K, ", equivalently infinite series",
+    Sum(c(k) * x**k, Tuple(k, 0, Infinity)), "where", Element(c(k), K), "."))
+
+describe2(LaurentSeries, LaurentSeries(K,x), "Formal Laurent series", None,
+    Description("Represents the set of formal Laurent series in the (formal) symbol", x,
+    "and with coefficients in the set", K, ", equivalently infinite series",
+    Sum(c(k) * x**k, Tuple(k, n, Infinity)), "where", Element(c(k), K), "and", Element(n, ZZ), " may be negative."))
+
+describe2(List, List(Ellipsis), "List with given elements", None,
+    Description("Called with a finite number of arguments, represents the list with those arguments as elements.",
+    "The difference between a", List, "and a", Tuple, "is mainly notational (square brackets or parentheses).",
+    "A ", List, "is sometimes more natural for a homogeneous collection while a", Tuple,
+    "is more natural for a heterogeneous collection."))
+
+describe2(Tuple, Tuple(Ellipsis), "Tuple with given elements", None,
+    Description("Called with a finite number of arguments, represents the tuple with those arguments as elements.",
+    "The difference between a", List, "and a", Tuple, "is mainly notational (square brackets or parentheses).",
+    "A ", List, "is sometimes more natural for a homogeneous collection while a", Tuple,
+    "is more natural for a heterogeneous collection."))
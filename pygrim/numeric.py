@@ -1,4 +1,8 @@
+import flint
+from flint import arb, acb
+
 from .expr import *
+from .budget import check_budget
 
 # operators that may introduce bound variables, complicating symbol substitution
 dangerous_operators = set([
@@ -73,6 +77,705 @@ function_acb_method_table = {
 class ArbFiniteError(ValueError):
     pass
 
+class NumericHandler(object):
+    """
+    Evaluates expressions with a given head in ArbNumericalEvaluation
+    (see register_numeric).
+    """
+
+    __slots__ = ["head", "func", "arity", "domain", "eager"]
+
+    def __init__(self, head, func, arity=None, domain="complex", eager=True):
+        self.head = head
+        self.func = func
+        if isinstance(arity, int):
+            arity = (arity,)
+        self.arity = arity
+        self.domain = domain
+        self.eager = eager
+
+    def __repr__(self):
+        return "NumericHandler(%s, %s, arity=%r, domain=%r, eager=%r)" % (self.head,
+            self.func.__name__, self.arity, self.domain, self.eager)
+
+    def accepts(self, args):
+        return self.arity is None or len(args) in self.arity
+
+# head -> NumericHandler
+numeric_handlers = {}
+
+def register_numeric(head, func=None, arity=None, domain="complex", eager=True):
+    """
+    Registers func as the handler in ArbNumericalEvaluation for
+    expressions with the given head and a number of arguments in arity
+    (an int or a tuple of ints; None for any number), replacing any
+    previous handler for head. An eager handler is called as
+    func(*values) with the (arb or acb) values of the arguments, and
+    is also used by NumericPlan. Otherwise, it is called as
+    func(evaluation, *args, **kwargs) with the unevaluated arguments,
+    which it evaluates with evaluation.eval(arg, **kwargs) as needed.
+    The handler raises ArbFiniteError if the result is not finite (so
+    that the evaluation is retried at higher precision), and returns None
+    or raises ValueError if the expression cannot be evaluated. The domain
+    describes the arguments accepted: "complex" (numbers), "real" or
+    "integer" (some arguments must be integers), or None (the arguments
+    are not all numbers). Can be used as a decorator:
+
+        >>> F = Expr(symbol_name="F")
+        >>> @register_numeric(F, arity=1)
+        ... def eval_F(x):
+        ...     return x * x + 1
+        ...
+        >>> F(3).n()
+        RealBall(Decimal("10.000000000000000000"), 0)
+        >>> del numeric_handlers[F]
+
+    """
+    if func is None:
+        def decorator(func):
+            register_numeric(head, func, arity, domain, eager)
+            return func
+        return decorator
+    assert head.is_symbol()
+    numeric_handlers[head] = NumericHandler(head, func, arity, domain, eager)
+
+def supported_heads(eager=None):
+    """
+    Returns the names of the heads of the expressions (other than atoms)
+    that ArbNumericalEvaluation can evaluate, sorted; with eager=True
+    or eager=False, only those with eager or non-eager handlers.
+
+        >>> "BesselJ" in supported_heads(eager=True)
+        True
+        >>> "Where" in supported_heads(eager=True)
+        False
+    """
+    return sorted(head._symbol for (head, handler) in numeric_handlers.items()
+        if eager is None or handler.eager == eager)
+
+def finite(v):
+    if v.is_finite():
+        return v
+    raise ArbFiniteError
+
+@register_numeric(Mul)
+def eval_Mul(*args):
+    if len(args) == 0:
+        return arb(1)
+    x = args[0]
+    for y in args[1:]:
+        x *= y
+    return x
+
+@register_numeric(Add)
+def eval_Add(*args):
+    if len(args) == 0:
+        return arb(0)
+    x = args[0]
+    for y in args[1:]:
+        x += y
+    return x
+
+@register_numeric(Neg, arity=1)
+def eval_Neg(x):
+    return -x
+
+@register_numeric(Sub, arity=2)
+def eval_Sub(x, y):
+    return x - y
+
+@register_numeric(Div, arity=2)
+def eval_Div(x, y):
+    if y != 0:
+        return x / y
+    raise ArbFiniteError
+
+@register_numeric(Pow, arity=2)
+def eval_Pow(x, y):
+    v = x ** y
+    if v.is_finite():
+        return v
+    if isinstance(x, arb) and isinstance(y, arb):
+        return finite(acb(x) ** acb(y))
+    raise ArbFiniteError
+
+@register_numeric(Abs, arity=1)
+def eval_Abs(x):
+    return abs(x)
+
+@register_numeric(Re, arity=1)
+def eval_Re(v):
+    if isinstance(v, arb):
+        return finite(v)
+    return finite(v).real
+
+@register_numeric(Im, arity=1)
+def eval_Im(v):
+    if isinstance(v, arb):
+        finite(v)
+        return arb(0)
+    return finite(v).imag
+
+@register_numeric(Conjugate, arity=1)
+def eval_Conjugate(v):
+    if isinstance(v, arb):
+        return finite(v)
+    finite(v)
+    return acb(v.real, -v.imag)
+
+@register_numeric(Arg, arity=1)
+def eval_Arg(v):
+    return acb(finite(v)).arg()
+
+@register_numeric(Sign, arity=1)
+def eval_Sign(v):
+    return acb(finite(v)).sgn()
+
+@register_numeric(Floor, arity=1)
+def eval_Floor(v):
+    finite(v)
+    if isinstance(v, arb):
+        return finite(v.floor())
+    return finite(v.real.floor())
+
+@register_numeric(Ceil, arity=1)
+def eval_Ceil(v):
+    finite(v)
+    if isinstance(v, arb):
+        return finite(v.ceil())
+    return finite(v.real.ceil())
+
+def eval_identity(x):
+    return x
+
+for head in [Parentheses, Brackets, Braces]:
+    register_numeric(head, eval_identity, arity=1)
+
+def arb_method_handler(method):
+    def f(x):
+        v = getattr(x, method)()
+        if v.is_finite():
+            return v
+        # possible complex extension
+        if isinstance(x, arb):
+            return finite(getattr(acb(x), method)())
+        raise ArbFiniteError
+    f.__name__ = "eval_" + method
+    return f
+
+def acb_method_handler(method):
+    def f(x):
+        return finite(getattr(acb(x), method)())
+    f.__name__ = "eval_" + method
+    return f
+
+for head, method in function_arb_method_table.items():
+    register_numeric(head, arb_method_handler(method), arity=1)
+
+for head, method in function_acb_method_table.items():
+    register_numeric(head, acb_method_handler(method), arity=1)
+
+def bessel_handler(method):
+    def f(a, z):
+        return finite(getattr(acb(z), method)(a))
+    f.__name__ = "eval_" + method
+    return f
+
+register_numeric(BesselJ, bessel_handler("bessel_j"), arity=2)
+register_numeric(BesselI, bessel_handler("bessel_i"), arity=2)
+register_numeric(BesselY, bessel_handler("bessel_y"), arity=2)
+register_numeric(BesselK, bessel_handler("bessel_k"), arity=2)
+
+def hypgeom_handler(p, q, regularized):
+    def f(*args):
+        z = acb(args[-1])
+        if p == 0 and q == 1:
+            v = z.hypgeom_0f1(args[0], regularized=regularized)
+        elif p == 1 and q == 1:
+            v = z.hypgeom_1f1(args[0], args[1], regularized=regularized)
+        elif p == 2 and q == 1:
+            v = z.hypgeom_2f1(args[0], args[1], args[2], regularized=regularized)
+        else:
+            v = z.hypgeom(args[:p], args[p:p+q], regularized=regularized)
+        return finite(v)
+    f.__name__ = "eval_hypgeom_%if%i" % (p, q)
+    return f
+
+for (_p, _q, head, head_regularized) in [
+        (0, 1, Hypergeometric0F1, Hypergeometric0F1Regularized),
+        (1, 1, Hypergeometric1F1, Hypergeometric1F1Regularized),
+        (2, 1, Hypergeometric2F1, Hypergeometric2F1Regularized),
+        (1, 2, Hypergeometric1F2, Hypergeometric1F2Regularized),
+        (2, 2, Hypergeometric2F2, Hypergeometric2F2Regularized),
+        (3, 2, Hypergeometric3F2, Hypergeometric3F2Regularized)]:
+    register_numeric(head, hypgeom_handler(_p, _q, False), arity=_p+_q+1)
+    register_numeric(head_regularized, hypgeom_handler(_p, _q, True), arity=_p+_q+1)
+
+@register_numeric(HypergeometricU, arity=3)
+def eval_HypergeometricU(a, b, z):
+    return finite(acb(z).hypgeom_u(a, b))
+
+@register_numeric(HypergeometricUStar, arity=3)
+def eval_HypergeometricUStar(a, b, z):
+    # todo: implement in arb
+    z = acb(z)
+    return finite(z**a * z.hypgeom_u(a, b))
+
+@register_numeric(Hypergeometric2F0, arity=3)
+def eval_Hypergeometric2F0(a, b, z):
+    # todo: implement in arb
+    z = acb(z)
+    z = -1/z
+    return finite(z**a * z.hypgeom_u(a, a-b+1))
+
+def pfq_handler(regularized):
+    def f(evaluation, a, b, z, **kwargs):
+        if a.head() in (List, Tuple) and b.head() in (List, Tuple):
+            a = [evaluation.eval(arg, **kwargs) for arg in a.args()]
+            b = [evaluation.eval(arg, **kwargs) for arg in b.args()]
+            z = acb(evaluation.eval(z, **kwargs))
+            return finite(z.hypgeom(a, b, regularized=regularized))
+    f.__name__ = "eval_hypgeom_pfq"
+    return f
+
+register_numeric(HypergeometricPFQ, pfq_handler(False), arity=3, domain=None, eager=False)
+register_numeric(HypergeometricPFQRegularized, pfq_handler(True), arity=3, domain=None, eager=False)
+
+@register_numeric(CoulombF, arity=3)
+def eval_CoulombF(a, b, z):
+    return finite(acb(z).coulomb_f(a, b))
+
+@register_numeric(CoulombG, arity=3)
+def eval_CoulombG(a, b, z):
+    return finite(acb(z).coulomb_g(a, b))
+
+@register_numeric(JacobiTheta, arity=(3, 4), domain="integer", eager=False)
+def eval_JacobiTheta(evaluation, j, z, tau, r=None, **kwargs):
+    if r is None:
+        r = 0
+    else:
+        if not (r.is_integer() and r._integer >= 0):
+            raise ValueError
+        r = r._integer
+        if r > 1000:
+            raise NotImplementedError
+    if not (j.is_integer() and j._integer in (1,2,3,4)):
+        raise ValueError
+    j = j._integer
+    z = evaluation.eval(z, **kwargs)
+    tau = evaluation.eval(tau, **kwargs)
+    z = acb(z)
+    return finite(z.modular_theta(tau, r)[j-1])
+
+@register_numeric(CarlsonRF, arity=3)
+def eval_CarlsonRF(x, y, z):
+    return finite(acb.elliptic_rf(x, y, z))
+
+@register_numeric(CarlsonRG, arity=3)
+def eval_CarlsonRG(x, y, z):
+    return finite(acb.elliptic_rg(x, y, z))
+
+@register_numeric(CarlsonRD, arity=3)
+def eval_CarlsonRD(x, y, z):
+    return finite(acb.elliptic_rd(x, y, z))
+
+@register_numeric(CarlsonRJ, arity=4, eager=False)
+def eval_CarlsonRJ(evaluation, *args, **kwargs):
+    if flint.ctx.prec < 500:  # can be slow
+        x, y, z, p = [evaluation.eval(arg, **kwargs) for arg in args]
+        return finite(acb.elliptic_rj(x, y, z, p))
+
+@register_numeric(CarlsonRC, arity=2)
+def eval_CarlsonRC(x, y):
+    return finite(acb.elliptic_rc(x, y))
+
+@register_numeric(Decimal, arity=1, domain=None, eager=False)
+def eval_Decimal(evaluation, x, **kwargs):
+    return arb(x._text)
+
+@register_numeric(DirichletCharacter, arity=3, domain="integer", eager=False)
+def eval_DirichletCharacter(evaluation, q, l, n, **kwargs):
+    if q.is_integer() and l.is_integer() and n.is_integer():
+        q = q._integer
+        l = l._integer
+        n = n._integer
+        if q <= 10**12:   # arb limitation
+            try:
+                chi = flint.dirichlet_char(q, l)
+                return chi(n)
+            except (AssertionError, ValueError):
+                pass
+
+@register_numeric(EllipticPi, arity=2, eager=False)
+def eval_EllipticPi(evaluation, *args, **kwargs):
+    if flint.ctx.prec < 350:  # can be slow
+        x, y = [evaluation.eval(arg, **kwargs) for arg in args]
+        return finite(acb.elliptic_pi(x, y))
+
+@register_numeric(IncompleteEllipticF, arity=2)
+def eval_IncompleteEllipticF(phi, m):
+    return finite(acb.elliptic_f(phi, m))
+
+@register_numeric(IncompleteEllipticE, arity=2)
+def eval_IncompleteEllipticE(phi, m):
+    return finite(acb.elliptic_e_inc(phi, m))
+
+@register_numeric(IncompleteEllipticPi, arity=3, eager=False)
+def eval_IncompleteEllipticPi(evaluation, *args, **kwargs):
+    if flint.ctx.prec < 350:  # can be slow
+        n, phi, m = [evaluation.eval(arg, **kwargs) for arg in args]
+        return finite(acb.elliptic_pi_inc(n, phi, m))
+
+@register_numeric(DirichletL, arity=2, domain="integer", eager=False)
+def eval_DirichletL(evaluation, s, chi, **kwargs):
+    if chi.head() == DirichletCharacter and len(chi.args()) == 2:
+        q, l = chi.args()
+        if q.is_integer() and l.is_integer():
+            # todo: adjustable limit for this kind of thing?
+            if int(q) <= 1000000:
+                chi = flint.dirichlet_char(q._integer, l._integer)
+                s = evaluation.eval(s, **kwargs)
+                return finite(chi.l(s))
+
+@register_numeric(LambertW, arity=(1, 2), domain="integer", eager=False)
+def eval_LambertW(evaluation, x, k=None, **kwargs):
+    if k is None:
+        x = acb(evaluation.eval(x, **kwargs))
+        return finite(x.lambertw())
+    if k.is_integer():
+        x = acb(evaluation.eval(x, **kwargs))
+        return finite(x.lambertw(k._integer))
+
+def airy_handler(fname):
+    def f(evaluation, x, r=None, **kwargs):
+        x = evaluation.eval(x, **kwargs)
+        if r is None:
+            v = getattr(x, fname)()
+            if v.is_finite():
+                return v
+        elif r.is_integer():
+            r = r._integer
+            # todo: handle more directly in python-flint?
+            if 0 <= r <= 1000:
+                orig = flint.ctx.cap
+                try:
+                    flint.ctx.cap = r + 1
+                    if isinstance(x, arb):
+                        v = getattr(flint.arb_series([x,1]), fname)()[r] * arb.fac_ui(r)
+                    else:
+                        v = getattr(flint.acb_series([x,1]), fname)()[r] * arb.fac_ui(r)
+                finally:
+                    flint.ctx.cap = orig
+                if v.is_finite():
+                    return v
+    f.__name__ = "eval_" + fname
+    return f
+
+register_numeric(AiryAi, airy_handler("airy_ai"), arity=(1, 2), domain="integer", eager=False)
+register_numeric(AiryBi, airy_handler("airy_bi"), arity=(1, 2), domain="integer", eager=False)
+
+def eisenstein_handler(normalized):
+    def f(evaluation, n, tau, **kwargs):
+        # todo: wrap eisenstein series in python-flint
+        if n.is_integer():
+            n = n._integer
+            if n >= 2 and n % 2 == 0 and n <= 8:
+                tau = evaluation.eval(tau, **kwargs)
+                if n == 2:
+                    v = 2 * acb(0.5).elliptic_zeta(tau)
+                    if normalized:
+                        v /= (2 * arb(n).zeta())
+                else:
+                    _, a, b, c = acb(0).modular_theta(tau)
+                    if n == 4:
+                        v = 0.5 * (a**8 + b**8 + c**8)
+                    elif n == 6:
+                        v = 0.5 * (b**12 + c**12 - 3*a**8*(b**4 + c**4))
+                    else:
+                        v = 0.5 * (a**16 + b**16 + c**16)
+                    if not normalized:
+                        v *= (2 * arb(n).zeta())
+                if v.is_finite():
+                    return v
+    f.__name__ = "eval_eisenstein"
+    return f
+
+register_numeric(EisensteinG, eisenstein_handler(False), arity=2, domain="integer", eager=False)
+register_numeric(EisensteinE, eisenstein_handler(True), arity=2, domain="integer", eager=False)
+
+@register_numeric(HurwitzZeta, arity=2, eager=False)
+def eval_HurwitzZeta(evaluation, s, a, **kwargs):
+    if flint.ctx.prec < 1000:  # can be slow
+        s = evaluation.eval(s, **kwargs)
+        a = evaluation.eval(a, **kwargs)
+        s = acb(s)
+        return finite(s.zeta(a))
+
+@register_numeric(DigammaFunction, arity=(1, 2), domain="integer", eager=False)
+def eval_DigammaFunction(evaluation, z, n=None, **kwargs):
+    if n is None:
+        z = acb(evaluation.eval(z, **kwargs))
+        return finite(z.digamma())
+    if flint.ctx.prec < 1000:  # can be slow
+        if n.is_integer() and int(n) >= 0:
+            return evaluation.eval(PolyGamma(n, z), **kwargs)
+
+@register_numeric(PolyGamma, arity=2)
+def eval_PolyGamma(s, z):
+    return finite(acb(z).polygamma(s))
+
+@register_numeric(PolyLog, arity=2)
+def eval_PolyLog(s, z):
+    return finite(acb(z).polylog(s))
+
+@register_numeric(StieltjesGamma, arity=(1, 2), domain="integer", eager=False)
+def eval_StieltjesGamma(evaluation, n, a=None, **kwargs):
+    if flint.ctx.prec < 1000:  # can be slow
+        if a is None:
+            if n.is_integer() and int(n) >= 0:
+                v = acb.stieltjes(int(n))
+                if v.is_finite():
+                    return v
+        else:
+            a = evaluation.eval(a, **kwargs)
+            if n.is_integer() and int(n) >= 0:
+                v = acb.stieltjes(int(n), a)
+                if v.is_finite():
+                    return v
+
+@register_numeric(Where, domain=None, eager=False)
+def eval_Where(evaluation, *args, **kwargs):
+    symbol_stack = kwargs.get("symbol_stack", [])[:]
+    nv = len(args) - 1
+    assert nv >= 0
+    for arg in args[1:]:
+        if arg.head() == Equal and len(arg.args()) == 2:
+            var = arg.args()[0]
+            if var.is_symbol():
+                val = arg.args()[1]
+                val = evaluation.eval(val, **kwargs)
+                symbol_stack += [(var, val)]
+                kwargs["symbol_stack"] = symbol_stack
+            else:
+                raise NotImplementedError
+    # note: kwargs is a new copy, so we don't have to restore the stack
+    return evaluation.eval(args[0], **kwargs)
+
+# limits on the work for one Sum or Product node (number of terms)
+# and one Integral node (number of evaluations of the integrand)
+max_sum_terms = 10000
+max_integral_evaluations = 10000
+
+def unique_integer(v):
+    """
+    Returns the integer contained in the arb or acb v if it is unique,
+    or None.
+    """
+    if isinstance(v, acb):
+        if not v.imag.is_zero():
+            return None
+        v = v.real
+    return v.unique_fmpz()
+
+def sum_handler(product):
+    def f(evaluation, expr, forargs, **kwargs):
+        # Sum(f(n), For(n, a, b)) or Product(f(n), For(n, a, b)) with integers a, b
+        if forargs.head() == For and len(forargs.args()) == 3:
+            var, a, b = forargs.args()
+            if not var.is_symbol() or Infinity in forargs.symbol_set():
+                return None
+            a = unique_integer(evaluation.eval(a, **kwargs))
+            b = unique_integer(evaluation.eval(b, **kwargs))
+            if a is None or b is None or b - a + 1 > max_sum_terms:
+                return None
+            symbol_stack = kwargs.get("symbol_stack", [])
+            v = arb(int(product))
+            for i in range(int(a), int(b) + 1):
+                kwargs["symbol_stack"] = symbol_stack + [(var, arb(i))]
+                term = evaluation.eval(expr, **kwargs)
+                if product:
+                    v *= term
+                else:
+                    v += term
+            return finite(v)
+    f.__name__ = ["eval_Sum", "eval_Product"][product]
+    return f
+
+# todo: infinite sums and products (requiring bounds for the tails)
+register_numeric(Sum, sum_handler(False), arity=2, domain=None, eager=False)
+register_numeric(Product, sum_handler(True), arity=2, domain=None, eager=False)
+
+# functions analytic (or meromorphic, so that poles give non-finite values)
+# in all their arguments
+meromorphic_heads = set([Add, Mul, Neg, Sub, Div, Exp, Sin, Cos, Tan, Cot,
+    Sinh, Cosh, Tanh, Sinc, Gamma, Factorial, RiemannZeta, Erf, Erfc, Erfi,
+    Parentheses, Brackets, Braces])
+
+# functions of one argument z, analytic where the values of the given
+# expressions avoid (-inf, 0]
+branch_cuts = {
+    Sqrt: lambda z: [z],
+    Log: lambda z: [z],
+    LogGamma: lambda z: [z],
+    Atan: lambda z: [Add(1, Pow(z, 2))],
+    Asinh: lambda z: [Add(1, Pow(z, 2))],
+    Asin: lambda z: [Sub(1, Pow(z, 2))],
+    Acos: lambda z: [Sub(1, Pow(z, 2))],
+    Atanh: lambda z: [Sub(1, Pow(z, 2))],
+    Acosh: lambda z: [Sub(z, 1)],
+}
+
+def branch_cut_arguments(expr, var):
+    """
+    Returns a list of expressions such that expr is analytic as a
+    function of var wherever their values avoid (-inf, 0], or None
+    if expr contains functions not known to be analytic.
+
+        >>> branch_cut_arguments(Add(Exp(Pow(x, 2)), Sqrt(Sub(1, x))), x)
+        [Sub(1, x)]
+        >>> branch_cut_arguments(Abs(x), x) is None
+        True
+    """
+    if expr == var or var not in expr.symbol_set():
+        return []
+    if expr.is_atom():
+        return []
+    head = expr.head()
+    args = expr.args()
+    if head in meromorphic_heads:
+        cuts = []
+    elif head == Pow and len(args) == 2:
+        if args[1].is_integer():
+            cuts = []
+        else:
+            cuts = [args[0]]
+    elif head in branch_cuts and len(args) == 1:
+        cuts = branch_cuts[head](args[0])
+    else:
+        return None
+    for arg in args:
+        arg_cuts = branch_cut_arguments(arg, var)
+        if arg_cuts is None:
+            return None
+        cuts += arg_cuts
+    return cuts
+
+@register_numeric(Integral, arity=2, domain=None, eager=False)
+def eval_Integral(evaluation, expr, forargs, **kwargs):
+    # Integral(f(x), For(x, a, b)) with finite a, b
+    # todo: infinite intervals (requiring bounds for the tails)
+    if forargs.head() == For and len(forargs.args()) == 3:
+        var, a, b = forargs.args()
+        if not var.is_symbol() or Infinity in forargs.symbol_set():
+            return None
+        # without analyticity, acb.integral can only bisect (slowly)
+        cuts = branch_cut_arguments(expr, var)
+        if cuts is None:
+            return None
+        a = evaluation.eval(a, **kwargs)
+        b = evaluation.eval(b, **kwargs)
+        if not (a.is_finite() and b.is_finite()):
+            raise ArbFiniteError
+        symbol_stack = kwargs.get("symbol_stack", [])
+        nan = acb(arb("nan"))
+        def integrand(t, analytic):
+            kwargs["symbol_stack"] = symbol_stack + [(var, t)]
+            try:
+                # acb.integral requires a non-finite value where the
+                # integrand is not known to be analytic
+                if analytic:
+                    for arg in cuts:
+                        z = acb(evaluation.eval(arg, **kwargs))
+                        if not (z.real > 0 or z.imag > 0 or z.imag < 0):
+                            return nan
+                return acb(evaluation.eval(expr, **kwargs))
+            except ArbFiniteError:
+                return nan
+            except Exception as e:
+                # python-flint only propagates ValueError from the integrand
+                errors.append(e)
+                raise ValueError
+        errors = []
+        try:
+            v = acb.integral(integrand, a, b, eval_limit=max_integral_evaluations)
+        except ValueError:
+            if errors:
+                raise errors[0]
+            raise
+        if not v.is_finite():
+            # typically a singularity of the integrand, so that raising
+            # the precision would not help
+            raise ValueError("integral not finite")
+        if isinstance(a, arb) and isinstance(b, arb) and v.imag.is_zero():
+            v = v.real
+        return v
+
+@register_numeric(Factorial, arity=1)
+def eval_Factorial(z):
+    return finite((acb(z)+1).gamma())
+
+@register_numeric(Fibonacci, arity=1, domain="integer", eager=False)
+def eval_Fibonacci(evaluation, z, **kwargs):
+    z = z.simple()  # XXX
+    if z.is_integer():
+        return finite(arb.fib(int(z)))
+
+@register_numeric(BernoulliB, arity=1, domain="integer", eager=False)
+def eval_BernoulliB(evaluation, n, **kwargs):
+    n = n.simple()  # XXX
+    if n.is_integer() and int(n) >= 0:
+        return finite(arb.bernoulli(int(n)))
+
+@register_numeric(Binomial, arity=2, domain="integer", eager=False)
+def eval_Binomial(evaluation, z, n, **kwargs):
+    z = evaluation.eval(z, **kwargs)
+    n = n.simple()  # XXX
+    if n.is_integer() and int(n) >= 0 and int(n) <= 10**9 and isinstance(z, arb):   # XXX
+        return finite(z.bin(int(n)))
+
+@register_numeric(RisingFactorial, arity=2, domain="integer", eager=False)
+def eval_RisingFactorial(evaluation, z, n, **kwargs):
+    z = evaluation.eval(z, **kwargs)
+    n = n.simple()  # XXX
+    if n.is_integer() and int(n) >= 0 :
+        return finite(z.rising(int(n)))
+
+@register_numeric(RiemannZetaZero, arity=1, domain="integer", eager=False)
+def eval_RiemannZetaZero(evaluation, n, **kwargs):
+    n = n.simple()  # XXX
+    if n.is_integer():
+        n = int(n)
+        if 0 < abs(n) <= 10**8 or (flint.ctx.prec < 200 and 0 < abs(n) <= 10**12):    # XXX -- better with timeout?
+            # the computation cannot be interrupted, but at least is not started out of budget
+            check_budget()
+            v = acb.zeta_zero(abs(n))
+            if n < 0:
+                v = v.conjugate()
+            return finite(v)
+
+def airy_zero_handler(fname):
+    def f(evaluation, n, d=None, **kwargs):
+        if d is None:
+            d = Expr(0)
+        n = n.simple()  # XXX
+        d = d.simple()
+        if n.is_integer() and d.is_integer():
+            n = int(n)
+            d = int(d)
+            if n >= 1 and d in (0,1):
+                return finite(getattr(arb, fname)(n, d))
+    f.__name__ = "eval_" + fname
+    return f
+
+register_numeric(AiryAiZero, airy_zero_handler("airy_ai_zero"), arity=(1, 2), domain="integer", eager=False)
+register_numeric(AiryBiZero, airy_zero_handler("airy_bi_zero"), arity=(1, 2), domain="integer", eager=False)
+
+@register_numeric(AGM, arity=(1, 2))
+def eval_AGM(a, b=None):
+    if b is None:
+        return finite(acb(a).agm())
+    return finite(acb(a).agm(b))
+
 def arb_as_fungrim(x, d):
     import flint
     if not x.is_finite():
@@ -101,31 +804,217 @@ def arb_as_fungrim(x, d):
     raise TypeError
 
 
+class EnclosureCache(object):
+    """
+    Bounded (least recently used) cache of numerical enclosures of
+    constant expressions and their subexpressions, shared by all
+    evaluations with neval (and thus by Brain, Expr.test and
+    Ordner.build). For each expression, the enclosure computed at the
+    highest precision is kept; requests at that precision or lower are
+    served from it, rounded to the working precision. Failed evaluations
+    are not stored.
+
+        >>> from flint import ctx, arb
+        >>> cache = EnclosureCache(maxsize=2)
+        >>> ctx.prec = 100
+        >>> cache.store(Pi, 100, arb.pi())
+        >>> ctx.prec = 53
+        >>> cache.lookup(Pi, 53)
+        [3.14159265358979 +/- 3.57e-15]
+        >>> cache.lookup(Pi, 200) is None
+        True
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'evictions': 0, 'size': 1, 'maxsize': 2}
+        >>> cache.clear()
+    """
+
+    def __init__(self, maxsize=100000):
+        from collections import OrderedDict
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, expr, prec, accuracy=None):
+        """
+        Returns an enclosure of expr if one computed at precision prec
+        or higher (or, if accuracy is given, one with a relative accuracy
+        of at least that many bits) is cached, otherwise None.
+        """
+        entry = self.data.get(expr)
+        if entry is not None and (entry[0] >= prec or
+                (accuracy is not None and entry[1].rel_accuracy_bits() >= accuracy)):
+            self.data.move_to_end(expr)
+            self.hits += 1
+            return +entry[1]
+        self.misses += 1
+        return None
+
+    def peek(self, expr, prec=0):
+        """
+        Checks whether lookup(expr, prec) would hit, without updating
+        the statistics.
+        """
+        entry = self.data.get(expr)
+        return entry is not None and entry[0] >= prec
+
+    def store(self, expr, prec, value):
+        entry = self.data.get(expr)
+        if entry is not None and entry[0] >= prec:
+            return
+        self.data[expr] = (prec, value)
+        self.data.move_to_end(expr)
+        if self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.data)
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate(),
+            "evictions": self.evictions, "size": len(self.data), "maxsize": self.maxsize}
+
+enclosure_cache = EnclosureCache()
+
+# functions computing the values of the constants in the ConstantPool
+constant_functions = {
+    Pi: arb.pi,
+    ConstE: arb.const_e,
+    ConstGamma: arb.const_euler,
+    GoldenRatio: lambda: (1+arb(5).sqrt())/2,
+    ConstCatalan: arb.const_catalan,
+    ConstGlaisher: arb.const_glaisher,
+    Sqrt(2): lambda: arb(2).sqrt(),
+    Sqrt(3): lambda: arb(3).sqrt(),
+    Sqrt(Pi): lambda: arb.pi().sqrt(),
+    Log(2): arb.const_log2,
+    Log(10): arb.const_log10,
+}
+
+# heads of the nonatomic expressions in constant_functions
+constant_heads = set(expr.head() for expr in constant_functions if not expr.is_atom())
+
+class ConstantPool(object):
+    """
+    The values of the constants in constant_functions, by precision. A
+    value is computed only when the constant is requested at a precision
+    higher than any used so far; at lower precisions, it is derived from
+    the value at the highest precision by rounding.
+
+        >>> from flint import ctx
+        >>> pool = ConstantPool()
+        >>> ctx.prec = 100
+        >>> pool.get(Pi)
+        [3.1415926535897932384626433833 +/- 2.23e-29]
+        >>> ctx.prec = 53
+        >>> pool.get(Pi)
+        [3.14159265358979 +/- 3.57e-15]
+        >>> pool.get(Pi)
+        [3.14159265358979 +/- 3.57e-15]
+        >>> pool.get(x) is None
+        True
+        >>> pool.stats()
+        {'computed': 1, 'derived': 1, 'hits': 1, 'size': 2, 'maxsize': 10000}
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        # (expr, prec) -> value
+        self.values = {}
+        # expr -> (prec, value) with the highest precision
+        self.highest = {}
+        self.computed = 0
+        self.derived = 0
+        self.hits = 0
+
+    def get(self, expr):
+        """
+        Returns the value of expr at the current precision, or None if
+        expr is not one of the constants in constant_functions.
+        """
+        prec = flint.ctx.prec
+        key = (expr, prec)
+        v = self.values.get(key)
+        if v is not None:
+            self.hits += 1
+            return v
+        entry = self.highest.get(expr)
+        if entry is not None and entry[0] > prec:
+            v = +entry[1]
+            self.derived += 1
+        else:
+            func = constant_functions.get(expr)
+            if func is None:
+                return None
+            v = func()
+            self.highest[expr] = (prec, v)
+            self.computed += 1
+        if len(self.values) >= self.maxsize:
+            self.values.clear()
+        self.values[key] = v
+        return v
+
+    def __len__(self):
+        return len(self.values)
+
+    def clear(self):
+        self.values.clear()
+        self.highest.clear()
+        self.computed = 0
+        self.derived = 0
+        self.hits = 0
+
+    def stats(self):
+        return {"computed": self.computed, "derived": self.derived, "hits": self.hits,
+            "size": len(self.values), "maxsize": self.maxsize}
+
+constant_pool = ConstantPool()
+
 class ArbNumericalEvaluation(object):
 
     def __init__(self, cache=None):
+        """
+        With cache (an EnclosureCache), the values of all subexpressions
+        not depending on bound variables are looked up and stored there.
+        """
         import flint
         self.flint = flint
         self.cache = cache
+        self.handlers = numeric_handlers
+        self.constants = constant_pool
+        # number of nodes evaluated (calls of eval_inner)
+        self.operations = 0
 
     def eval(self, expr, **kwargs):
         # todo: don't re-evaluate non-numerical expressions
-        stack = kwargs.get("symbol_stack")
-
-        if self.cache is not None and stack is None:
-            wp = kwargs["wp"]
-            if expr in self.cache:
-                cached_wp, v = self.cache[expr]
-                if cached_wp >= wp:
-                    return +v
-
-        v = self.eval_inner(expr, **kwargs)
-
-        if self.cache is not None and stack is None:
-            wp = kwargs["wp"]
-            self.cache[expr] = (wp, v)
+        check_budget()
+        cache = self.cache
+        if cache is not None and "symbol_stack" not in kwargs:
+            prec = self.flint.ctx.prec
+            v = cache.lookup(expr, prec)
+            if v is None:
+                self.operations += 1
+                v = self.eval_inner(expr, **kwargs)
+                if v.is_finite():
+                    cache.store(expr, prec, v)
+            return v
 
-        return v
+        self.operations += 1
+        return self.eval_inner(expr, **kwargs)
 
     def eval_inner(self, expr, **kwargs):
 
@@ -137,20 +1026,11 @@ class ArbNumericalEvaluation(object):
             if expr.is_integer():
                 return arb(expr._integer)
             if expr.is_symbol():
-                if expr == Pi:
-                    return arb.pi()
-                if expr == ConstE:
-                    return arb.const_e()
-                if expr == ConstGamma:
-                    return arb.const_euler()
                 if expr == ConstI:
                     return acb(0,1)
-                if expr == GoldenRatio:
-                    return (1+arb(5).sqrt())/2
-                if expr == ConstCatalan:
-                    return arb.const_catalan()
-                if expr == ConstGlaisher:
-                    return arb.const_glaisher()
+                v = self.constants.get(expr)
+                if v is not None:
+                    return v
                 stack = kwargs.get("symbol_stack")
                 if stack is not None:
                     for (sym, val) in reversed(stack):
@@ -161,724 +1041,168 @@ class ArbNumericalEvaluation(object):
         head = expr.head()
         args = expr.args()
 
-        if head == Mul:
-            if len(args) == 0:
-                return arb(1)
-            x = self.eval(args[0], **kwargs)
-            for y in args[1:]:
-                y = self.eval(y, **kwargs)
-                x *= y
-            return x
-
-        if head == Add:
-            if len(args) == 0:
-                return arb(0)
-            x = self.eval(args[0], **kwargs)
-            for y in args[1:]:
-                y = self.eval(y, **kwargs)
-                x += y
-            return x
-
-        if head == Neg:
-            assert len(args) == 1
-            x = self.eval(args[0], **kwargs)
-            return (-x)
-
-        if head == Sub:
-            assert len(args) == 2
-            x = self.eval(args[0], **kwargs)
-            y = self.eval(args[1], **kwargs)
-            return x - y
-
-        if head == Div:
-            assert len(args) == 2
-            x = self.eval(args[0], **kwargs)
-            y = self.eval(args[1], **kwargs)
-            if y != 0:
-                return x / y
-            raise ArbFiniteError
-
-        if head == Pow:
-            assert len(args) == 2
-            x = self.eval(args[0], **kwargs)
-            y = self.eval(args[1], **kwargs)
-            v = x ** y
-            if v.is_finite():
-                return v
-            else:
-                if isinstance(x, arb) and isinstance(y, arb):
-                    v = acb(x) ** acb(y)
-                    if v.is_finite():
-                        return v
-            raise ArbFiniteError
-
-        if head == Abs:
-            assert len(args) == 1
-            x = self.eval(args[0], **kwargs)
-            return abs(x)
-
-        if head == Re:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                if isinstance(v, arb):
-                    return v
-                else:
-                    return v.real
-            raise ArbFiniteError
-
-        if head == Im:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                if isinstance(v, arb):
-                    return arb(0)
-                else:
-                    return v.imag
-            raise ArbFiniteError
-
-        if head == Conjugate:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                if isinstance(v, arb):
-                    return v
-                else:
-                    return acb(v.real, -v.imag)
-            raise ArbFiniteError
-
-        if head == Arg:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                return acb(v).arg()
-            raise ArbFiniteError
-
-        if head == Sign:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                return acb(v).sgn()
-            raise ArbFiniteError
-
-        if head == Floor:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                if isinstance(v, arb):
-                    v = v.floor()
-                else:
-                    v = v.real.floor()
-                if v.is_finite():
-                    return v
-            raise ArbFiniteError
-
-        if head == Ceil:
-            assert len(args) == 1
-            v = self.eval(args[0], **kwargs)
-            if v.is_finite():
-                if isinstance(v, arb):
-                    v = v.ceil()
-                else:
-                    v = v.real.ceil()
-                if v.is_finite():
-                    return v
-            raise ArbFiniteError
-
-        if head in (Parentheses, Brackets, Braces):
-            assert len(args) == 1
-            return self.eval(args[0], **kwargs)
-
-        if head in function_arb_method_table:
-            method = function_arb_method_table[head]
-            assert len(args) == 1
-            x = self.eval(args[0], **kwargs)
-            v = getattr(x, method)()
-            if v.is_finite():
-                return v
-            # possible complex extension
-            if isinstance(x, arb):
-                x = acb(x)
-                v = getattr(x, method)()
-                if v.is_finite():
-                    return v
-            raise ArbFiniteError
-
-        if head in function_acb_method_table:
-            method = function_acb_method_table[head]
-            assert len(args) == 1
-            x = self.eval(args[0], **kwargs)
-            x = acb(x)
-            v = getattr(x, method)()
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (BesselJ, BesselI, BesselY, BesselK):
-            if len(args) == 2:
-                a, z = [self.eval(arg, **kwargs) for arg in args]
-                z = acb(z)
-                if head == BesselJ:
-                    v = z.bessel_j(a)
-                elif head == BesselI:
-                    v = z.bessel_i(a)
-                elif head == BesselY:
-                    v = z.bessel_y(a)
-                else:
-                    v = z.bessel_k(a)
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-
-        if head in (Hypergeometric0F1, Hypergeometric0F1Regularized):
-            assert len(args) == 2
-            a, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom_0f1(a, regularized=(head == Hypergeometric0F1Regularized))
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (Hypergeometric1F1, Hypergeometric1F1Regularized):
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom_1f1(a, b, regularized=(head == Hypergeometric1F1Regularized))
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (Hypergeometric2F1, Hypergeometric2F1Regularized):
-            assert len(args) == 4
-            a, b, c, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom_2f1(a, b, c, regularized=(head == Hypergeometric2F1Regularized))
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (Hypergeometric1F2, Hypergeometric1F2Regularized):
-            assert len(args) == 4
-            a, b, c, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom([a], [b, c], regularized=(head == Hypergeometric1F2Regularized))
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (Hypergeometric2F2, Hypergeometric2F2Regularized):
-            assert len(args) == 5
-            a, b, c, d, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom([a, b], [c, d], regularized=(head == Hypergeometric2F2Regularized))
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (Hypergeometric3F2, Hypergeometric3F2Regularized):
-            assert len(args) == 6
-            a, b, c, d, e, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom([a, b, c], [d, e], regularized=(head == Hypergeometric3F2Regularized))
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == HypergeometricU:
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.hypgeom_u(a, b)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == HypergeometricUStar:
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            # todo: implement in arb
-            z = acb(z)
-            v = z**a * z.hypgeom_u(a, b)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == Hypergeometric2F0:
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            # todo: implement in arb
-            z = acb(z)
-            z = -1/z
-            v = z**a * z.hypgeom_u(a, a-b+1)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head in (HypergeometricPFQ, HypergeometricPFQRegularized):
-            assert len(args) == 3
-            a, b, z = args
-            if a.head() in (List, Tuple):
-                if b.head() in (List, Tuple):
-                    a = [self.eval(arg, **kwargs) for arg in a.args()]
-                    b = [self.eval(arg, **kwargs) for arg in b.args()]
-                    z = self.eval(z, **kwargs)
-                    z = acb(z)
-                    if head == HypergeometricPFQRegularized:
-                        v = z.hypgeom(a, b, regularized=True)
-                    else:
-                        v = z.hypgeom(a, b)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == CoulombF:
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.coulomb_f(a, b)
-            if v.is_finite():
+        if head in constant_heads:
+            v = self.constants.get(expr)
+            if v is not None:
                 return v
-            raise ArbFiniteError
 
-        if head == CoulombG:
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.coulomb_g(a, b)
-            if v.is_finite():
+        handler = self.handlers.get(head)
+        if handler is not None and handler.accepts(args):
+            if handler.eager:
+                return handler.func(*[self.eval(arg, **kwargs) for arg in args])
+            v = handler.func(self, *args, **kwargs)
+            if v is not None:
                 return v
-            raise ArbFiniteError
 
-        if head == CoulombG:
-            assert len(args) == 3
-            a, b, z = [self.eval(arg, **kwargs) for arg in args]
-            z = acb(z)
-            v = z.coulomb_g(a, b)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == JacobiTheta:
-            if len(args) == 3:
-                j, z, tau = args
-                r = 0
-            else:
-                j, z, tau, r = args
-                if not (r.is_integer() and r._integer >= 0):
-                    raise ValueError
-                r = r._integer
-                if r > 1000:
-                    raise NotImplementedError
-            if not (j.is_integer() and j._integer in (1,2,3,4)):
-                raise ValueError
-            j = j._integer
-            z = self.eval(z, **kwargs)
-            tau = self.eval(tau, **kwargs)
-            z = acb(z)
-            v = z.modular_theta(tau, r)[j-1]
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == CarlsonRF:
-            assert len(args) == 3
-            x, y, z = [self.eval(arg, **kwargs) for arg in args]
-            v = acb.elliptic_rf(x, y, z)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == CarlsonRG:
-            assert len(args) == 3
-            x, y, z = [self.eval(arg, **kwargs) for arg in args]
-            v = acb.elliptic_rg(x, y, z)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == CarlsonRD:
-            assert len(args) == 3
-            x, y, z = [self.eval(arg, **kwargs) for arg in args]
-            v = acb.elliptic_rd(x, y, z)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == CarlsonRJ:
-            assert len(args) == 4
-            if flint.ctx.prec < 500:  # can be slow
-                x, y, z, p = [self.eval(arg, **kwargs) for arg in args]
-                v = acb.elliptic_rj(x, y, z, p)
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-
-        if head == CarlsonRC:
-            assert len(args) == 2
-            x, y = [self.eval(arg, **kwargs) for arg in args]
-            v = acb.elliptic_rc(x, y)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
-
-        if head == Decimal:
-            assert len(args) == 1
-            x = arb(args[0]._text)
-            return x
-
-        if head == DirichletCharacter:
-            if len(args) == 3:
-                q, l, n = args
-                if q.is_integer() and l.is_integer() and n.is_integer():
-                    q = q._integer
-                    l = l._integer
-                    n = n._integer
-                    if q <= 10**12:   # arb limitation
-                        try:
-                            chi = self.flint.dirichlet_char(q, l)
-                            return chi(n)
-                        except (AssertionError, ValueError):
-                            pass
-
-        if head == EllipticPi:
-            assert len(args) == 2
-            if flint.ctx.prec < 350:  # can be slow
-                x, y = [self.eval(arg, **kwargs) for arg in args]
-                v = acb.elliptic_pi(x, y)
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-
-        if head == IncompleteEllipticF:
-            assert len(args) == 2
-            phi, m = [self.eval(arg, **kwargs) for arg in args]
-            v = acb.elliptic_f(phi, m)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
+        raise ValueError
 
-        if head == IncompleteEllipticE:
-            assert len(args) == 2
-            phi, m = [self.eval(arg, **kwargs) for arg in args]
-            v = acb.elliptic_e_inc(phi, m)
-            if v.is_finite():
-                return v
-            raise ArbFiniteError
+class AdaptiveNumericalEvaluation(ArbNumericalEvaluation):
+    """
+    Evaluates an expression to a required relative accuracy (need, in
+    bits), raising the precision only for the subexpressions that limit
+    the accuracy.
+
+    The expression is first evaluated once with guard extra bits of
+    working precision, as neval does without adaptation. If a node
+    whose accuracy is required (initially the root) is not accurate
+    enough, it is evaluated again, requiring from its arguments the
+    accuracy it needs plus twice the number of bits lost by the node
+    itself (as the loss often grows with the precision), or if the loss
+    cannot be measured, doubling the working precision. Arguments whose
+    cached enclosures are already accurate enough are reused, and the
+    others are refined in the same way.
+    """
+
+    guard = 25
+
+    def __init__(self, cache, need, maxprec):
+        ArbNumericalEvaluation.__init__(self, cache)
+        # required accuracy of the node being evaluated, and whether
+        # it must be attained (rather than only attempted once)
+        self.need = need
+        self.required = True
+        self.maxprec = maxprec
+        # minimum accuracy of the arguments of the node being evaluated
+        self.min_accuracy = None
+        # expressions that cannot be evaluated below maxprec
+        self.failed = set()
 
-        if head == IncompleteEllipticPi:
-            assert len(args) == 3
-            if flint.ctx.prec < 350:  # can be slow
-                n, phi, m = [self.eval(arg, **kwargs) for arg in args]
-                v = acb.elliptic_pi_inc(n, phi, m)
-                if v.is_finite():
-                    return v
+    def eval(self, expr, **kwargs):
+        if "symbol_stack" in kwargs:
+            # values depending on bound variables are evaluated (and the
+            # precision raised) as part of the enclosing expression
+            return ArbNumericalEvaluation.eval(self, expr, **kwargs)
+        check_budget()
+        # the working precision is need + guard (set by the parent)
+        need = self.need
+        v = self.cache.lookup(expr, need + self.guard, need)
+        if v is None:
+            if self.failed and expr in self.failed:
                 raise ArbFiniteError
+            v = self.refine(expr, kwargs)
+        if self.min_accuracy is not None:
+            self.min_accuracy = min(self.min_accuracy, v.rel_accuracy_bits())
+        return v
 
-        if head == DirichletL:
-            if len(args) == 2:
-                s, chi = args
-                if chi.head() == DirichletCharacter and len(chi.args()) == 2:
-                    q, l = chi.args()
-                    if q.is_integer() and l.is_integer():
-                        # todo: adjustable limit for this kind of thing?
-                        if int(q) <= 1000000:
-                            chi = self.flint.dirichlet_char(q._integer, l._integer)
-                            s = self.eval(s, **kwargs)
-                            v = chi.l(s)
-                            if v.is_finite():
-                                return v
-                            raise ArbFiniteError
-
-        if head == LambertW:
-            if len(args) == 1:
-                x, = args
-                x = self.eval(x, **kwargs)
-                x = acb(x) 
-                v = x.lambertw()
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-            if len(args) == 2:
-                x, k = args
-                if k.is_integer():
-                    k = k._integer
-                    x = self.eval(x, **kwargs)
-                    x = acb(x) 
-                    v = x.lambertw(k)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head in (AiryAi, AiryBi):
-            if head == AiryAi:
-                fname = "airy_ai"
-            else:
-                fname = "airy_bi"
-            if len(args) == 1:
-                x = args[0]
-                x = self.eval(x, **kwargs)
-                v = getattr(x, fname)()
-                if v.is_finite():
-                    return v
-            elif len(args) == 2:
-                x, r = args
-                x = self.eval(x, **kwargs)
-                if r.is_integer():
-                    r = r._integer
-                    # todo: handle more directly in python-flint?
-                    if 0 <= r <= 1000:
-                        orig = flint.ctx.cap
-                        try:
-                            flint.ctx.cap = r + 1
-                            if isinstance(x, arb):
-                                v = getattr(flint.arb_series([x,1]), fname)()[r] * arb.fac_ui(r)
-                            else:
-                                v = getattr(flint.acb_series([x,1]), fname)()[r] * arb.fac_ui(r)
-                        finally:
-                            flint.ctx.cap = orig
-                        if v.is_finite():
-                            return v
-
-        if head in (EisensteinG, EisensteinE):
-            # todo: wrap eisenstein series in python-flint
-            if len(args) == 2:
-                n, tau = args
-                if n.is_integer():
-                    n = n._integer
-                    if n >= 2 and n % 2 == 0 and n <= 8:
-                        tau = self.eval(tau, **kwargs)
-                        if n == 2:
-                            v = 2 * acb(0.5).elliptic_zeta(tau)
-                            if head == EisensteinE:
-                                v /= (2 * arb(n).zeta())
-                        else:
-                            _, a, b, c = acb(0).modular_theta(tau)
-                            if n == 4:
-                                v = 0.5 * (a**8 + b**8 + c**8)
-                            elif n == 6:
-                                v = 0.5 * (b**12 + c**12 - 3*a**8*(b**4 + c**4))
-                            else:
-                                v = 0.5 * (a**16 + b**16 + c**16)
-                            if head == EisensteinG:
-                                v *= (2 * arb(n).zeta())
-                        if v.is_finite():
-                            return v
-
-        if head == HurwitzZeta:
-            if len(args) == 2:
-                if flint.ctx.prec < 1000:  # can be slow
-                    s, a = args
-                    s = self.eval(s, **kwargs)
-                    a = self.eval(a, **kwargs)
-                    s = acb(s)
-                    v = s.zeta(a)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == DigammaFunction:
-            if len(args) == 1:
-                z, = args
-                z = self.eval(z, **kwargs)
-                z = acb(z)
-                v = z.digamma()
-                if v.is_finite():
+    def refine(self, expr, kwargs):
+        ctx = self.flint.ctx
+        need = self.need
+        required = self.required
+        parent_accuracy = self.min_accuracy
+        orig_prec = ctx.prec
+        child_need = need
+        # the first attempt only requires the arguments to be evaluated once
+        self.required = False
+        try:
+            while 1:
+                prec = child_need + self.guard
+                ctx.prec = prec
+                self.need = child_need
+                self.min_accuracy = float("inf")
+                self.operations += 1
+                try:
+                    v = self.eval_inner(expr, **kwargs)
+                    accuracy = v.rel_accuracy_bits()
+                except ArbFiniteError:
+                    v = None
+                    accuracy = -float("inf")
+                if v is not None and v.is_finite():
+                    self.cache.store(expr, prec, v)
+                if accuracy >= need or (v is not None and not required):
                     return v
-                raise ArbFiniteError
-            if len(args) == 2:
-                if flint.ctx.prec < 1000:  # can be slow
-                    z, n = args
-                    if n.is_integer() and int(n) >= 0:
-                        return self.eval(PolyGamma(n, z), **kwargs)
-
-        if head in (PolyGamma, PolyLog):
-            if len(args) == 2:
-                s, z = args
-                s = self.eval(s, **kwargs)
-                z = self.eval(z, **kwargs)
-                z = acb(z)
-                if head == PolyGamma:
-                    v = z.polygamma(s)
+                loss = self.min_accuracy - accuracy
+                if accuracy > 0 and 2 * loss < child_need:
+                    child_need = max(need + 2 * loss + 8, child_need + 8)
                 else:
-                    v = z.polylog(s)
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-
-        if head == StieltjesGamma:
-            if flint.ctx.prec < 1000:  # can be slow
-                if len(args) == 1:
-                    n = args[0]
-                    if n.is_integer() and int(n) >= 0:
-                        v = acb.stieltjes(int(n))
-                        if v.is_finite():
-                            return v
-                if len(args) == 2:
-                    n, a = args
-                    a = self.eval(a, **kwargs)
-                    if n.is_integer() and int(n) >= 0:
-                        v = acb.stieltjes(int(n), a)
-                        if v.is_finite():
-                            return v
-
-        if head == Where:
-            symbol_stack = kwargs.get("symbol_stack", [])[:]
-            nv = len(args) - 1
-            assert nv >= 0
-            for arg in args[1:]:
-                if arg.head() == Equal and len(arg.args()) == 2:
-                    var = arg.args()[0]
-                    if var.is_symbol():
-                        val = arg.args()[1]
-                        val = self.eval(val, **kwargs)
-                        symbol_stack += [(var, val)]
-                        kwargs["symbol_stack"] = symbol_stack
-                    else:
-                        raise NotImplementedError
-            v = self.eval(args[0], **kwargs)
-            # note: **kwargs is a new copy, so we don't have to restore the stack
-            return v
-
-        if head == Factorial:
-            if len(args) == 1:
-                z, = args
-                z = self.eval(z, **kwargs)
-                z = acb(z)
-                v = (z+1).gamma()
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-
-        if head == Fibonacci:
-            if len(args) == 1:
-                z, = args
-                z = z.simple()  # XXX
-                if z.is_integer():
-                    n = int(z)
-                    v = arb.fib(n)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == BernoulliB:
-            if len(args) == 1:
-                n, = args
-                n = n.simple()  # XXX
-                if n.is_integer() and int(n) >= 0:
-                    n = int(n)
-                    v = arb.bernoulli(n)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == Binomial:
-            if len(args) == 2:
-                z, n = args
-                z = self.eval(z, **kwargs)
-                n = n.simple()  # XXX
-                if n.is_integer() and int(n) >= 0 and int(n) <= 10**9 and isinstance(z, arb):   # XXX
-                    n = int(n)
-                    v = z.bin(n)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == RisingFactorial:
-            if len(args) == 2:
-                z, n = args
-                z = self.eval(z, **kwargs)
-                n = n.simple()  # XXX
-                if n.is_integer() and int(n) >= 0 :
-                    n = int(n)
-                    v = z.rising(n)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == RiemannZetaZero:
-            if len(args) == 1:
-                n, = args
-                n = n.simple()  # XXX
-                if n.is_integer():
-                    n = int(n)
-                    if 0 < abs(n) <= 10**8 or (flint.ctx.prec < 200 and 0 < abs(n) <= 10**12):    # XXX -- better with timeout?
-                        v = acb.zeta_zero(abs(n))
-                        if n < 0:
-                            v = v.conjugate()
-                        if v.is_finite():
-                            return v
+                    # double the working precision
+                    child_need = 2 * child_need + self.guard
+                if child_need + self.guard > self.maxprec:
+                    if v is None:
+                        self.failed.add(expr)
                         raise ArbFiniteError
-
-        if head in (AiryAiZero, AiryBiZero):
-            if len(args) == 1:
-                n, = args
-                d = Expr(0)
-            elif len(args) == 2:
-                n, d = args
-            n = n.simple()  # XXX
-            d = d.simple()
-            if n.is_integer() and d.is_integer():
-                n = int(n)
-                d = int(d)
-                if n >= 1 and d in (0,1):
-                    if head == AiryAiZero:
-                        v = arb.airy_ai_zero(n, d)
-                    else:
-                        v = arb.airy_bi_zero(n, d)
-                    if v.is_finite():
-                        return v
-                    raise ArbFiniteError
-
-        if head == AGM:
-            if len(args) == 1:
-                a, = args
-                a = self.eval(a, **kwargs)
-                v = acb(a).agm()
-                if v.is_finite():
-                    return v
-                raise ArbFiniteError
-            if len(args) == 2:
-                a, b = args
-                a = self.eval(a, **kwargs)
-                b = self.eval(b, **kwargs)
-                v = acb(a).agm(b)
-                if v.is_finite():
                     return v
-                raise ArbFiniteError
-
-        # todo: delete
-        if kwargs.get("full_traversal"):
-            for arg in expr.args():
-                try:
-                    self.eval(arg, **kwargs)
-                except (NotImplementedError, ValueError, ArbFiniteError):
-                    continue
-
-        raise ValueError
+                self.required = True
+        finally:
+            self.need = need
+            self.required = required
+            self.min_accuracy = parent_accuracy
+            ctx.prec = orig_prec
 
 def neval(expr, digits=20, **kwargs):
+    """
+    Evaluates expr numerically to digits digits, returning a ball as
+    an Expr (or with as_arb=True, an arb or acb). The values of the
+    subexpressions are taken from and added to enclosure_cache (or the
+    given cache; cache=None disables the shared cache).
+
+    If the result is not accurate enough, the whole expression is
+    evaluated again at doubled precision; with adaptive=True, the
+    precision is raised only for the subexpressions that limit the
+    accuracy (see AdaptiveNumericalEvaluation). This evaluates fewer
+    nodes, but is not faster on the constants in the corpus, so it is
+    not the default. With stats (a dict), the number of evaluated
+    nodes is added to stats["operations"].
+    """
     from flint import ctx, acb
     assert digits >= 1
     orig = ctx.prec
     target = digits * 3.33 + 5
     wp = digits * 3.33 + 30
     maxprec = wp * 10 + 4000
-    evaluator = ArbNumericalEvaluation()
+    cache = kwargs.get("cache", enclosure_cache)
+    adaptive = kwargs.get("adaptive", False)
+    if adaptive:
+        if cache is None:
+            cache = EnclosureCache(maxsize=None)
+        evaluator = AdaptiveNumericalEvaluation(cache, int(target), maxprec)
+    else:
+        evaluator = ArbNumericalEvaluation(cache)
     try:
-        while 1:
-            ctx.prec = wp
+        if adaptive:
             try:
+                ctx.prec = evaluator.need + evaluator.guard
                 v = evaluator.eval(expr)
             except ArbFiniteError:
                 v = acb("nan")
-            if v.rel_accuracy_bits() >= target:
-                break
-            wp *= 2
-            if wp > maxprec:
-                #raise ValueError("failed to converge")
-                break
+        else:
+            while 1:
+                check_budget()
+                ctx.prec = wp
+                try:
+                    v = evaluator.eval(expr)
+                except ArbFiniteError:
+                    v = acb("nan")
+                if v.rel_accuracy_bits() >= target:
+                    break
+                wp *= 2
+                if wp > maxprec:
+                    #raise ValueError("failed to converge")
+                    break
     finally:
         ctx.prec = orig
+        stats = kwargs.get("stats")
+        if stats is not None:
+            stats["operations"] = stats.get("operations", 0) + evaluator.operations
     if not v.is_finite():
         raise ValueError("failed to converge to a finite value")
     if isinstance(v, acb) and v.imag == 0:
@@ -888,3 +1212,503 @@ def neval(expr, digits=20, **kwargs):
     else:
         return arb_as_fungrim(v, digits)
 
+class NumericPlan(object):
+    """
+    An expression compiled for repeated numerical evaluation with
+    different values of the given variables: a list of instructions
+    computing the values of its subexpressions in registers, using the
+    eager handlers in numeric_handlers. Subexpressions not depending on the
+    variables are evaluated once for each precision, and those with
+    other heads are evaluated by ArbNumericalEvaluation, with the values
+    of the variables substituted (when given as Exprs, as some functions
+    require exact arguments) or on the symbol stack.
+
+        >>> plan = NumericPlan(Add(Sin(x), Mul(y, Pi)), [x, y])
+        >>> plan.neval([Div(1, 2), 2])
+        RealBall(Decimal("6.7626108457837894772"), Decimal("1.43e-21"))
+        >>> plan.neval({x: 0, y: ConstI}, 10)
+        Mul(RealBall(Decimal("3.141592654"), Decimal("4.11e-10")), ConstI)
+
+    """
+
+    def __init__(self, expr, variables):
+        self.expr = expr
+        self.variables = list(variables)
+        self.evaluator = ArbNumericalEvaluation(enclosure_cache)
+        handlers = numeric_handlers
+        variable_set = frozenset(self.variables)
+        registers = dict((var, i) for (i, var) in enumerate(self.variables))
+        # (register, expr) for the subexpressions not depending on the variables
+        self.constants = []
+        # (register, function, argument registers), or (register, None, expr)
+        # for a subexpression to evaluate with the evaluator
+        self.instructions = []
+        # the head of the expression computed by each instruction
+        self.heads = []
+        def compile(e):
+            if e in registers:
+                return registers[e]
+            if not (e.symbol_set() & variable_set):
+                r = len(registers)
+                self.constants.append((r, e))
+            else:
+                head = e.head()
+                handler = handlers.get(head)
+                if handler is not None and handler.eager and handler.accepts(e.args()):
+                    func = handler.func
+                    args = [compile(arg) for arg in e.args()]
+                    r = len(registers)
+                    self.instructions.append((r, func, args))
+                else:
+                    r = len(registers)
+                    self.instructions.append((r, None, e))
+                self.heads.append(head)
+            registers[e] = r
+            return r
+        self.result = compile(expr)
+        self.size = len(registers)
+        # registers with the values of the constants, by precision
+        self.constant_values = {}
+
+    def eval(self, values, exprs=None):
+        """
+        Evaluates the expression at the current working precision, given
+        a list of the (arb or acb) values of the variables, and optionally
+        a list of Exprs for the values.
+        """
+        check_budget()
+        prec = self.evaluator.flint.ctx.prec
+        registers = self.constant_values.get(prec)
+        if registers is None:
+            registers = [None] * self.size
+            for r, e in self.constants:
+                registers[r] = self.evaluator.eval(e)
+            if len(self.constant_values) >= 8:
+                self.constant_values.clear()
+            self.constant_values[prec] = registers
+        registers = registers[:]
+        registers[:len(values)] = values
+        for r, func, args in self.instructions:
+            if func is not None:
+                registers[r] = func(*[registers[i] for i in args])
+            elif exprs is not None:
+                e = args.replace(dict(zip(self.variables, exprs)), semantic=True)
+                registers[r] = self.evaluator.eval(e)
+            else:
+                stack = list(zip(self.variables, values))
+                registers[r] = self.evaluator.eval(args, symbol_stack=stack)
+        return registers[self.result]
+
+    def neval(self, values, digits=20, **kwargs):
+        """
+        Evaluates the expression to digits digits, as neval (doubling the
+        precision until the result is accurate enough), with the variables
+        set to values: a dict or a list in the order of the variables,
+        containing Exprs, arb or acb values or Python numbers.
+        """
+        from flint import ctx, arb, acb
+        assert digits >= 1
+        if isinstance(values, dict):
+            values = [values[var] for var in self.variables]
+        values = [v if isinstance(v, (Expr, arb, acb)) else number_as_fungrim(v) for v in values]
+        exprs = None
+        if all(isinstance(v, Expr) for v in values):
+            exprs = values
+        orig = ctx.prec
+        target = digits * 3.33 + 5
+        wp = digits * 3.33 + 30
+        maxprec = wp * 10 + 4000
+        try:
+            while 1:
+                ctx.prec = wp
+                try:
+                    v = self.eval([self.evaluator.eval(x) if isinstance(x, Expr) else x for x in values], exprs)
+                except ArbFiniteError:
+                    v = acb("nan")
+                if v.rel_accuracy_bits() >= target:
+                    break
+                wp *= 2
+                if wp > maxprec:
+                    break
+        finally:
+            ctx.prec = orig
+        if not v.is_finite():
+            raise ValueError("failed to converge to a finite value")
+        if isinstance(v, acb) and v.imag == 0:
+            v = v.real
+        if kwargs.get("as_arb"):
+            return v
+        else:
+            return arb_as_fungrim(v, digits)
+
+    def eval_numpy(self, values, perturbation=None):
+        """
+        Evaluates the expression in complex128 arithmetic, given a list
+        of NumPy arrays of values of the variables, returning an array
+        (or None if some instruction has no NumPy equivalent). With
+        perturbation (a complex number, or an array of them, for each
+        register), the values of the variables, the constants that are
+        not exactly representable and the result of each instruction are
+        multiplied by 1 + perturbation[r] for their register r.
+        """
+        from flint import ctx
+        functions = numpy_functions()
+        if functions is None:
+            return None
+        constants = self.constant_values.get("complex")
+        if constants is None:
+            registers = [None] * self.size
+            inexact = []
+            orig = ctx.prec
+            try:
+                ctx.prec = 64
+                for r, e in self.constants:
+                    v = self.evaluator.eval(e)
+                    registers[r] = as_complex(v)
+                    if not acb(registers[r]) == v:
+                        inexact.append(r)
+            except (ValueError, NotImplementedError, ZeroDivisionError):
+                return None
+            finally:
+                ctx.prec = orig
+            constants = registers, inexact
+            self.constant_values["complex"] = constants
+        registers, inexact = constants
+        registers = registers[:]
+        registers[:len(values)] = values
+        if perturbation is not None:
+            for r in list(range(len(values))) + inexact:
+                registers[r] = registers[r] * (1 + perturbation[r])
+        for i, (r, func, args) in enumerate(self.instructions):
+            func = functions.get(self.heads[i])
+            if func is None:
+                return None
+            v = func(*[registers[j] for j in args])
+            if perturbation is not None:
+                v = v * (1 + perturbation[r])
+            registers[r] = v
+        return registers[self.result]
+
+_plans = {}
+
+def numeric_plan(expr, variables):
+    """
+    Returns a NumericPlan for expr with the given variables, reusing
+    the plans compiled before (up to 1000).
+    """
+    key = (expr, tuple(variables))
+    plan = _plans.get(key)
+    if plan is None:
+        if len(_plans) >= 1000:
+            _plans.clear()
+        plan = _plans[key] = NumericPlan(expr, variables)
+    return plan
+
+def number_as_fungrim(x):
+    """
+    Converts a Python int, float or complex number to an exact Expr.
+
+        >>> number_as_fungrim(0.75), number_as_fungrim(2-1j)
+        (Div(3, 4), Add(2, Mul(-1, ConstI)))
+    """
+    if isinstance(x, complex):
+        if x.imag == 0:
+            return number_as_fungrim(x.real)
+        return Add(number_as_fungrim(x.real), Mul(number_as_fungrim(x.imag), ConstI))
+    if isinstance(x, float):
+        p, q = x.as_integer_ratio()
+        if q == 1:
+            return Expr(p)
+        return Div(p, q)
+    return Expr(x)
+
+def as_complex(x):
+    """
+    Converts an arb or acb to the complex number nearest to its midpoint.
+    """
+    from flint import arb
+    if isinstance(x, arb):
+        return complex(float(x.mid()))
+    return complex(float(x.real.mid()), float(x.imag.mid()))
+
+_numpy_functions = {}
+
+def numpy_functions():
+    """
+    Returns a dict mapping heads to NumPy functions computing values
+    in complex128 arithmetic (None if NumPy is not available). Only
+    functions whose branch cuts agree with those of Arb are included.
+    """
+    if _numpy_functions:
+        return _numpy_functions
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    from functools import reduce
+    def sign(z):
+        a = np.abs(z)
+        return np.where(a == 0, 0, z / np.where(a == 0, 1, a))
+    _numpy_functions.update({
+        Add: lambda *args: reduce(np.add, args),
+        Mul: lambda *args: reduce(np.multiply, args),
+        Neg: np.negative,
+        Sub: np.subtract,
+        Div: np.divide,
+        Pow: np.power,
+        Exp: np.exp,
+        Log: np.log,
+        Sqrt: np.sqrt,
+        Sin: np.sin,
+        Cos: np.cos,
+        Tan: np.tan,
+        Sinh: np.sinh,
+        Cosh: np.cosh,
+        Tanh: np.tanh,
+        Asin: np.arcsin,
+        Acos: np.arccos,
+        Atan: np.arctan,
+        Asinh: np.arcsinh,
+        Acosh: np.arccosh,
+        Atanh: np.arctanh,
+        Abs: np.abs,
+        Re: np.real,
+        Im: np.imag,
+        Conjugate: np.conj,
+        Arg: np.angle,
+        Sign: sign,
+        Floor: lambda z: np.floor(np.real(z)),
+        Ceil: lambda z: np.ceil(np.real(z)),
+        Parentheses: lambda x: x,
+        Brackets: lambda x: x,
+        Braces: lambda x: x,
+    })
+    return _numpy_functions
+
+def neval_batch(expr, variables, points, digits=10, **kwargs):
+    """
+    Evaluates expr at each of points (tuples of values of variables,
+    given as Exprs, arb or acb values or Python numbers), returning a
+    list with the value at each point as a complex number accurate to
+    digits digits, or None where expr cannot be evaluated. The
+    expression is compiled once (see numeric_plan).
+
+    If NumPy is available and digits <= 10, all points are first
+    evaluated in complex128 arithmetic. That result is trusted at a
+    point only if it is finite and perturbing the result of every
+    operation, and every input or constant that was rounded to a
+    double, by a relative 2^-40 in two opposite directions changes
+    it by less than 10^-digits (relatively), which rejects
+    cancellations, points on branch cuts and discontinuities. The
+    other points are evaluated with Arb. With as_arb=True, all points
+    are evaluated with Arb and the enclosures (arb or acb) are returned.
+    With stats (a dict), the number of points evaluated in each way is
+    added to stats["numpy"] and stats["arb"].
+
+        >>> neval_batch(Sub(Exp(x), 1), [x], [(0.5,), (1e-20,), (Log(2),)])
+        [(0.6487212707001282+0j), (1e-20+0j), (1+0j)]
+        >>> neval_batch(Log(x), [x], [(-1,), (ConstI,)], as_arb=True)
+        [[3.14159265358979 +/- 3.24e-15]j, [1.57079632679490 +/- 3.39e-15]j]
+
+    """
+    plan = numeric_plan(expr, variables)
+    points = [tuple(point) for point in points]
+    as_arb = kwargs.get("as_arb")
+    results = [None] * len(points)
+    todo = range(len(points))
+    stats = kwargs.get("stats")
+    if not as_arb and digits <= 10 and numpy_functions() is not None and points:
+        import numpy as np
+        from flint import ctx
+        values = []
+        # 1 where the value of a variable was rounded, else 0
+        inexact = []
+        orig = ctx.prec
+        try:
+            ctx.prec = 64
+            for var in range(len(plan.variables)):
+                column = []
+                rounded = []
+                for point in points:
+                    x = point[var]
+                    y = x
+                    if isinstance(x, Expr):
+                        try:
+                            y = plan.evaluator.eval(x)
+                            x = as_complex(y)
+                        except (ValueError, NotImplementedError, ZeroDivisionError):
+                            x = complex("nan")
+                    elif not isinstance(x, (int, float, complex)):
+                        x = as_complex(x)
+                    column.append(x)
+                    rounded.append(not isinstance(y, (int, float, complex)) and not acb(x) == y)
+                values.append(np.array(column, dtype=np.complex128))
+                inexact.append(np.array(rounded, dtype=np.float64))
+        finally:
+            ctx.prec = orig
+        with np.errstate(all="ignore"):
+            v = plan.eval_numpy(values)
+            if v is not None:
+                rng = np.random.default_rng(0)
+                perturbation = list(2.0**-40 * np.exp(2j * np.pi * rng.random(plan.size)))
+                for var in range(len(values)):
+                    perturbation[var] = perturbation[var] * inexact[var]
+                tol = 10.0**-digits * np.abs(v)
+                trusted = np.isfinite(v)
+                for sign in [1, -1]:
+                    w = plan.eval_numpy(values, [sign * p for p in perturbation])
+                    trusted &= np.abs(w - v) <= tol
+                v = np.broadcast_to(v, (len(points),))
+                trusted = np.broadcast_to(trusted, (len(points),))
+                for i in range(len(points)):
+                    if trusted[i]:
+                        results[i] = complex(v[i])
+                todo = [i for i in range(len(points)) if not trusted[i]]
+                if stats is not None:
+                    stats["numpy"] = stats.get("numpy", 0) + len(points) - len(todo)
+    for i in todo:
+        try:
+            v = plan.neval(points[i], digits, as_arb=True)
+        except (ValueError, NotImplementedError, ZeroDivisionError):
+            continue
+        if as_arb:
+            results[i] = v
+        else:
+            results[i] = as_complex(v)
+    if stats is not None:
+        stats["arb"] = stats.get("arb", 0) + len(todo)
+    return results
+
+class TestNumeric:
+
+    def __init__(self):
+        pass
+
+    def run(self):
+        for method in dir(self):
+            if method.startswith("test_"):
+                print(method, "...", end=" ")
+                getattr(self, method)()
+                print("OK!")
+
+    def test_enclosure_cache(self):
+        cache = EnclosureCache()
+        e = Add(Exp(Sqrt(2)), Log(Sqrt(2)))
+        v = neval(e, 30, as_arb=True, cache=cache)
+        assert cache.peek(e) and cache.peek(Sqrt(2))
+        prec = cache.data[e][0]
+        # lower precision: served from the cache
+        hits = cache.hits
+        w = neval(e, 10, as_arb=True, cache=cache)
+        assert cache.hits == hits + 1
+        assert w.overlaps(v) and w.rad() > v.rad()
+        # higher precision: the subexpressions are evaluated again
+        neval(Exp(Sqrt(2)), 60, as_arb=True, cache=cache)
+        assert cache.data[Sqrt(2)][0] > prec
+        assert cache.data[e][0] == prec
+        # failures are not stored
+        try:
+            neval(Add(Exp(x), 1), as_arb=True, cache=cache)
+        except (NotImplementedError, ValueError):
+            pass
+        assert not cache.peek(Exp(x)) and not cache.peek(Add(Exp(x), 1))
+
+    def test_adaptive(self):
+        # the product is inaccurate only because of the cancellation in
+        # Exp(2^-100) - 1, so Gamma(1/3) is not evaluated again
+        e = Mul(Gamma(Div(1, 3)), Sub(Exp(Pow(2, -100)), 1))
+        cache = EnclosureCache()
+        stats = {}
+        v = neval(e, 30, as_arb=True, cache=cache, adaptive=True, stats=stats)
+        assert v.rel_accuracy_bits() >= 100
+        assert cache.data[Gamma(Div(1, 3))][0] < cache.data[Exp(Pow(2, -100))][0]
+        stats2 = {}
+        w = neval(e, 30, as_arb=True, cache=None, adaptive=False, stats=stats2)
+        assert v.overlaps(w)
+        assert stats["operations"] < stats2["operations"]
+        for e in [Sin(Pi), Div(1, Sin(Pi))]:
+            for adaptive in [False, True]:
+                try:
+                    neval(e, as_arb=True, cache=None, adaptive=adaptive)
+                except ValueError:
+                    assert e == Div(1, Sin(Pi))
+
+    def test_plan(self):
+        from flint import arb, acb
+        e = Add(Mul(Sin(x), Exp(Pi)), RisingFactorial(x, n), Where(Pow(y, x), Equal(y, Sqrt(2))))
+        plan = numeric_plan(e, [x, n])
+        assert numeric_plan(e, [x, n]) is plan
+        assert [r for (r, e2) in plan.constants if e2 == Exp(Pi)]
+        # RisingFactorial and Where are evaluated with the values substituted
+        assert len([1 for (r, func, args) in plan.instructions if func is None]) == 2
+        for v in [Div(1, 3), 2, Add(1, ConstI)]:
+            w = plan.neval({x: v, n: 3}, 30, as_arb=True)
+            assert w.overlaps(neval(e.replace({x: v, n: 3}), 30, as_arb=True, cache=None))
+        plan = numeric_plan(Mul(Sin(x), Exp(Pi)), [x])
+        assert plan.neval([arb(2)], as_arb=True).overlaps(plan.neval([2], as_arb=True))
+        assert plan.neval([acb(0, 1)], as_arb=True).overlaps(plan.neval([ConstI], as_arb=True))
+
+    def test_handlers(self):
+        from flint import arb
+        F = Expr(symbol_name="F")
+        try:
+            register_numeric(F, lambda x, y: x - y, arity=2)
+            assert "F" in supported_heads(eager=True)
+            assert F(5, 2).n(as_arb=True) == 3
+            plan = numeric_plan(F(x, 1), [x])
+            assert plan.instructions[0][1] is numeric_handlers[F].func
+            assert plan.neval([arb(3)], as_arb=True) == 2
+            # wrong number of arguments
+            try:
+                F(1).n()
+                assert 0
+            except ValueError:
+                pass
+        finally:
+            del numeric_handlers[F]
+        assert "F" not in supported_heads()
+
+    def test_sum_integral(self):
+        assert neval(Sum(Div(1, Pow(k, 2)), For(k, 1, 10)), as_arb=True).overlaps(
+            neval(Div(1968329, 1270080), as_arb=True))
+        assert neval(Product(Div(k, Add(k, 1)), For(k, 1, Sub(Pow(2, 7), 1))), as_arb=True).overlaps(
+            neval(Div(1, 128), as_arb=True))
+        assert neval(Sum(k, For(k, 3, 2)), as_arb=True) == 0
+        # Catalan's constant
+        G = neval(ConstCatalan, 30, as_arb=True)
+        for e in [Integral(Asinh(Sin(x)), For(x, 0, Div(Pi, 2))),
+                  Mul(Div(Pi, 2), Integral(Mul(Gamma(Add(1, x)), Gamma(Sub(1, x))), For(x, 0, Div(1, 2))))]:
+            v = neval(e, 30, as_arb=True, cache=None)
+            assert v.overlaps(G) and v.rad() < 1e-29
+        assert neval(Where(Integral(Pow(x, n), For(x, 0, 1)), Equal(n, 3)), as_arb=True).overlaps(
+            neval(Div(1, 4), as_arb=True))
+        for e in [Sum(Div(1, Pow(k, 2)), For(k, 1, Infinity)),  # todo
+                  Sum(k, For(k, 1, Pow(10, 10))),
+                  Integral(Abs(x), For(x, -1, 1)),
+                  Integral(Div(1, x), For(x, 0, 1))]:
+            try:
+                neval(e, cache=None)
+                assert 0
+            except ValueError:
+                pass
+
+    def test_batch(self):
+        # the double-precision values are not trusted at these points
+        stats = {}
+        v = neval_batch(Sub(Exp(x), 1), [x], [(Pow(10, -20),), (0.5,)], stats=stats)
+        assert abs(v[0] - 1e-20) < 1e-30 and abs(v[1] - 0.6487212707001282) < 1e-15
+        assert stats["arb"] >= 1
+        v = neval_batch(Log(Conjugate(x)), [x], [(-1,), (2,)])
+        assert abs(v[0] - 3.141592653589793j) < 1e-15 and abs(v[1] - 0.6931471805599453) < 1e-15
+        assert Sqrt(x).n_batch([x], [(4,)]) == [2]
+        assert neval_batch(Div(Gamma(x), y), [x, y], [(5, 2), (0, 1), (1, 0)]) == [12, None, None]
+        v = neval_batch(Exp(x), [x], [(1,)], digits=30, as_arb=True)
+        assert v[0].overlaps(neval(Exp(1), 30, as_arb=True))
+        # nor where the inputs were rounded to doubles
+        a = Sub(1, Pow(10, -20))
+        v = neval_batch(Sub(x, 1), [x], [(a,)])
+        assert abs(v[0] + 1e-20) < 1e-30
+        assert neval_batch(Floor(x), [x], [(a,)]) == [0]
+        v = neval_batch(Mul(Sub(x, y), Pow(10, 30)), [x, y], [(Div(1, 3), Add(Div(1, 3), Pow(10, -25)))])
+        assert abs(v[0] + 1e5) < 1e-5
+        assert neval_batch(Floor(Sub(x, Pi)), [x], [(3.141592653589793,)]) == [-1]
@@ -0,0 +1,524 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rewrite rules extracted from Fungrim entries, and an index for finding
+the rules that may apply to an expression.
+
+A rule comes from an entry whose formula is Equal(lhs, rhs) and is valid
+for the entry's Variables under its Assumptions. The rules are stored in
+a DiscriminationTree keyed by the structure of lhs, so that for a given
+expression, only rules whose left-hand side can match it structurally
+need to be tried with Brain.match.
+"""
+
+from .expr import *
+
+# instructions of a compiled pattern
+BIND = 0
+CHECK = 1
+LITERAL = 2
+CALL_HEAD = 3
+
+class PatternMatcher(object):
+    """
+    A pattern with free variables, compiled into a flat list of
+    instructions that are executed on a stack of subexpressions,
+    following the pattern in preorder:
+
+        (BIND, i, None)    the first occurrence of variable i: bind it
+        (CHECK, i, None)   another occurrence: compare with the binding
+        (LITERAL, e, None) a subexpression without variables: compare with e
+        (CALL_HEAD, f, n)  a call f(a1, ..., a(n-1)): check the head and
+                           the number of arguments and push the arguments
+
+    As in Brain.match, a function being called is compared literally.
+
+        >>> m = PatternMatcher(Add(Mul(n, x), Pow(2, n)), [n, x])
+        >>> m.code
+        [(3, Add, 3), (3, Mul, 3), (0, 0, None), (0, 1, None), (3, Pow, 3), (2, 2, None), (1, 0, None)]
+        >>> m.match(Add(Mul(3, Pi), Pow(2, 3)))
+        {n: 3, x: Pi}
+        >>> m.match(Add(Mul(3, Pi), Pow(2, 4))) is None
+        True
+        >>> m.match(Add(Mul(3, Pi), Pow(2, 3), 1)) is None
+        True
+    """
+
+    def __init__(self, pattern, variables):
+        self.pattern = pattern
+        self.variables = []
+        self.code = []
+        variables = set(variables)
+        slots = {}
+        def compile(term):
+            if term in variables:
+                if term in slots:
+                    self.code.append((CHECK, slots[term], None))
+                else:
+                    slots[term] = len(self.variables)
+                    self.variables.append(term)
+                    self.code.append((BIND, slots[term], None))
+            elif term._kind != CALL or variables.isdisjoint(term.symbol_set()):
+                self.code.append((LITERAL, term, None))
+            else:
+                data = term._data
+                self.code.append((CALL_HEAD, data[0], len(data)))
+                for arg in data[1:]:
+                    compile(arg)
+        compile(pattern)
+
+    def match_values(self, expr):
+        """
+        Returns the list of values of the variables (in the order of
+        self.variables) if expr matches, and otherwise None.
+        """
+        values = [None] * len(self.variables)
+        stack = [expr]
+        pop = stack.pop
+        for op, a, b in self.code:
+            term = pop()
+            if op == BIND:
+                values[a] = term
+            elif op == CALL_HEAD:
+                if term._kind != CALL:
+                    return None
+                data = term._data
+                if len(data) != b or data[0] != a:
+                    return None
+                stack.extend(data[:0:-1])
+            elif op == LITERAL:
+                if term != a:
+                    return None
+            elif term != values[a]:
+                return None
+        return values
+
+    def match(self, expr):
+        """
+        Returns a dict of the values of the variables if expr matches,
+        and otherwise None.
+        """
+        values = self.match_values(expr)
+        if values is None:
+            return None
+        return dict(zip(self.variables, values))
+
+def _number_domain(x):
+    """
+    Returns ZZ, QQ, RR or CC if x is a number that is obviously in that
+    set (and in none of the smaller ones), or None.
+    """
+    kind = x._kind
+    if kind == INTEGER:
+        return ZZ
+    if kind == SYMBOL:
+        if x == Pi or x == ConstE:
+            return RR
+        if x == ConstI:
+            return CC
+        return None
+    if kind == CALL:
+        data = x._data
+        if data[0] == Neg and len(data) == 2:
+            return _number_domain(data[1])
+        if data[0] == Div and len(data) == 3 and data[1]._kind == INTEGER and data[2]._kind == INTEGER and data[2]._data != 0:
+            return QQ
+    return None
+
+_number_domains = [ZZ, QQ, RR, CC]
+
+def _integer_value(x):
+    """
+    Returns the value of x as a Python int if x is an integer atom or
+    the negation of one, and otherwise None.
+    """
+    if x._kind == INTEGER:
+        return x._data
+    data = x._data
+    if x._kind == CALL and data[0] == Neg and len(data) == 2:
+        v = _integer_value(data[1])
+        if v is not None:
+            return -v
+    return None
+
+def decide_element(x, S):
+    """
+    Decides Element(x, S) for some cases where x is an explicit number,
+    returning True, False or None (unknown).
+
+        >>> decide_element(Expr(3), SetMinus(ZZGreaterEqual(0), Set(1, 2)))
+        True
+        >>> decide_element(Expr(2), SetMinus(ZZGreaterEqual(0), Set(1, 2)))
+        False
+        >>> decide_element(Div(1, 2), RR), decide_element(Div(1, 2), HH)
+        (True, False)
+        >>> decide_element(Div(4, 2), ZZ) is None
+        True
+        >>> decide_element(Neg(3), Set(-3))
+        True
+    """
+    dom = _number_domain(x)
+    if dom is None:
+        return None
+    if S in _number_domains:
+        if _number_domains.index(dom) <= _number_domains.index(S):
+            return True
+        return None
+    if S == AlgebraicNumbers and dom != RR:
+        return True
+    if S == HH and dom != CC:
+        return False
+    head = S.head()
+    if head == SetMinus and len(S.args()) == 2:
+        a, b = S.args()
+        a = decide_element(x, a)
+        if a is False:
+            return False
+        b = decide_element(x, b)
+        if b is True:
+            return False
+        if a is True and b is False:
+            return True
+        return None
+    if dom != ZZ:
+        return None
+    v = _integer_value(x)
+    if v is None:
+        return None
+    if head == Set:
+        values = [_integer_value(t) for t in S.args()]
+        if None not in values:
+            return v in values
+        return None
+    if head in (ZZGreaterEqual, ZZLessEqual, Range):
+        bounds = [_integer_value(t) for t in S.args()]
+        if None in bounds:
+            return None
+        if head == ZZGreaterEqual and len(bounds) == 1:
+            return v >= bounds[0]
+        if head == ZZLessEqual and len(bounds) == 1:
+            return v <= bounds[0]
+        if head == Range and len(bounds) == 2:
+            return bounds[0] <= v <= bounds[1]
+    return None
+
+def _decide_element(term):
+    return decide_element(*term.args())
+
+def _decide_not_element(term):
+    v = decide_element(*term.args())
+    if v is None:
+        return None
+    return not v
+
+_comparisons = {
+    Equal: lambda a, b: a == b,
+    NotEqual: lambda a, b: a != b,
+    Less: lambda a, b: a < b,
+    LessEqual: lambda a, b: a <= b,
+    Greater: lambda a, b: a > b,
+    GreaterEqual: lambda a, b: a >= b,
+}
+
+def _decide_comparison(term):
+    a, b = term.args()
+    if a._kind == INTEGER and b._kind == INTEGER:
+        return _comparisons[term.head()](a._data, b._data)
+    return None
+
+class Condition(object):
+    """
+    Assumptions compiled for checking with given values of the variables.
+    The assumptions are split into the terms of a conjunction, and for
+    terms for which there is a decision procedure for explicit numbers
+    (membership in simple sets, comparison of integers), it is tried
+    before any simplification.
+
+        >>> from pygrim.brain import Brain
+        >>> cond = Condition(And(Element(n, ZZGreaterEqual(1)), Element(z, CC), Or(Element(z, RR), Element(z, HH))))
+        >>> len(cond.cheap), len(cond.general)
+        (2, 1)
+        >>> cond.check(Brain(), {n: Expr(3), z: Pi})
+        True
+        >>> cond.check(Brain(), {n: Expr(0), z: Pi})
+        False
+    """
+
+    def __init__(self, assumptions):
+        self.assumptions = assumptions
+        self.cheap = []
+        self.general = []
+        if assumptions != True_:
+            for term in assumptions.head_args_flattened(And):
+                head = term.head()
+                decide = None
+                if len(term.args()) == 2:
+                    if head == Element:
+                        decide = _decide_element
+                    elif head == NotElement:
+                        decide = _decide_not_element
+                    elif head in _comparisons:
+                        decide = _decide_comparison
+                if decide is None:
+                    self.general.append(term)
+                else:
+                    self.cheap.append((term, decide))
+
+    def check(self, brain, values):
+        """
+        Returns True if the assumptions simplify to True_ with brain after
+        substituting the values (a dict) for the variables.
+        """
+        rest = []
+        for term, decide in self.cheap:
+            term = term.replace(values)
+            v = decide(term)
+            if v is False:
+                return False
+            if v is None:
+                rest.append(term)
+        for term in rest:
+            if brain.simple(term) != True_:
+                return False
+        for term in self.general:
+            if brain.simple(term.replace(values)) != True_:
+                return False
+        return True
+
+class RewriteRule(object):
+    """
+    A rule lhs -> rhs valid for the free variables under the assumptions.
+    The left-hand side is compiled to a PatternMatcher and the assumptions
+    to a Condition.
+    """
+
+    def __init__(self, id, lhs, rhs, variables=(), assumptions=True_):
+        self.id = id
+        self.lhs = lhs
+        self.rhs = rhs
+        self.variables = tuple(variables)
+        self.assumptions = assumptions
+        self.matcher = PatternMatcher(lhs, variables)
+        self.condition = Condition(assumptions)
+
+    def __repr__(self):
+        return "RewriteRule(%r, %s, %s)" % (self.id, self.lhs, self.rhs)
+
+    def match(self, brain, expr):
+        """
+        Returns a dict of values for the variables such that lhs equals
+        expr and the assumptions hold (as far as brain can tell), or None.
+        """
+        values = self.matcher.match(expr)
+        if values is None or not self.condition.check(brain, values):
+            return None
+        return values
+
+    @staticmethod
+    def from_entry(entry):
+        """
+        Extracts the rule from an entry, raising ValueError if the entry
+        does not have a formula of the form Equal(lhs, rhs).
+        """
+        variables = entry.get_arg_with_head(Variables)
+        if variables is None:
+            variables = []
+        else:
+            variables = variables.args()
+        formula = entry.get_arg_with_head(Formula)
+        if formula is None:
+            raise ValueError("unsupported kind of entry for rewriting")
+        formula = formula.args()[0]
+        assumptions = entry.get_arg_with_head(Assumptions)
+        if assumptions is None:
+            assumptions = True_
+        else:
+            assumptions = assumptions.args()[0]
+        if formula.head() != Equal or len(formula.args()) != 2:
+            raise ValueError("unsupported kind of entry for rewriting")
+        lhs, rhs = formula.args()
+        return RewriteRule(entry.id(), lhs, rhs, variables, assumptions)
+
+_rules = {}
+
+def fungrim_rule(id):
+    """
+    Returns the RewriteRule for the entry with the given ID (extracted
+    once and cached).
+    """
+    rule = _rules.get(id)
+    if rule is None:
+        from .formulas import entries_dict
+        rule = _rules[id] = RewriteRule.from_entry(entries_dict[id])
+    return rule
+
+_compiled = {}
+
+def compiled_rule(lhs, variables, assumptions):
+    """
+    Returns a RewriteRule (without right-hand side) for matching lhs,
+    compiled once for each combination of arguments.
+    """
+    key = (lhs, tuple(variables), assumptions)
+    rule = _compiled.get(key)
+    if rule is None:
+        rule = _compiled[key] = RewriteRule(None, lhs, None, variables, assumptions)
+    return rule
+
+_wild = object()
+_leaf = object()
+
+class DiscriminationTree(object):
+    """
+    Index of patterns (with free variables) supporting retrieval of the
+    patterns that may match a given expression.
+
+    Each pattern is stored as the path of keys obtained by traversing
+    it in preorder: a function call f(a1, ..., an) gives the key (f, n)
+    followed by the keys of the arguments, a free variable gives a
+    wildcard matching any subexpression, and any other atom gives itself.
+    As in Brain.match, a function being called is compared literally.
+    Retrieval may return patterns that do not match (when a variable
+    occurs more than once), but never misses one.
+
+        >>> tree = DiscriminationTree()
+        >>> tree.insert(Gamma(Add(n, 1)), [n], "A")
+        >>> tree.insert(Gamma(Div(1, 2)), [], "B")
+        >>> tree.insert(Gamma(z), [z], "C")
+        >>> tree.insert(Sin(Add(x, x)), [x], "D")
+        >>> tree.candidates(Gamma(Add(Pi, 1)))
+        ['C', 'A']
+        >>> tree.candidates(Gamma(Div(1, 2)))
+        ['C', 'B']
+        >>> tree.candidates(Sin(Add(1, 2)))
+        ['D']
+        >>> tree.candidates(Cos(Add(1, 2)))
+        []
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def insert(self, pattern, variables, value):
+        """
+        Adds value, to be retrieved for expressions that may match
+        pattern with the given free variables.
+        """
+        variables = set(variables)
+        node = self.root
+        terms = [pattern]
+        while terms:
+            term = terms.pop()
+            if term in variables:
+                key = _wild
+            elif term._kind == CALL:
+                args = term._data[1:]
+                key = (term._data[0], len(args))
+                terms.extend(reversed(args))
+            else:
+                key = term
+            node = node.setdefault(key, {})
+        node.setdefault(_leaf, []).append(value)
+        self.size += 1
+
+    def candidates(self, expr):
+        """
+        Returns a list of the values of all patterns that may match expr.
+        """
+        result = []
+        def search(node, terms):
+            if terms is None:
+                values = node.get(_leaf)
+                if values is not None:
+                    result.extend(values)
+                return
+            term, rest = terms
+            child = node.get(_wild)
+            if child is not None:
+                search(child, rest)
+            if term._kind == CALL:
+                data = term._data
+                child = node.get((data[0], len(data) - 1))
+                if child is not None:
+                    for i in range(len(data) - 1, 0, -1):
+                        rest = (data[i], rest)
+                    search(child, rest)
+            else:
+                child = node.get(term)
+                if child is not None:
+                    search(child, rest)
+        search(self.root, (expr, None))
+        return result
+
+_index = None
+
+def fungrim_rule_index():
+    """
+    Returns a DiscriminationTree of the rewrite rules (with at least one
+    variable, and a function call as the left-hand side) for all entries
+    in Fungrim, built on first use.
+    """
+    global _index
+    if _index is None:
+        from . import formulas
+        formulas.load_all()
+        index = DiscriminationTree()
+        for entry in all_entries:
+            if entry.get_arg_with_head(Variables) is None:
+                continue
+            try:
+                rule = fungrim_rule(entry.id())
+            except ValueError:
+                continue
+            if rule.lhs.is_atom():
+                continue
+            index.insert(rule.lhs, rule.variables, rule)
+        _index = index
+    return _index
+
+class TestRules:
+
+    def __init__(self):
+        pass
+
+    def run(self):
+        for method in dir(self):
+            if method.startswith("test_"):
+                print(method, "...", end=" ")
+                getattr(self, method)()
+                print("OK!")
+
+    def test_fungrim_rule_index(self):
+        from .brain import Brain
+        index = fungrim_rule_index()
+        rules = [rule for rule in _rules.values() if rule.lhs.head() in (Gamma, Sin, Exp, Pow)]
+        b = Brain()
+        for expr in [Gamma(Add(Div(1, 3), 1)), Sin(Add(Pi, 1)), Exp(Mul(Pi, ConstI)), Pow(GoldenRatio, 3)]:
+            candidates = index.candidates(expr)
+            # every matching rule is a candidate
+            for rule in rules:
+                if b.match(expr, rule.lhs, rule.variables) is not None:
+                    assert rule in candidates
+            # and there are fewer candidates than rules with the same head
+            same_head = [rule for rule in rules if rule.lhs.head() == expr.head()]
+            assert len(candidates) < len(same_head)
+
+    def test_match(self):
+        from .brain import Brain
+        b = Brain()
+        assert b.match(Gamma(Add(Pi, 1)), Gamma(Add(z, 1)), [z]) == {z: Pi}
+        assert b.match(Gamma(Add(Pi, 1)), Gamma(Add(z, 1)), [z], Element(z, ZZ)) is None
+        assert b.match(Gamma(Add(3, 1)), Gamma(Add(n, 1)), [n], Element(n, ZZGreaterEqual(0))) == {n: Expr(3)}
+        # a subexpression equal to the pattern must still bind the variables
+        assert b.match(Binomial(Mul(2, n), k), Binomial(Mul(2, n), n), [n]) is None
+        assert b.match(Binomial(Mul(2, n), n), Binomial(Mul(2, n), n), [n]) == {n: n}
+        assert b.match(Gamma(Neg(3)), Gamma(n), [n], Element(n, ZZGreaterEqual(0))) is None
+        assert b.match(Gamma(Neg(3)), Gamma(n), [n], Element(n, ZZLessEqual(0))) == {n: Neg(3)}
+
+    def test_decide_element(self):
+        assert decide_element(Neg(3), Set(-3)) is True
+        assert decide_element(Neg(3), Set(3)) is False
+        assert decide_element(Neg(Neg(3)), Range(1, 3)) is True
+        assert decide_element(Expr(2), ZZGreaterEqual(Neg(1))) is True
+        assert decide_element(Neg(Div(1, 2)), Set(-1)) is None
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compact binary serialization of expressions, used to snapshot the
+formula corpus (see pygrim.formulas.write_snapshot).
+
+A set of expressions is stored as a shared table of symbol names and a
+list of nodes in which structurally equal subexpressions occur only once
+(each distinct subexpression is stored once and referenced by index).
+Children always precede their parents, so the nodes can be decoded in
+a single pass. The result is serialized with marshal.
+"""
+
+import marshal
+import sys
+
+from .expr import *
+from .expr import _symbol_by_name
+
+SNAPSHOT_FORMAT = 1
+
+class ExprEncoder(object):
+    """
+    Assigns node indices to expressions, sharing equal subexpressions.
+
+        >>> enc = ExprEncoder()
+        >>> enc.add(Add(x, Mul(x, x)))
+        4
+        >>> enc.add(Mul(x, x))
+        3
+        >>> enc.symbols
+        ['Add', 'x', 'Mul']
+        >>> enc.nodes
+        [(0, 0), (0, 1), (0, 2), (3, 2, 1, 1), (3, 0, 1, 3)]
+    """
+
+    def __init__(self):
+        self.symbols = []
+        self.symbol_index = {}
+        self.nodes = []
+        self.node_index = {}
+
+    def add(self, expr):
+        """
+        Returns the index of the node for expr, adding it (and its
+        subexpressions) if necessary.
+        """
+        index = self.node_index.get(expr)
+        if index is not None:
+            return index
+        kind = expr._kind
+        if kind == SYMBOL:
+            name = expr._data
+            if name not in self.symbol_index:
+                self.symbol_index[name] = len(self.symbols)
+                self.symbols.append(name)
+            node = (SYMBOL, self.symbol_index[name])
+        elif kind == CALL:
+            node = (CALL,) + tuple(self.add(arg) for arg in expr._data)
+        else:
+            node = (kind, expr._data)
+        index = len(self.nodes)
+        self.nodes.append(node)
+        self.node_index[expr] = index
+        return index
+
+def decode_nodes(symbols, nodes):
+    """
+    Inverse of ExprEncoder: returns the list of expressions for the
+    given symbol table and nodes. Builtin symbols and variables are
+    mapped to the existing objects (so that checks such as
+    head() is Entries keep working).
+    """
+    symbols = [_symbol_by_name(name) for name in symbols]
+    exprs = []
+    append = exprs.append
+    for node in nodes:
+        kind = node[0]
+        if kind == CALL:
+            append(Expr(call=tuple([exprs[i] for i in node[1:]])))
+        elif kind == SYMBOL:
+            append(symbols[node[1]])
+        else:
+            append(Expr(node[1]))
+    return exprs
+
+def header():
+    return (SNAPSHOT_FORMAT, marshal.version, tuple(sys.version_info[:2]))
+
+def dump(fp, symbols, nodes, data):
+    """
+    Writes a snapshot consisting of an encoded symbol table and node list
+    together with data (any marshallable object, typically referring to
+    expressions by node index).
+    """
+    marshal.dump((header(), symbols, nodes, data), fp)
+
+def load(fp):
+    """
+    Reads a snapshot written by dump, returning (exprs, data), where exprs
+    is the list of decoded expressions. Raises ValueError if the snapshot
+    has an incompatible format.
+    """
+    try:
+        # much faster than marshal.load(fp)
+        head, symbols, nodes, data = marshal.loads(fp.read())
+    except (EOFError, TypeError) as e:
+        raise ValueError("invalid snapshot (%s)" % e)
+    if head != header():
+        raise ValueError("incompatible snapshot format")
+    return decode_nodes(symbols, nodes), data
+
+class TestSnapshot:
+
+    def __init__(self):
+        pass
+
+    def run(self):
+        for method in dir(self):
+            if method.startswith("test_"):
+                print(method, "...", end=" ")
+                getattr(self, method)()
+                print("OK!")
+
+    def test_roundtrip(self):
+        import io
+        exprs = [Add(x, Mul(x, x)), Element(x, CC), Pow(y, -3), Entries("abc"), Expr(10**30)]
+        enc = ExprEncoder()
+        roots = [enc.add(e) for e in exprs]
+        fp = io.BytesIO()
+        dump(fp, enc.symbols, enc.nodes, roots)
+        fp.seek(0)
+        decoded, roots2 = load(fp)
+        assert roots == roots2
+        for e, i in zip(exprs, roots):
+            assert decoded[i] == e
+        # builtin symbols are not duplicated
+        assert decoded[roots[3]].head() is Entries
+        # shared subexpressions are the same object
+        assert decoded[roots[0]].args()[0] is decoded[roots[0]].args()[1].args()[0]
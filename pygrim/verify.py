@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parallel numerical verification of the formulas in pygrim.formulas.
+
+Each entry is tested (as by test_fungrim_entry) in a forked child
+process with a wall-clock timeout and a limit on its address space, so
+that an entry triggering a runaway computation cannot stall or exhaust
+the whole run. The results are appended to a JSONL file, one record per
+entry, for example:
+
+    {"id": "590136", "hash": "...", "status": "ok", "timeout": false,
+     "True": 1, "Unknown": 0, "False": 0, "Total": 1, "time": 0.012}
+
+The status is one of ok, false (some instance simplified to False),
+timeout, error (an exception was raised; see "error") and crashed (the
+child process died). Since every record is written as soon as the entry
+finishes, an interrupted run can be resumed.
+
+The file also serves as a store of results (see ResultStore) keyed by
+entry_hash, a hash of the entry's Formula, Variables and Assumptions and
+of the pygrim source code. Entries with a stored result are skipped
+(unless forced), so only new or changed entries are run again, and the
+new results are compared with the previous ones to report regressions
+and slowdowns.
+
+    python -m pygrim.verify --jobs 8 --timeout 60 --out verify.jsonl
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+from .expr import *
+
+def formula_parts(entry):
+    """
+    Returns (formula, variables, assumptions) for an entry, or None
+    if the entry has no Formula.
+    """
+    formula = entry.get_arg_with_head(Formula)
+    if formula is None:
+        return None
+    formula = formula.args()[0]
+    variables = entry.get_arg_with_head(Variables)
+    if variables is None:
+        variables = []
+    else:
+        variables = variables.args()
+    assumptions = entry.get_arg_with_head(Assumptions)
+    if assumptions is None:
+        assumptions = True_
+    else:
+        # todo: multiple args to Assumptions()
+        assumptions = assumptions.args()[0]
+    return formula, variables, assumptions
+
+_code_version = None
+
+def code_version():
+    """
+    Hash of the pygrim source files (except the formulas), standing in for
+    the version of the code that decides the test results.
+    """
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha1()
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), "rb") as fp:
+                    h.update(fp.read())
+        _code_version = h.hexdigest()
+    return _code_version
+
+def entry_hash(entry):
+    """
+    Hash of the parts of an entry that determine the test result,
+    together with code_version().
+    """
+    parts = [entry.get_arg_with_head(head) for head in [Formula, Variables, Assumptions]]
+    return hashlib.sha1((repr(parts) + code_version()).encode("utf-8")).hexdigest()
+
+def verify_entry(entry, num=100):
+    """
+    Tests the formula of entry with num instances, returning a record
+    (without id and hash) as described in the module docstring.
+    """
+    record = {"status": "ok", "timeout": False, "True": 0, "Unknown": 0, "False": 0, "Total": 0}
+    t0 = time.time()
+    parts = formula_parts(entry)
+    if parts is not None:
+        formula, variables, assumptions = parts
+        try:
+            info = formula.test(variables, assumptions, num=num, verbose=False, raising=False)
+        except MemoryError:
+            record["status"] = "error"
+            record["error"] = "MemoryError"
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = "%s: %s" % (type(e).__name__, str(e)[:200])
+        else:
+            record.update(info)
+            if info["False"]:
+                record["status"] = "false"
+    record["time"] = round(time.time() - t0, 3)
+    return record
+
+def load_results(path):
+    """
+    Returns a dict mapping entry IDs to their last record in the
+    JSONL file at path. A truncated last line (from a crash) is ignored.
+    """
+    return ResultStore(path).by_id
+
+class ResultStore(object):
+    """
+    The verification results in a JSONL file, indexed both by hash (to
+    find the result for the current version of an entry) and by ID (the
+    latest result, used for comparisons).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.by_hash = {}
+        self.by_id = {}
+        try:
+            fp = open(path, encoding="utf-8")
+        except OSError:
+            return
+        with fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self.by_hash[record["hash"]] = record
+                self.by_id[record["id"]] = record
+
+    def lookup(self, id, hash):
+        """
+        Returns the stored record for entry id with the given hash, or None.
+        """
+        record = self.by_hash.get(hash)
+        if record is not None and record["id"] == id:
+            return record
+        return None
+
+    def add(self, record):
+        with open(self.path, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+        self.by_hash[record["hash"]] = record
+        self.by_id[record["id"]] = record
+
+# worse statuses come later
+status_order = ["ok", "timeout", "crashed", "error", "false"]
+
+def compare(old, new, slowdown=2.0, min_time=0.5):
+    """
+    Compares two records of the same entry, returning a list of strings
+    describing regressions (a worse status, fewer True instances) and
+    slowdowns (more than slowdown times and min_time seconds slower).
+
+        >>> old = {"status": "ok", "True": 10, "time": 1.0}
+        >>> compare(old, {"status": "ok", "True": 10, "time": 1.1})
+        []
+        >>> compare(old, {"status": "ok", "True": 8, "time": 3.0})
+        ['True 10 -> 8', 'time 1.00 -> 3.00 s']
+        >>> compare(old, {"status": "timeout", "True": 0, "time": 60.0})
+        ['status ok -> timeout']
+    """
+    changes = []
+    if status_order.index(new["status"]) > status_order.index(old["status"]):
+        changes.append("status %s -> %s" % (old["status"], new["status"]))
+    elif new.get("True", 0) < old.get("True", 0):
+        changes.append("True %i -> %i" % (old.get("True", 0), new.get("True", 0)))
+    if new["status"] != "timeout" and new["time"] > max(slowdown * old["time"], old["time"] + min_time):
+        changes.append("time %.2f -> %.2f s" % (old["time"], new["time"]))
+    return changes
+
+def report(previous, records):
+    """
+    Prints the entries whose new record (in the list records) regressed
+    or became slower compared with the previous record (in the dict
+    previous, by ID). Returns the number of such entries.
+    """
+    n = 0
+    for record in records:
+        old = previous.get(record["id"])
+        if old is not None:
+            changes = compare(old, record)
+            if changes:
+                print("%s  %s" % (record["id"], ", ".join(changes)))
+                n += 1
+    return n
+
+def _child(conn, entry, num, memory):
+    if memory:
+        import resource
+        limit = memory * 2**20
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    try:
+        record = verify_entry(entry, num)
+    except BaseException as e:
+        record = {"status": "error", "error": "%s: %s" % (type(e).__name__, str(e)[:200])}
+    conn.send(record)
+    conn.close()
+
+def run(ids=None, path="verify.jsonl", jobs=None, timeout=60, memory=2000, num=100, force=False, verbose=True):
+    """
+    Verifies the entries with the given IDs (default: all entries) using
+    up to jobs processes (default: the number of CPUs), appending a record
+    for each entry to the JSONL file at path. Each entry may run for
+    timeout seconds and use memory megabytes (None for no limit).
+    Unless force=True, entries already having a record with the current
+    hash are skipped. Returns a dict with the number of entries of each
+    status (for the entries that were run).
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+    from . import formulas
+    formulas.load_all()
+    if ids is None:
+        ids = sorted(formulas.entries_dict)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    store = ResultStore(path)
+    previous = dict(store.by_id)
+    todo = []
+    for id in ids:
+        entry = formulas.entries_dict[id]
+        h = entry_hash(entry)
+        if not force and store.lookup(id, h) is not None:
+            continue
+        todo.append((id, entry, h))
+    if verbose:
+        print("verifying %i of %i entries" % (len(todo), len(ids)))
+    ctx = multiprocessing.get_context("fork")
+    counts = {}
+    records = []
+    running = {}
+    def finish(conn, record):
+        id, h, proc, start = running.pop(conn)
+        proc.join()
+        conn.close()
+        if record is None:
+            record = {"status": "crashed", "error": "exit code %s" % proc.exitcode}
+        record.setdefault("timeout", False)
+        record.setdefault("time", round(time.time() - start, 3))
+        record = dict(id=id, hash=h, **record)
+        store.add(record)
+        records.append(record)
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+        if verbose:
+            print("%s  %-8s %3i True %3i Unknown %3i False  %.2f s" % (id, record["status"],
+                record.get("True", 0), record.get("Unknown", 0), record.get("False", 0), record["time"]))
+            sys.stdout.flush()
+    pos = 0
+    try:
+        while pos < len(todo) or running:
+            while pos < len(todo) and len(running) < jobs:
+                id, entry, h = todo[pos]
+                pos += 1
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                proc = ctx.Process(target=_child, args=(child_conn, entry, num, memory))
+                proc.start()
+                child_conn.close()
+                running[parent_conn] = (id, h, proc, time.time())
+            deadline = min(start for (id, h, proc, start) in running.values()) + timeout
+            ready = wait(list(running), max(0, deadline - time.time()))
+            for conn in ready:
+                try:
+                    record = conn.recv()
+                except EOFError:
+                    record = None
+                finish(conn, record)
+            now = time.time()
+            for conn in list(running):
+                id, h, proc, start = running[conn]
+                if now - start >= timeout:
+                    proc.kill()
+                    finish(conn, {"status": "timeout", "timeout": True, "time": round(now - start, 3)})
+    finally:
+        for conn in list(running):
+            running[conn][2].kill()
+            running[conn][2].join()
+    if verbose:
+        print(", ".join("%i %s" % (counts[s], s) for s in sorted(counts)))
+        report(previous, records)
+    return counts
+
+class TestVerify:
+
+    def __init__(self):
+        pass
+
+    def run(self):
+        for method in dir(self):
+            if method.startswith("test_"):
+                print(method, "...", end=" ")
+                getattr(self, method)()
+                print("OK!")
+
+    def test_run(self):
+        import tempfile
+        from . import formulas
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        try:
+            counts = run(["590136", "a9e8df"], path, jobs=2, timeout=60, num=5, verbose=False)
+            assert sum(counts.values()) == 2
+            results = load_results(path)
+            assert set(results) == set(["590136", "a9e8df"])
+            for record in results.values():
+                assert record["hash"] == entry_hash(formulas.entries_dict[record["id"]])
+                assert record["timeout"] is False
+            # no Formula
+            assert results["a9e8df"]["Total"] == 0
+            # resumed runs skip entries that are done
+            assert run(["590136", "a9e8df"], path, verbose=False) == {}
+            previous = load_results(path)
+            counts = run(["590136"], path, timeout=0, verbose=False, force=True)
+            assert counts == {"timeout": 1}
+            store = ResultStore(path)
+            assert store.by_id["590136"]["timeout"]
+            assert store.lookup("590136", previous["590136"]["hash"])["timeout"]
+            if previous["590136"]["status"] == "ok":
+                assert compare(previous["590136"], store.by_id["590136"])
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Verify Fungrim formulas numerically.")
+    parser.add_argument("ids", nargs="*", help="entry IDs (default: all)")
+    parser.add_argument("--out", default="verify.jsonl", help="JSONL result file")
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=60, help="seconds per entry")
+    parser.add_argument("--memory", type=int, default=2000, help="megabytes per entry (0 for no limit)")
+    parser.add_argument("--num", type=int, default=100, help="instances per entry")
+    parser.add_argument("--force", action="store_true", help="run all entries, not only new or changed ones")
+    args = parser.parse_args()
+    run(args.ids or None, args.out, jobs=args.jobs, timeout=args.timeout, memory=args.memory,
+        num=args.num, force=args.force)